@@ -1,12 +1,32 @@
-"""벤치마크 서비스 화면 캡처 스크립트"""
+"""벤치마크 서비스 화면 캡처 스크립트
 
-from playwright.sync_api import sync_playwright
+타깃별 shots가 있으면 해당 영역만 바로 캡처 (clip 좌표 또는 CSS selector).
+풀페이지를 찍은 뒤 PIL로 다시 자르지 않으므로 렌더·인코딩이 1회로 끝남.
+shots가 없는 타깃만 풀페이지로 찍고, 용량이 큰 만큼 JPEG로 저장.
+타깃마다 별도 브라우저 컨텍스트를 열어 CONCURRENCY개씩 동시에 캡처.
+"""
+
+import asyncio
 from pathlib import Path
-import time
+
+from playwright.async_api import async_playwright
 
 SCREENSHOT_DIR = Path(__file__).parent / "screenshots"
 SCREENSHOT_DIR.mkdir(exist_ok=True)
+CROP_DIR = SCREENSHOT_DIR / "cropped"
+CROP_DIR.mkdir(exist_ok=True)
+
+VIEWPORT = {"width": 1440, "height": 900}
+CONCURRENCY = 4  # 동시 브라우저 컨텍스트 수
+
 
+def band(top, bottom):
+    """페이지 상단 기준 세로 구간 (top ~ bottom px) → 전체 너비 clip"""
+    return {"x": 0, "y": top, "width": VIEWPORT["width"], "height": bottom - top}
+
+
+# shots 항목: {"name", "desc"} + clip(페이지 좌표) 또는 selector(요소)
+#   둘 다 없으면 현재 뷰포트 캡처, dir 미지정 시 screenshots/cropped/ 에 저장
 TARGETS = [
     # Perplexity AI
     {"name": "01_perplexity_home", "url": "https://www.perplexity.ai/", "desc": "Perplexity 홈 - 검색창 + Discover 피드"},
@@ -14,26 +34,57 @@ TARGETS = [
 
     # Glean
     {"name": "03_glean_home", "url": "https://www.glean.com/", "desc": "Glean 메인 - 엔터프라이즈 AI 검색"},
-    {"name": "04_glean_extension", "url": "https://www.glean.com/browser-extension", "desc": "Glean 브라우저 확장 - 새 탭 페이지"},
-    {"name": "05_glean_product", "url": "https://www.glean.com/product/overview", "desc": "Glean 제품 개요"},
+    {"name": "04_glean_extension", "url": "https://www.glean.com/browser-extension", "desc": "Glean 브라우저 확장 - 새 탭 페이지", "shots": [
+        {"name": "glean_ext_hero", "clip": band(0, 900), "desc": "브라우저 확장 히어로"},
+        {"name": "glean_ext_ask", "clip": band(1100, 2600), "desc": "Ask in context, get instant answers"},
+        {"name": "glean_ext_discover", "clip": band(2800, 4200), "desc": "Discover what matters"},
+        {"name": "glean_ext_newtab", "clip": band(5200, 6800), "desc": "Your new tab, optimized for productivity"},
+    ]},
+    {"name": "05_glean_product", "url": "https://www.glean.com/product/overview", "desc": "Glean 제품 개요", "shots": [
+        {"name": "glean_product_hero", "clip": band(0, 1200), "desc": "제품 개요 히어로"},
+    ]},
 
     # Harvey AI
-    {"name": "06_harvey_home", "url": "https://www.harvey.ai/", "desc": "Harvey AI 메인 - 톤앤매너 참고"},
-    {"name": "07_harvey_assistant", "url": "https://www.harvey.ai/platform/assistant", "desc": "Harvey Assistant - Citation UI"},
+    {"name": "06_harvey_home", "url": "https://www.harvey.ai/", "desc": "Harvey AI 메인 - 톤앤매너 참고", "shots": [
+        {"name": "harvey_hero", "clip": band(0, 1200), "desc": "Professional Class AI 히어로"},
+        {"name": "harvey_products", "clip": band(1200, 3800), "desc": "Assistant + Knowledge + Vault 제품 소개"},
+    ]},
+    {"name": "07_harvey_assistant", "url": "https://www.harvey.ai/platform/assistant", "desc": "Harvey Assistant - Citation UI", "shots": [
+        {"name": "harvey_asst_query", "clip": band(0, 1500), "desc": "Assistant 쿼리 + Source 문서 UI"},
+        {"name": "harvey_asst_cards", "clip": band(1500, 2800), "desc": "문서 업로드, Follow-up, 워크플로우, 협업"},
+        {"name": "harvey_asst_citation", "clip": band(2800, 3900), "desc": "Source Assured 인용 하이라이트 + Multi Source"},
+        {"name": "harvey_asst_draft", "clip": band(3900, 5200), "desc": "Draft Mode redline + Word 연동"},
+    ]},
     {"name": "08_harvey_legal", "url": "https://www.harvey.ai/legal", "desc": "Harvey Legal 페이지"},
 
     # Shopify
-    {"name": "09_shopify_polaris", "url": "https://polaris.shopify.com/", "desc": "Shopify Polaris 디자인 시스템"},
+    {"name": "09_shopify_polaris", "url": "https://polaris.shopify.com/", "desc": "Shopify Polaris 디자인 시스템", "shots": [
+        {"name": "09_shopify_polaris", "dir": SCREENSHOT_DIR, "desc": "뷰포트 그대로"},
+    ]},
 
     # Intercom
-    {"name": "10_intercom_messenger", "url": "https://www.intercom.com/blog/product-thinking-behind-messenger-home/", "desc": "Intercom Messenger Home 설계"},
-    {"name": "11_intercom_inbox", "url": "https://www.intercom.com/customer-service-platform/inbox", "desc": "Intercom AI Inbox"},
+    {"name": "10_intercom_messenger", "url": "https://www.intercom.com/blog/product-thinking-behind-messenger-home/", "desc": "Intercom Messenger Home 설계", "shots": [
+        {"name": "intercom_messenger_top", "clip": band(0, 2000), "desc": "Messenger Home 설계 블로그 상단"},
+    ]},
+    {"name": "11_intercom_inbox", "url": "https://www.intercom.com/customer-service-platform/inbox", "desc": "Intercom AI Inbox", "shots": [
+        {"name": "intercom_inbox_hero", "clip": band(0, 1200), "desc": "AI Inbox 히어로"},
+        {"name": "intercom_inbox_features", "clip": band(1200, 3000), "desc": "Inbox 주요 기능 소개"},
+    ]},
 
     # 컴플라이언스/헬스케어 대시보드
-    {"name": "12_softr_compliance", "url": "https://softr.io/create/compliance-tracker-dashboard", "desc": "Softr 컴플라이언스 트래커"},
-    {"name": "13_healthcare_ui", "url": "https://www.koruux.com/50-examples-of-healthcare-UI/", "desc": "헬스케어 UI 50선"},
-    {"name": "14_dribbble_health", "url": "https://dribbble.com/tags/health-saas", "desc": "Dribbble 헬스케어 SaaS 디자인"},
-    {"name": "15_behance_dashboard", "url": "https://www.behance.net/search/projects/saas%20dashboard", "desc": "Behance SaaS 대시보드"},
+    {"name": "12_softr_compliance", "url": "https://softr.io/create/compliance-tracker-dashboard", "desc": "Softr 컴플라이언스 트래커", "shots": [
+        {"name": "softr_hero", "clip": band(0, 1500), "desc": "Compliance Tracker 히어로"},
+        {"name": "softr_dashboard", "clip": band(1500, 3500), "desc": "대시보드 미리보기"},
+    ]},
+    {"name": "13_healthcare_ui", "url": "https://www.koruux.com/50-examples-of-healthcare-UI/", "desc": "헬스케어 UI 50선", "shots": [
+        {"name": "healthcare_ui_top", "clip": band(0, 3000), "desc": "헬스케어 UI 상단 사례"},
+    ]},
+    {"name": "14_dribbble_health", "url": "https://dribbble.com/tags/health-saas", "desc": "Dribbble 헬스케어 SaaS 디자인", "shots": [
+        {"name": "dribbble_health_gallery", "clip": band(0, 1800), "desc": "Dribbble 헬스케어 SaaS 갤러리"},
+    ]},
+    {"name": "15_behance_dashboard", "url": "https://www.behance.net/search/projects/saas%20dashboard", "desc": "Behance SaaS 대시보드", "shots": [
+        {"name": "behance_dashboard_gallery", "clip": band(0, 2000), "desc": "Behance SaaS 대시보드 갤러리"},
+    ]},
 
     # 가이드 아티클
     {"name": "16_uxdesign_b2b", "url": "https://uxdesign.cc/design-thoughtful-dashboards-for-b2b-saas-ff484385960d", "desc": "B2B SaaS 대시보드 설계 가이드"},
@@ -41,54 +92,82 @@ TARGETS = [
 ]
 
 
-def capture_all():
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(
-            viewport={"width": 1440, "height": 900},
-            locale="ko-KR",
-        )
-        page = context.new_page()
-
-        for i, target in enumerate(TARGETS):
-            name = target["name"]
-            url = target["url"]
-            desc = target["desc"]
-            out = SCREENSHOT_DIR / f"{name}.png"
+# 쿠키/팝업 닫기 버튼
+POPUP_SELECTORS = [
+    "button:has-text('Accept')",
+    "button:has-text('Got it')",
+    "button:has-text('Close')",
+    "button:has-text('Dismiss')",
+    "[aria-label='Close']",
+    "[data-testid='close-button']",
+]
 
-            print(f"[{i+1}/{len(TARGETS)}] {desc}")
-            print(f"  URL: {url}")
 
+async def capture_shots(page, target):
+    """타깃 영역별 캡처. shots가 없으면 풀페이지 JPEG."""
+    shots = target.get("shots")
+    if not shots:
+        out = SCREENSHOT_DIR / f"{target['name']}.jpg"
+        await page.screenshot(path=str(out), full_page=True, type="jpeg", quality=85)
+        return [f"{out.name} OK (full page)"]
+
+    done = []
+    for shot in shots:
+        out = Path(shot.get("dir", CROP_DIR)) / f"{shot['name']}.png"
+        if shot.get("selector"):
+            await page.locator(shot["selector"]).first.screenshot(path=str(out))
+        elif shot.get("clip"):
+            # full_page=True: 뷰포트 밖 좌표도 clip 영역만 렌더
+            await page.screenshot(path=str(out), full_page=True, clip=shot["clip"])
+        else:
+            await page.screenshot(path=str(out))
+        done.append(f"{out.name} OK ({shot.get('desc', '')})")
+    return done
+
+
+async def capture_one(browser, sem, i, target):
+    """타깃 1개 — 독립 컨텍스트(쿠키/상태 분리)에서 캡처"""
+    async with sem:
+        context = await browser.new_context(viewport=VIEWPORT, locale="ko-KR")
+        try:
+            page = await context.new_page()
+            await page.goto(target["url"], timeout=30000, wait_until="networkidle")
+
+            for sel in POPUP_SELECTORS:
+                try:
+                    await page.click(sel, timeout=1000)
+                except Exception:
+                    pass
+            # 팝업 닫힘·지연 로딩 후 렌더링 안정화 대기
             try:
-                page.goto(url, timeout=30000, wait_until="networkidle")
-                time.sleep(2)  # 렌더링 대기
-
-                # 쿠키/팝업 닫기 시도
-                for sel in [
-                    "button:has-text('Accept')",
-                    "button:has-text('Got it')",
-                    "button:has-text('Close')",
-                    "button:has-text('Dismiss')",
-                    "[aria-label='Close']",
-                    "[data-testid='close-button']",
-                ]:
-                    try:
-                        page.click(sel, timeout=1000)
-                        time.sleep(0.5)
-                    except:
-                        pass
-
-                # 풀페이지 캡처
-                page.screenshot(path=str(out), full_page=True)
-                print(f"  -> {out.name} OK")
-
-            except Exception as e:
-                print(f"  -> FAIL: {e}")
-
-        browser.close()
+                await page.wait_for_load_state("networkidle", timeout=10000)
+            except Exception:
+                pass
+
+            lines = await capture_shots(page, target)
+        except Exception as e:
+            lines = [f"FAIL: {e}"]
+        finally:
+            await context.close()
+
+    # 동시 실행이므로 타깃별 로그를 한 번에 출력
+    print(f"[{i+1}/{len(TARGETS)}] {target['desc']}")
+    print(f"  URL: {target['url']}")
+    for line in lines:
+        print(f"  -> {line}")
+
+
+async def capture_all():
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        sem = asyncio.Semaphore(CONCURRENCY)
+        await asyncio.gather(*(
+            capture_one(browser, sem, i, target) for i, target in enumerate(TARGETS)
+        ))
+        await browser.close()
 
     print(f"\n완료! {SCREENSHOT_DIR} 확인하세요.")
 
 
 if __name__ == "__main__":
-    capture_all()
+    asyncio.run(capture_all())
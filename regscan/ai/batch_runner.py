@@ -0,0 +1,204 @@
+"""OpenAI Batch API 실행기 — 야간 일괄 실행용 (50% 할인, ≤24h 처리)
+
+실시간 응답이 필요 없는 야간 파이프라인에서 chat.completions 요청을 모아
+JSONL 하나로 제출하고, 완료 후 결과를 custom_id별로 각 요청자에게 돌려줍니다.
+
+Usage:
+    collector = BatchCollector(client)
+    engine.batch = collector
+    response = await engine.analyze_impact(drug)   # 다른 요청과 함께 제출됨
+
+결과를 기다리지 않는 제출/수거(create_batch → fetch_batch_results)는
+스케줄러 주기 작업 등에서 별도로 사용할 수 있습니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from types import SimpleNamespace
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+_ENDPOINT = "/v1/chat/completions"
+_TERMINAL_FAILED = ("failed", "expired", "cancelled")
+
+
+def _to_namespace(value: Any) -> Any:
+    """응답 dict → 속성 접근 객체 (chat.completions.create 응답과 동일하게 사용)"""
+    if isinstance(value, dict):
+        return SimpleNamespace(**{k: _to_namespace(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return [_to_namespace(v) for v in value]
+    return value
+
+
+def _request_body(kwargs: dict[str, Any]) -> dict[str, Any]:
+    """SDK 호출 인자 → 요청 body (extra_body는 body 최상위로 병합)"""
+    body = {k: v for k, v in kwargs.items() if k != "extra_body"}
+    body.update(kwargs.get("extra_body") or {})
+    return body
+
+
+async def create_batch(
+    client,
+    requests: dict[str, dict[str, Any]],
+    completion_window: str = "24h",
+):
+    """custom_id별 요청 body → JSONL 업로드 → batch 생성 (batch 객체 반환)"""
+    lines = [
+        json.dumps(
+            {
+                "custom_id": cid,
+                "method": "POST",
+                "url": _ENDPOINT,
+                "body": _request_body(body),
+            },
+            ensure_ascii=False, default=str,
+        )
+        for cid, body in requests.items()
+    ]
+    payload = ("\n".join(lines) + "\n").encode("utf-8")
+
+    input_file = await client.files.create(
+        file=("regscan_batch.jsonl", payload), purpose="batch",
+    )
+    batch = await client.batches.create(
+        input_file_id=input_file.id,
+        endpoint=_ENDPOINT,
+        completion_window=completion_window,
+    )
+    logger.info("Batch 제출: %s (%d건)", batch.id, len(requests))
+    return batch
+
+
+def is_batch_failed(batch) -> bool:
+    """실패·만료·취소로 끝난 batch인지"""
+    return batch.status in _TERMINAL_FAILED
+
+
+async def _read_jsonl(client, file_id: str) -> list[dict]:
+    """batch 결과 파일(JSONL) → 행 목록"""
+    content = await client.files.content(file_id)
+    return [json.loads(line) for line in content.text.splitlines() if line.strip()]
+
+
+def _row_error(row: dict) -> Any:
+    """실패 행의 오류 내용 (batch 수준 error 또는 응답 body의 error)"""
+    response = row.get("response") or {}
+    return row.get("error") or (response.get("body") or {}).get("error")
+
+
+async def fetch_batch_results(client, batch) -> dict[str, dict]:
+    """완료된 batch 출력 파일 → custom_id별 응답 body (실패 건 제외)
+
+    실패 건은 error_file_id 파일에 따로 담기고, 전 건 실패면 output_file_id는
+    None이다. 실패 건은 custom_id별로 경고 로그를 남긴다.
+    """
+    results: dict[str, dict] = {}
+    if batch.output_file_id:
+        for row in await _read_jsonl(client, batch.output_file_id):
+            response = row.get("response") or {}
+            if row.get("error") or response.get("status_code", 200) != 200:
+                logger.warning("Batch 요청 실패: %s — %s", row.get("custom_id"), _row_error(row))
+                continue
+            results[row["custom_id"]] = response.get("body", {})
+
+    if batch.error_file_id:
+        failed = await _read_jsonl(client, batch.error_file_id)
+        for row in failed:
+            logger.warning("Batch 요청 실패: %s — %s", row.get("custom_id"), _row_error(row))
+        logger.warning(
+            "Batch %s 실패 %d건 (error_file_id=%s)", batch.id, len(failed), batch.error_file_id,
+        )
+    return results
+
+
+class BatchCollector:
+    """chat.completions 요청을 모아 OpenAI Batch API로 일괄 제출
+
+    submit()은 요청을 대기열에 넣고 Future를 반환한다. 마지막 요청 이후
+    linger초 동안 새 요청이 없으면 대기열 전체를 하나의 batch로 제출하고,
+    완료되면 custom_id별 Future를 resolve한다.
+    """
+
+    def __init__(
+        self,
+        client,
+        linger: float = 1.0,
+        poll_interval: float = 30.0,
+        max_poll_interval: float = 600.0,
+        completion_window: str = "24h",
+    ):
+        self.client = client
+        self.linger = linger
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.completion_window = completion_window
+        self._pending: dict[str, tuple[dict[str, Any], asyncio.Future]] = {}
+        self._seq = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flushes: set[asyncio.Task] = set()
+
+    async def submit(self, body: dict[str, Any], label: str = "req") -> Any:
+        """요청 1건을 대기열에 추가하고 batch 결과(응답 객체)를 기다림"""
+        loop = asyncio.get_running_loop()
+        self._seq += 1
+        custom_id = f"{label}-{self._seq}"
+        future: asyncio.Future = loop.create_future()
+        self._pending[custom_id] = (body, future)
+
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = loop.call_later(self.linger, self._schedule_flush)
+        return await future
+
+    def _schedule_flush(self) -> None:
+        self._timer = None
+        task = asyncio.ensure_future(self.flush())
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def flush(self) -> int:
+        """대기 중인 요청을 하나의 batch로 제출. 제출 건수 반환."""
+        if not self._pending:
+            return 0
+        pending, self._pending = self._pending, {}
+
+        try:
+            results = await self._run_batch(
+                {cid: body for cid, (body, _) in pending.items()}
+            )
+        except Exception as e:
+            logger.error("Batch 실행 실패 (%d건): %s", len(pending), e)
+            for _, future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+            return len(pending)
+
+        for cid, (_, future) in pending.items():
+            if future.done():
+                continue
+            if cid in results:
+                future.set_result(_to_namespace(results[cid]))
+            else:
+                future.set_exception(RuntimeError(f"Batch 결과 누락: {cid}"))
+        return len(pending)
+
+    async def _run_batch(self, requests: dict[str, dict[str, Any]]) -> dict[str, dict]:
+        """JSONL 업로드 → batch 생성 → 완료 대기 → custom_id별 응답 body"""
+        batch = await create_batch(self.client, requests, self.completion_window)
+
+        delay = self.poll_interval
+        while batch.status != "completed":
+            if is_batch_failed(batch):
+                raise RuntimeError(f"Batch {batch.id} 종료 상태: {batch.status}")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_poll_interval)
+            batch = await self.client.batches.retrieve(batch.id)
+
+        results = await fetch_batch_results(self.client, batch)
+        logger.info("Batch 완료: %s (%d/%d건)", batch.id, len(results), len(requests))
+        return results
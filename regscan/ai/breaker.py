@@ -0,0 +1,149 @@
+"""AI API 재시도 + 회로 차단기 (OpenAI / Gemini 공용)
+
+일시적 오류(429, 5xx, 연결 오류)는 지수 백오프(full jitter)로 재시도하고,
+재시도까지 모두 실패한 호출이 연속 AI_BREAKER_FAIL_MAX회 쌓이면 해당
+제공자 회로를 열어 AI_BREAKER_RESET_SECONDS 동안 즉시 실패시킵니다.
+회로가 열린 동안 호출자는 PDF 다운로드·프롬프트 조립 없이 fallback 합니다.
+
+Usage:
+    if get_breaker("openai").is_open:
+        return fallback
+    response = await call_with_retry("openai", client.chat.completions.create, **kwargs)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from regscan.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_RETRY_MIN_DELAY = 1.0  # 초
+_RETRY_MAX_DELAY = 30.0
+
+# 상태 코드가 없는 예외 중 일시적 오류로 보는 클래스명
+# (openai / httpx / google.api_core — 선택 의존성이므로 이름으로 판별)
+_TRANSIENT_NAMES = frozenset({
+    "APIConnectionError", "APITimeoutError", "RateLimitError", "InternalServerError",
+    "ConnectError", "ReadTimeout", "ConnectTimeout", "RemoteProtocolError",
+    "ResourceExhausted", "ServiceUnavailable", "DeadlineExceeded",
+    "TimeoutError",
+})
+
+
+class CircuitOpenError(RuntimeError):
+    """회로가 열려 호출이 차단됨"""
+
+
+class CircuitBreaker:
+    """제공자별 연속 실패 카운터
+
+    closed → (연속 fail_max회 실패) → open → (reset_timeout 경과) → half-open
+    half-open에서 1회 성공하면 closed, 실패하면 다시 open.
+    """
+
+    def __init__(self, name: str, fail_max: int = 3, reset_timeout: float = 300.0):
+        self.name = name
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+
+    @property
+    def is_open(self) -> bool:
+        if self.opened_at is None:
+            return False
+        return time.monotonic() - self.opened_at < self.reset_timeout
+
+    def record_success(self) -> None:
+        if self.opened_at is not None:
+            logger.info("[%s] 회로 복구", self.name)
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.failures >= self.fail_max:
+            if not self.is_open:
+                logger.warning(
+                    "[%s] 연속 %d회 실패 — 회로 개방 (%.0f초)",
+                    self.name, self.failures, self.reset_timeout,
+                )
+            self.opened_at = time.monotonic()
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+
+
+def get_breaker(provider: str) -> CircuitBreaker:
+    """제공자("openai", "gemini")별 회로 차단기"""
+    breaker = _breakers.get(provider)
+    if breaker is None:
+        breaker = _breakers[provider] = CircuitBreaker(
+            provider,
+            fail_max=settings.AI_BREAKER_FAIL_MAX,
+            reset_timeout=settings.AI_BREAKER_RESET_SECONDS,
+        )
+    return breaker
+
+
+def is_transient(exc: BaseException) -> bool:
+    """재시도할 가치가 있는 일시적 오류인지 (429 / 5xx / 연결·타임아웃)"""
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    if status is None and isinstance(getattr(exc, "code", None), int):
+        status = exc.code  # google.api_core.exceptions
+    if isinstance(status, int):
+        return status == 429 or status >= 500
+    return type(exc).__name__ in _TRANSIENT_NAMES
+
+
+async def call_with_retry(
+    provider: str,
+    func: Callable[..., Awaitable[T]],
+    *args: Any,
+    max_attempts: Optional[int] = None,
+    **kwargs: Any,
+) -> T:
+    """일시적 오류는 지수 백오프로 재시도, 최종 결과를 회로 차단기에 기록
+
+    Raises:
+        CircuitOpenError: 회로가 열려 있음
+        Exception: 비일시적 오류(즉시) 또는 재시도 소진 시 마지막 오류
+    """
+    breaker = get_breaker(provider)
+    if breaker.is_open:
+        raise CircuitOpenError(f"{provider} 회로 개방 중")
+
+    attempts = max(1, max_attempts or settings.AI_RETRY_MAX_ATTEMPTS)
+    last_error: Optional[Exception] = None
+    for attempt in range(attempts):
+        try:
+            result = await func(*args, **kwargs)
+        except Exception as e:
+            if not is_transient(e):
+                raise
+            last_error = e
+            if attempt < attempts - 1:
+                delay = random.uniform(
+                    0, min(_RETRY_MAX_DELAY, _RETRY_MIN_DELAY * (2 ** attempt)),
+                )
+                logger.warning(
+                    "[%s] 일시적 오류 (%d/%d), %.1f초 후 재시도: %s",
+                    provider, attempt + 1, attempts, delay, e,
+                )
+                await asyncio.sleep(delay)
+            continue
+        breaker.record_success()
+        return result
+
+    breaker.record_failure()
+    raise last_error
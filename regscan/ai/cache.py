@@ -0,0 +1,200 @@
+"""AI 결과 영속 캐시 — SQLite 기반 key/value 저장소
+
+프로세스 재시작 후에도 Gemini/LLM 호출 결과를 재사용하기 위한 디스크 캐시.
+값은 JSON 직렬화하여 저장하며, 항목별 TTL(만료 시각)을 지원합니다.
+content_key()로 입력 데이터의 정규화 해시를, prompt_key()로 렌더링된 프롬프트의
+해시를 만들어 동일 입력 재호출을 건너뜁니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+from regscan.config import settings
+from regscan.utils.serialization import dumps_bytes
+
+logger = logging.getLogger(__name__)
+
+_instances: dict[Path, "DiskCache"] = {}
+_instances_lock = threading.Lock()
+
+
+def get_cache(name: str) -> "DiskCache":
+    """settings.CACHE_DIR/name 캐시 (경로별 1개 인스턴스 공유)"""
+    directory = Path(settings.CACHE_DIR) / name
+    with _instances_lock:
+        cache = _instances.get(directory)
+        if cache is None:
+            cache = _instances[directory] = DiskCache(directory)
+        return cache
+
+
+def content_key(*parts: Any) -> str:
+    """입력 데이터의 정규화 JSON(BLAKE2b) 해시 — 키 순서와 무관하게 동일"""
+    return hashlib.blake2b(dumps_bytes(parts, sort_keys=True), digest_size=20).hexdigest()
+
+
+def prompt_key(model: str, *messages: str) -> str:
+    """모델 + 렌더링된 프롬프트(system, user, ...)의 BLAKE2b 해시"""
+    h = hashlib.blake2b(model.encode("utf-8"), digest_size=20)
+    for message in messages:
+        h.update(b"\0")
+        h.update(message.encode("utf-8"))
+    return h.hexdigest()
+
+
+# 진행 중인 get_or_set 호출 — 동시 동일 키 요청은 한 번만 실행
+_inflight: dict[str, asyncio.Future] = {}
+
+
+async def get_or_set(
+    key: str,
+    factory: Callable[[], Awaitable[Any]],
+    name: str = "llm_responses",
+) -> Any:
+    """캐시 히트면 저장값, 아니면 factory() 실행 후 저장 (AI_CACHE_TTL_DAYS)
+
+    factory가 예외를 던지면 저장하지 않고 그대로 전파한다.
+    ENABLE_AI_CACHE=false면 항상 factory()를 호출한다.
+    """
+    if not settings.ENABLE_AI_CACHE:
+        return await factory()
+
+    cache = get_cache(name)
+    hit = cache.get(key)
+    if hit is not None:
+        return hit
+
+    pending = _inflight.get(key)
+    if pending is not None and pending.get_loop() is asyncio.get_running_loop():
+        return await asyncio.shield(pending)
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        value = await factory()
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # 대기자 없을 때 "never retrieved" 경고 방지
+        raise
+    finally:
+        if _inflight.get(key) is future:
+            del _inflight[key]
+    cache.set(key, value, ttl=settings.AI_CACHE_TTL_DAYS * 86400)
+    future.set_result(value)
+    return value
+
+
+def get_result(key: str) -> Optional[dict]:
+    """AI 결과 캐시 조회 (ENABLE_AI_CACHE=false면 항상 None). 히트 시 cached=True."""
+    if not settings.ENABLE_AI_CACHE:
+        return None
+    hit = get_cache("ai_results").get(key)
+    if not isinstance(hit, dict):
+        return None
+    return {**hit, "cached": True}
+
+
+def put_result(key: str, result: dict) -> None:
+    """AI 결과 캐시 저장 (AI_CACHE_TTL_DAYS 후 만료)"""
+    if settings.ENABLE_AI_CACHE:
+        get_cache("ai_results").set(key, result, ttl=settings.AI_CACHE_TTL_DAYS * 86400)
+
+
+class DiskCache:
+    """SQLite 파일 하나를 사용하는 간단한 영속 캐시
+
+    Usage:
+        cache = DiskCache(settings.CACHE_DIR / "gemini_pdf")
+        cache.set("key", {"a": 1}, ttl=86400)
+        cache.get("key")  # → {"a": 1}
+    """
+
+    def __init__(self, directory: Path | str):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.directory / "cache.db"),
+            check_same_thread=False,
+            isolation_level=None,  # autocommit
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " expires_at REAL"
+            ")"
+        )
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """캐시 조회. 없거나 만료되었으면 default 반환."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return default
+            value, expires_at = row
+            if expires_at is not None and expires_at < time.time():
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                return default
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            logger.debug("캐시 값 디코딩 실패: %s", key)
+            return default
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """캐시 저장. ttl(초)이 None이면 만료 없음."""
+        expires_at = time.time() + ttl if ttl else None
+        payload = json.dumps(value, ensure_ascii=False, default=str)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, payload, expires_at),
+            )
+
+    def delete(self, key: str) -> bool:
+        """항목 삭제. 삭제 여부 반환."""
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+            return cur.rowcount > 0
+
+    def clear(self) -> int:
+        """전체 초기화. 삭제된 항목 수 반환."""
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM cache")
+            return cur.rowcount
+
+    def keys(self) -> list[str]:
+        """만료되지 않은 키 목록"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key FROM cache WHERE expires_at IS NULL OR expires_at >= ?",
+                (time.time(),),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -1,21 +1,247 @@
 """Gemini PDF 파서 — bioRxiv 논문 PDF를 구조화 데이터로 변환
 
 핫이슈 약물(score>=60) 논문만 선택적으로 파싱하여 비용 절감.
-동일 PDF 재파싱 방지를 위한 캐싱 지원.
+동일 PDF 재파싱 방지를 위해 PDF 내용 해시 기반 디스크 캐시 사용
+(재시작·미러 URL 간에도 결과 재사용).
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import logging
-from typing import Any, Optional
+import re
+from typing import Any, Callable, Optional
+
+import httpx
+import orjson
 
 from regscan.config import settings
+from regscan.ai.breaker import call_with_retry, get_breaker
+from regscan.ai.cache import DiskCache
 
 logger = logging.getLogger(__name__)
 
-# 메모리 캐시 (DOI → 파싱 결과)
-_parse_cache: dict[str, dict] = {}
+# 디스크 캐시 (PDF 내용 해시 → 파싱 결과, URL → 내용 해시 보조 인덱스)
+_parse_cache: Optional[DiskCache] = None
+
+
+def _get_cache() -> DiskCache:
+    """파싱 캐시 lazy init"""
+    global _parse_cache
+    if _parse_cache is None:
+        _parse_cache = DiskCache(settings.CACHE_DIR / "gemini_pdf")
+    return _parse_cache
+
+
+# 캐시 키 해시 — xxh3(URL)/BLAKE3(PDF 내용, SIMD)가 있으면 사용, 없으면 stdlib BLAKE2b.
+# 환경별로 키가 섞이지 않도록 알고리즘 태그를 키에 포함.
+try:
+    import xxhash
+
+    def _url_digest(data: bytes) -> str:
+        return "x3:" + xxhash.xxh3_128_hexdigest(data)
+except ImportError:
+    def _url_digest(data: bytes) -> str:
+        return "b2:" + hashlib.blake2b(data, digest_size=16).hexdigest()
+
+try:
+    import blake3
+
+    def _bytes_digest(data: bytes) -> str:
+        return "b3:" + blake3.blake3(data).hexdigest()
+except ImportError:
+    def _bytes_digest(data: bytes) -> str:
+        return "b2:" + hashlib.blake2b(data, digest_size=32).hexdigest()
+
+
+def _url_key(pdf_url: str) -> str:
+    return "url:" + _url_digest(pdf_url.encode())
+
+
+def _content_key(pdf_bytes: bytes) -> str:
+    return "pdf:" + _bytes_digest(pdf_bytes)
+
+
+def _legacy_url_key(pdf_url: str) -> str:
+    """이전 형식(SHA-256) URL 키 — 지연 마이그레이션용"""
+    return "url:" + hashlib.sha256(pdf_url.encode()).hexdigest()
+
+
+def _legacy_content_key(pdf_bytes: bytes) -> str:
+    """이전 형식(SHA-256) 내용 키 — 지연 마이그레이션용"""
+    return "pdf:" + hashlib.sha256(pdf_bytes).hexdigest()
+
+
+def _get_migrating(
+    cache: DiskCache, key: str, legacy_key: Callable[[], str], ttl: float,
+) -> Any:
+    """새 키 조회 → 없으면 이전 형식 키 조회 후 새 키로 옮김
+
+    legacy_key는 새 키가 없을 때만 호출 — 히트 경로에서 SHA-256 재해시 생략.
+    """
+    value = cache.get(key)
+    if value is None:
+        old_key = legacy_key()
+        value = cache.get(old_key)
+        if value is not None:
+            cache.set(key, value, ttl=ttl)
+            cache.delete(old_key)
+    return value
+
+
+def _lookup_by_url(cache: DiskCache, pdf_url: str, url_key: str, ttl: float) -> Optional[dict]:
+    """URL → 내용 해시 → 결과 2단 조회 (동기 sqlite — 스레드에서 호출)"""
+    content_key = _get_migrating(cache, url_key, lambda: _legacy_url_key(pdf_url), ttl)
+    if not content_key:
+        return None
+    return cache.get(content_key)
+
+
+def _lookup_by_content(
+    cache: DiskCache, pdf_bytes: bytes, content_key: str, url_key: str, ttl: float,
+) -> Optional[dict]:
+    """내용 해시로 결과 조회, 히트 시 URL → 내용 해시 연결 기록 (스레드에서 호출)"""
+    entry = _get_migrating(cache, content_key, lambda: _legacy_content_key(pdf_bytes), ttl)
+    if entry is not None:
+        cache.set(url_key, content_key, ttl=ttl)
+    return entry
+
+
+def _store_result(
+    cache: DiskCache, content_key: str, url_key: str, result: dict, ttl: float,
+) -> None:
+    """파싱 결과와 URL 연결 저장 (스레드에서 호출)"""
+    cache.set(content_key, result, ttl=ttl)
+    cache.set(url_key, content_key, ttl=ttl)
+
+
+def _cached_result(entry: dict) -> dict:
+    result = dict(entry)
+    result["cached"] = True
+    return result
+
+
+# ```json {...} ``` / ~~~json [...] ~~~ 코드 블록
+_JSON_BLOCK = re.compile(
+    r"(?:```|~~~)[ \t]*(?:json)?\s*(\{.*?\}|\[.*?\])\s*(?:```|~~~)",
+    re.DOTALL | re.IGNORECASE,
+)
+# Gemini가 가끔 붙이는 trailing comma
+_TRAILING_COMMA = re.compile(r",\s*([}\]])")
+
+
+def _extract_json(text: str) -> Any:
+    """Gemini 응답에서 JSON 추출. 실패 시 빈 dict."""
+    m = _JSON_BLOCK.search(text)
+    json_str = m.group(1) if m else text.strip()
+    try:
+        return orjson.loads(json_str)
+    except orjson.JSONDecodeError:
+        pass
+    try:
+        return orjson.loads(_TRAILING_COMMA.sub(r"\1", json_str))
+    except orjson.JSONDecodeError:
+        logger.debug("Gemini JSON 파싱 실패 — 원본 텍스트 반환")
+        return {}
+
+
+# born-digital 판정 기준: 페이지당 최소 글자 수, 출력 가능 문자 비율
+_MIN_CHARS_PER_PAGE = 100
+_MIN_PRINTABLE_RATIO = 0.9
+
+
+def extract_pdf_text(pdf_bytes: bytes) -> str:
+    """PyMuPDF로 PDF 내장 텍스트 추출
+
+    스캔 PDF(텍스트 없음/깨짐)로 판단되거나 PyMuPDF 미설치 시 빈 문자열 반환
+    → 호출측에서 Gemini vision 경로로 fallback.
+    """
+    try:
+        import fitz  # PyMuPDF
+    except ImportError:
+        logger.debug("pymupdf 미설치 — 로컬 텍스트 추출 건너뜀")
+        return ""
+
+    try:
+        with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+            page_count = doc.page_count
+            text = "\n".join(page.get_text("text") for page in doc)
+    except Exception as e:
+        logger.debug("PDF 텍스트 추출 실패: %s", e)
+        return ""
+
+    stripped = text.strip()
+    if not stripped or len(stripped) < _MIN_CHARS_PER_PAGE * max(page_count, 1):
+        return ""
+    printable = sum(1 for ch in stripped if ch.isprintable() or ch.isspace())
+    if printable / len(stripped) < _MIN_PRINTABLE_RATIO:
+        return ""
+    return text
+
+
+class PDFTooLargeError(Exception):
+    """PDF 크기가 PDF_MAX_BYTES를 초과"""
+
+
+# 공유 HTTP 클라이언트 — 호출마다 TLS 핸드셰이크/커넥션 풀 재생성 방지.
+# AsyncClient는 생성된 이벤트 루프에 묶이므로 루프가 바뀌면 새로 만든다.
+_http: Optional[httpx.AsyncClient] = None
+_http_loop: Optional[asyncio.AbstractEventLoop] = None
+
+_DOWNLOAD_CHUNK = 64 * 1024
+
+
+def _retire_http() -> None:
+    """이전 루프의 클라이언트 종료 — 그 루프가 아직 살아 있으면 거기서 aclose 예약
+
+    이미 닫힌 루프에 묶인 커넥션은 그 루프로 정리할 수 없으므로 GC에 맡긴다.
+    """
+    old, old_loop = _http, _http_loop
+    if old is None or old.is_closed or old_loop is None or old_loop.is_closed():
+        return
+    old_loop.call_soon_threadsafe(lambda: old_loop.create_task(old.aclose()))
+
+
+def _get_http() -> httpx.AsyncClient:
+    global _http, _http_loop
+    loop = asyncio.get_running_loop()
+    if _http is None or _http.is_closed or _http_loop is not loop:
+        _retire_http()
+        _http = httpx.AsyncClient(
+            timeout=60.0,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+        )
+        _http_loop = loop
+    return _http
+
+
+async def close_http_client() -> None:
+    """공유 HTTP 클라이언트 종료 (앱 lifespan 종료 시 호출)"""
+    global _http, _http_loop
+    if _http is not None and not _http.is_closed:
+        await _http.aclose()
+    _http = None
+    _http_loop = None
+
+
+async def download_pdf(pdf_url: str, max_bytes: Optional[int] = None) -> bytes:
+    """PDF 스트리밍 다운로드 — max_bytes 초과 시 PDFTooLargeError로 조기 중단"""
+    max_bytes = max_bytes or settings.PDF_MAX_BYTES
+    async with _get_http().stream("GET", pdf_url) as resp:
+        resp.raise_for_status()
+        declared = int(resp.headers.get("content-length") or 0)
+        if declared > max_bytes:
+            raise PDFTooLargeError(f"{declared} bytes > {max_bytes}")
+
+        buf = bytearray()
+        async for chunk in resp.aiter_bytes(_DOWNLOAD_CHUNK):
+            buf.extend(chunk)
+            if len(buf) > max_bytes:
+                raise PDFTooLargeError(f"> {max_bytes} bytes")
+    return bytes(buf)
+
 
 DEFAULT_EXTRACTION_PROMPT = """이 의약품 관련 학술 논문 PDF를 분석하세요.
 
@@ -77,28 +303,40 @@ class GeminiParser:
         Returns:
             {"full_text": ..., "facts": {...}, "cached": bool}
         """
-        # 캐시 확인
-        cache_key = hashlib.md5(pdf_url.encode()).hexdigest()
-        if cache_key in _parse_cache:
+        cache = _get_cache()
+        ttl = settings.GEMINI_CACHE_TTL_DAYS * 86400
+
+        # 캐시 확인 (URL → 내용 해시 → 결과) — 재다운로드 없이 단축
+        # DiskCache는 동기 sqlite — 이벤트 루프를 막지 않도록 스레드에서
+        url_key = _url_key(pdf_url)
+        entry = await asyncio.to_thread(_lookup_by_url, cache, pdf_url, url_key, ttl)
+        if entry is not None:
             logger.debug("Gemini 캐시 히트: %s", pdf_url)
-            result = _parse_cache[cache_key].copy()
-            result["cached"] = True
-            return result
+            return _cached_result(entry)
 
         if not self.api_key:
             logger.warning("GEMINI_API_KEY 미설정 — PDF 파싱 건너뜀")
             return {"full_text": "", "facts": {}, "cached": False, "error": "no_api_key"}
 
+        # Gemini 회로 개방 중이면 PDF 다운로드부터 생략
+        if get_breaker("gemini").is_open:
+            logger.warning("Gemini 회로 개방 — PDF 파싱 건너뜀: %s", pdf_url)
+            return {"full_text": "", "facts": {}, "cached": False, "error": "circuit_open"}
+
         prompt = prompt or DEFAULT_EXTRACTION_PROMPT
 
         try:
-            import httpx
+            # PDF 다운로드 (공유 클라이언트, 크기 상한)
+            pdf_bytes = await download_pdf(pdf_url)
 
-            # PDF 다운로드
-            async with httpx.AsyncClient(timeout=60.0) as http_client:
-                resp = await http_client.get(pdf_url)
-                resp.raise_for_status()
-                pdf_bytes = resp.content
+            # 내용 해시 캐시 확인 — 다른 미러 URL의 동일 PDF
+            content_key = _content_key(pdf_bytes)
+            entry = await asyncio.to_thread(
+                _lookup_by_content, cache, pdf_bytes, content_key, url_key, ttl
+            )
+            if entry is not None:
+                logger.debug("Gemini 캐시 히트 (내용 해시): %s", pdf_url)
+                return _cached_result(entry)
 
             # Gemini에 PDF + 프롬프트 전송
             client = self._get_client()
@@ -111,7 +349,7 @@ class GeminiParser:
             }
 
             # 캐시 저장
-            _parse_cache[cache_key] = result
+            await asyncio.to_thread(_store_result, cache, content_key, url_key, result, ttl)
             logger.info("Gemini PDF 파싱 완료: %s", pdf_url)
 
             return result
@@ -123,40 +361,30 @@ class GeminiParser:
     async def _call_gemini(
         self, client, pdf_bytes: bytes, prompt: str
     ) -> dict[str, Any]:
-        """Gemini API 호출 (동기 → 비동기 래핑)"""
-        import asyncio
-        import json
+        """Gemini API 호출 (동기 → 비동기 래핑, 429/5xx 재시도)"""
+        # text/auto 모드: 내장 텍스트가 있으면 vision(페이지 래스터화) 대신 텍스트 전송
+        mode = settings.GEMINI_PDF_MODE
+        # 텍스트 추출은 CPU 작업 — 이벤트 루프를 막지 않도록 스레드에서
+        pdf_text = (
+            await asyncio.to_thread(extract_pdf_text, pdf_bytes)
+            if mode in ("text", "auto") else ""
+        )
+        if pdf_text:
+            parts = [pdf_text, prompt]
+        else:
+            if mode == "text":
+                logger.info("PDF 텍스트 추출 불가 — vision 경로로 전환")
+            # Gemini는 PDF 바이트를 직접 처리 가능
+            parts = [{"mime_type": "application/pdf", "data": pdf_bytes}, prompt]
 
         def _sync_call():
-            # Gemini는 PDF 바이트를 직접 처리 가능
-            response = client.generate_content(
-                [
-                    {"mime_type": "application/pdf", "data": pdf_bytes},
-                    prompt,
-                ]
-            )
+            response = client.generate_content(parts)
             text = response.text
 
-            # JSON 추출 시도
-            parsed = {}
-            try:
-                # ```json ... ``` 블록 추출
-                if "```json" in text:
-                    json_str = text.split("```json")[1].split("```")[0].strip()
-                elif "```" in text:
-                    json_str = text.split("```")[1].split("```")[0].strip()
-                else:
-                    json_str = text
-                parsed = json.loads(json_str)
-            except (json.JSONDecodeError, IndexError):
-                logger.debug("Gemini JSON 파싱 실패 — 원본 텍스트 반환")
-
-            return {"text": text, "parsed": parsed}
+            return {"text": text, "parsed": _extract_json(text)}
 
-        return await asyncio.to_thread(_sync_call)
+        return await call_with_retry("gemini", asyncio.to_thread, _sync_call)
 
     def clear_cache(self) -> int:
         """캐시 초기화. 삭제된 항목 수 반환."""
-        count = len(_parse_cache)
-        _parse_cache.clear()
-        return count
+        return _get_cache().clear()
@@ -0,0 +1,56 @@
+"""LLM SDK 공용 httpx 클라이언트
+
+AsyncOpenAI / AsyncAnthropic은 생성 시마다 기본 풀(max_connections=100)의
+httpx 클라이언트를 따로 만든다. 여러 엔진이 하나의 큰 풀을 공유하도록
+이벤트 루프별로 1개의 클라이언트를 만들어 http_client=로 주입한다.
+h2 패키지가 설치되어 있으면 HTTP/2로 연결을 다중화한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Optional
+
+import httpx
+
+from regscan.config import settings
+
+logger = logging.getLogger(__name__)
+
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def get_llm_http_client() -> httpx.AsyncClient:
+    """현재 이벤트 루프의 공용 클라이언트 (루프가 바뀌거나 닫혔으면 재생성)"""
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            timeout=settings.LLM_HTTP_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.LLM_HTTP_MAX_KEEPALIVE,
+            ),
+            http2=_http2_available(),
+        )
+        _client_loop = loop
+    return _client
+
+
+async def close_llm_http_client() -> None:
+    """공용 클라이언트 종료 (앱 lifespan 종료 시 호출)"""
+    global _client, _client_loop
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
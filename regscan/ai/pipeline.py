@@ -4,42 +4,99 @@
 
 각 단계 실패 시 fallback (기존 v1 LLM 브리핑으로 대체).
 일일 API 호출 제한 체크.
+다수 약물은 run_batch()로 단계별 실행 — Reasoning·Verification은 약물 묶음 호출,
+Writer는 약물별 동시 실행 (AI_CONCURRENCY로 상한).
+AI_MODE=batch이면 run_batch()의 단계별 요청을 OpenAI Batch API로 일괄 제출.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import datetime, date
+import threading
+from collections import defaultdict
+from datetime import datetime, date, timedelta
 from typing import Any, Optional
 
 from regscan.config import settings
+from regscan.ai.batch_runner import BatchCollector
 from regscan.ai.reasoning_engine import ReasoningEngine
 from regscan.ai.verifier import InsightVerifier
 from regscan.ai.writing_engine import WritingEngine
 
 logger = logging.getLogger(__name__)
 
-# 일일 호출 카운터
-_daily_counts: dict[str, dict[str, int]] = {}
+# 일일 호출 카운터 — 날짜별 dict, 이틀 이전 날짜는 자동 정리
+# (run_batch 동시 실행 시 경합 방지용 lock)
+_daily_counts: defaultdict[str, defaultdict[str, int]] = defaultdict(lambda: defaultdict(int))
+_daily_counts_lock = threading.Lock()
+
+
+def _prune_old(today: date) -> None:
+    """전날보다 오래된 날짜 카운터 삭제 (lock 보유 상태에서 호출)"""
+    cutoff = (today - timedelta(days=1)).isoformat()
+    for day in [d for d in _daily_counts if d < cutoff]:
+        del _daily_counts[day]
+
+
+def _today_counts() -> defaultdict[str, int]:
+    """오늘 날짜 카운터 (lock 보유 상태에서 호출)"""
+    today = date.today()
+    key = today.isoformat()
+    if key not in _daily_counts:
+        _prune_old(today)
+    return _daily_counts[key]
 
 
 def _get_daily_count(key: str) -> int:
     """오늘 날짜의 호출 수 조회"""
-    today = date.today().isoformat()
-    if today not in _daily_counts:
-        _daily_counts.clear()
-        _daily_counts[today] = {}
-    return _daily_counts[today].get(key, 0)
+    with _daily_counts_lock:
+        return _today_counts()[key]
 
 
 def _increment_daily_count(key: str) -> int:
     """오늘 날짜의 호출 수 증가"""
-    today = date.today().isoformat()
-    if today not in _daily_counts:
-        _daily_counts.clear()
-        _daily_counts[today] = {}
-    _daily_counts[today][key] = _daily_counts[today].get(key, 0) + 1
-    return _daily_counts[today][key]
+    with _daily_counts_lock:
+        counts = _today_counts()
+        counts[key] += 1
+        return counts[key]
+
+
+def _reserve_daily_call(key: str, limit: int) -> Optional[int]:
+    """한도 내이면 호출 수를 선점(증가)하고 이전 값 반환, 초과면 None
+
+    조회와 증가 사이에 await가 끼면 동시 실행 중인 약물들이 모두 한도 체크를
+    통과하므로, 체크·증가를 lock 안에서 한 번에 처리한다.
+    """
+    with _daily_counts_lock:
+        counts = _today_counts()
+        count = counts[key]
+        if count >= limit:
+            return None
+        counts[key] = count + 1
+        return count
+
+
+def _release_daily_call(key: str) -> None:
+    """선점한 호출 수 반환 — 호출이 실패(예외·fallback)했거나 캐시에서 응답한 경우"""
+    with _daily_counts_lock:
+        counts = _today_counts()
+        if counts[key] > 0:
+            counts[key] -= 1
+
+
+def _reserve_or_warn(key: str, limit: int, label: str) -> bool:
+    """일일 한도 선점 — 초과면 경고 로그 후 False"""
+    if _reserve_daily_call(key, limit) is not None:
+        return True
+    logger.warning("%s 일일 한도 초과 (%d/%d)", label, _get_daily_count(key), limit)
+    return False
+
+
+def _settle_reasoning_call(result: dict[str, Any]) -> None:
+    """Reasoning 호출 결과가 실제 API 사용이 아니면(빈 결과·캐시·fallback) 선점 반환"""
+    if not result or result.get("cached") or result.get("reasoning_model") == "fallback":
+        _release_daily_call("reasoning")
 
 
 class AIIntelligencePipeline:
@@ -48,6 +105,7 @@ class AIIntelligencePipeline:
     Usage:
         pipeline = AIIntelligencePipeline()
         insight, article = await pipeline.run(drug, preprints, reports, opinions)
+        results = await pipeline.run_batch([drug1, drug2, ...])
     """
 
     def __init__(
@@ -86,13 +144,15 @@ class AIIntelligencePipeline:
         # ── Step 1: Reasoning (o4-mini) ──
         reasoning_result = {}
         if settings.ENABLE_AI_REASONING:
-            count = _get_daily_count("reasoning")
-            if count >= settings.MAX_REASONING_CALLS_PER_DAY:
-                logger.warning(
-                    "Reasoning 일일 한도 초과 (%d/%d)",
-                    count, settings.MAX_REASONING_CALLS_PER_DAY,
+            # 캐시 히트는 API 호출이 아니므로 일일 한도를 선점하지 않음 (한도 소진 후에도 사용)
+            cached = self.reasoning.cached_impact(drug, preprints, market_reports, expert_opinions)
+            if cached is not None:
+                reasoning_result = cached
+                logger.info(
+                    "[1/3] Reasoning 캐시 히트: impact=%d",
+                    reasoning_result.get("impact_score", 0),
                 )
-            else:
+            elif _reserve_or_warn("reasoning", settings.MAX_REASONING_CALLS_PER_DAY, "Reasoning"):
                 try:
                     reasoning_result = await self.reasoning.analyze_impact(
                         drug=drug,
@@ -100,33 +160,56 @@ class AIIntelligencePipeline:
                         market_reports=market_reports,
                         expert_opinions=expert_opinions,
                     )
-                    _increment_daily_count("reasoning")
+                    _settle_reasoning_call(reasoning_result)
                     logger.info(
                         "[1/3] Reasoning 완료: impact=%d",
                         reasoning_result.get("impact_score", 0),
                     )
                 except Exception as e:
+                    _release_daily_call("reasoning")
                     logger.error("[1/3] Reasoning 실패: %s", e)
         else:
             logger.info("[1/3] Reasoning 비활성화 (ENABLE_AI_REASONING=false)")
-            reasoning_result = {
-                "impact_score": drug.get("global_score", 0),
-                "risk_factors": [],
-                "opportunity_factors": [],
-                "reasoning_chain": "Reasoning 비활성화 — v1 점수 사용",
-                "reasoning_model": "disabled",
-                "reasoning_tokens": 0,
-            }
+            reasoning_result = self._disabled_reasoning(drug)
 
+        insight, article = await self.verify_and_write(
+            drug=drug,
+            reasoning_result=reasoning_result,
+            raw_sources={
+                "preprints": preprints or [],
+                "market_reports": market_reports or [],
+                "expert_opinions": expert_opinions or [],
+            },
+            article_type=article_type,
+        )
+
+        logger.info("=== AI 파이프라인 완료: %s ===", inn)
+        return insight, article
+
+    async def verify_and_write(
+        self,
+        drug: dict[str, Any],
+        reasoning_result: dict[str, Any],
+        raw_sources: dict[str, Any] | None = None,
+        article_type: str = "briefing",
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Verifier → Writer 단계 실행 (reasoning 결과가 이미 있는 경우)
+
+        약물 내에서는 순차(writer가 검증 결과를 입력으로 사용)로 실행됩니다.
+
+        Args:
+            drug: 약물 데이터 dict
+            reasoning_result: ReasoningEngine 출력 (또는 v1 점수 대체값)
+            raw_sources: 원본 데이터 {"preprints", "market_reports", "expert_opinions"}
+            article_type: 기사 유형
+
+        Returns:
+            (insight_dict, article_dict)
+        """
         # ── Step 2: Verification (GPT-5.2) ──
         verification_result = {}
         if settings.ENABLE_AI_VERIFIER and reasoning_result:
             try:
-                raw_sources = {
-                    "preprints": preprints or [],
-                    "market_reports": market_reports or [],
-                    "expert_opinions": expert_opinions or [],
-                }
                 verification_result = await self.verifier.verify(
                     drug=drug,
                     reasoning_result=reasoning_result,
@@ -142,51 +225,192 @@ class AIIntelligencePipeline:
         else:
             logger.info("[2/3] Verification 비활성화 또는 reasoning 결과 없음")
 
-        # insight 결과 조합
-        insight = {
+        insight = self._merge_insight(reasoning_result, verification_result)
+        return insight, await self._write(drug, insight, article_type)
+
+    @staticmethod
+    def _disabled_reasoning(drug: dict[str, Any]) -> dict[str, Any]:
+        """Reasoning 비활성화 시 v1 점수 대체값"""
+        return {
+            "impact_score": drug.get("global_score", 0),
+            "risk_factors": [],
+            "opportunity_factors": [],
+            "reasoning_chain": "Reasoning 비활성화 — v1 점수 사용",
+            "reasoning_model": "disabled",
+            "reasoning_tokens": 0,
+        }
+
+    @staticmethod
+    def _merge_insight(
+        reasoning_result: dict[str, Any], verification_result: dict[str, Any],
+    ) -> dict[str, Any]:
+        """insight 결과 조합 (검증 결과 중 writer 입력 필드만 병합)"""
+        return {
             **reasoning_result,
             **{k: v for k, v in verification_result.items()
                if k in ("verified_score", "corrections", "confidence_level",
                          "verifier_model", "verifier_tokens")},
         }
 
-        # ── Step 3: Writing (GPT-5.2) ──
+    async def _write(
+        self, drug: dict[str, Any], insight: dict[str, Any], article_type: str,
+    ) -> dict[str, Any]:
+        """Step 3: Writing (GPT-5.2) — 캐시 히트 우선, 일일 한도 내에서만 호출"""
         article = {}
         if settings.ENABLE_AI_WRITER:
-            count = _get_daily_count("writer")
-            if count >= settings.MAX_WRITER_CALLS_PER_DAY:
-                logger.warning(
-                    "Writer 일일 한도 초과 (%d/%d)",
-                    count, settings.MAX_WRITER_CALLS_PER_DAY,
-                )
-            else:
+            cached = self.writer.cached_article(drug, insight, article_type)
+            if cached is not None:
+                article = cached
+                logger.info("[3/3] Writing 캐시 히트: headline=%s", article.get("headline", "?")[:30])
+            elif _reserve_or_warn("writer", settings.MAX_WRITER_CALLS_PER_DAY, "Writer"):
                 try:
                     article = await self.writer.write_article(
                         drug=drug,
                         verified_insight=insight,
                         article_type=article_type,
                     )
-                    _increment_daily_count("writer")
+                    if article.get("cached") or article.get("writer_model") == "fallback":
+                        _release_daily_call("writer")
                     logger.info(
                         "[3/3] Writing 완료: headline=%s",
                         article.get("headline", "?")[:30],
                     )
                 except Exception as e:
+                    _release_daily_call("writer")
                     logger.error("[3/3] Writing 실패: %s", e)
         else:
             logger.info("[3/3] Writing 비활성화 (ENABLE_AI_WRITER=false)")
+        return article
 
-        logger.info("=== AI 파이프라인 완료: %s ===", inn)
-        return insight, article
+    async def run_batch(
+        self,
+        drugs: list[dict[str, Any]],
+        sources: dict[str, dict[str, list[dict]]] | None = None,
+        article_type: str = "briefing",
+        concurrency: Optional[int] = None,
+    ) -> list[tuple[dict[str, Any], dict[str, Any]]]:
+        """여러 약물에 대해 파이프라인을 단계별로 실행
+
+        Reasoning·Verification은 여러 약물을 한 요청에 묶어(keyed JSON) 공통
+        시스템·지침 프롬프트를 약물 간 공유하고, 묶음들은 동시에 전송한다.
+        캐시 히트·일일 한도·회로 차단 규칙은 run()과 같다. Writer는 약물별
+        호출을 Semaphore 상한 안에서 동시 실행 (OpenAI rate limit 고려).
+
+        Args:
+            drugs: 약물 데이터 dict 목록
+            sources: INN → {"preprints", "market_reports", "expert_opinions"}
+            article_type: 기사 유형
+            concurrency: Writer 동시 실행 수 (None이면 settings.AI_CONCURRENCY)
+
+        Returns:
+            입력 순서대로 (insight_dict, article_dict) 목록.
+            개별 약물 실패 시 ({}, {}).
+        """
+        sources = sources or {}
+        raw_sources = [
+            {
+                stream: sources.get(drug.get("inn", ""), {}).get(stream) or []
+                for stream in ("preprints", "market_reports", "expert_opinions")
+            }
+            for drug in drugs
+        ]
+
+        # batch 모드: 모든 약물의 같은 단계 요청이 한 batch에 모이도록 동시 실행 제한 없음
+        collector: Optional[BatchCollector] = None
+        if settings.AI_MODE == "batch" and drugs and self.reasoning.api_key:
+            collector = BatchCollector(self.reasoning._get_client())
+            concurrency = len(drugs)
+        self._attach_batch(collector)
+
+        sem = asyncio.Semaphore(concurrency or settings.AI_CONCURRENCY)
+
+        async def _write_one(i: int) -> tuple[dict[str, Any], dict[str, Any]]:
+            async with sem:
+                try:
+                    insight = self._merge_insight(reasoning_results[i], verification_results[i])
+                    return insight, await self._write(drugs[i], insight, article_type)
+                except Exception as e:
+                    logger.error("AI 파이프라인 실패 (%s): %s", drugs[i].get("inn", "?"), e)
+                    return {}, {}
+
+        try:
+            reasoning_results = await self._reason_batch(drugs, sources)
+            verification_results = await self._verify_batch(drugs, reasoning_results, raw_sources)
+            return list(await asyncio.gather(*(_write_one(i) for i in range(len(drugs)))))
+        finally:
+            self._attach_batch(None)
+
+    async def _reason_batch(
+        self,
+        drugs: list[dict[str, Any]],
+        sources: dict[str, dict[str, list[dict]]],
+    ) -> list[dict[str, Any]]:
+        """Step 1 묶음 실행 — 캐시 히트는 그대로, 일일 한도를 선점한 약물만 묶음 호출"""
+        if not settings.ENABLE_AI_REASONING:
+            logger.info("[1/3] Reasoning 비활성화 (ENABLE_AI_REASONING=false)")
+            return [self._disabled_reasoning(drug) for drug in drugs]
+
+        results: list[dict[str, Any]] = [{} for _ in drugs]
+        todo: list[int] = []
+        for i, drug in enumerate(drugs):
+            src = sources.get(drug.get("inn", ""), {})
+            cached = self.reasoning.cached_impact(
+                drug, src.get("preprints"), src.get("market_reports"), src.get("expert_opinions"),
+            )
+            if cached is not None:
+                results[i] = cached
+            elif _reserve_or_warn("reasoning", settings.MAX_REASONING_CALLS_PER_DAY, "Reasoning"):
+                todo.append(i)
+        if not todo:
+            return results
+
+        try:
+            analyzed = await self.reasoning.analyze_impact_batch([drugs[i] for i in todo], sources)
+        except Exception as e:
+            logger.error("[1/3] Reasoning 묶음 실패 (%d건): %s", len(todo), e)
+            analyzed = [{} for _ in todo]
+        for i, result in zip(todo, analyzed):
+            _settle_reasoning_call(result)
+            results[i] = result
+        logger.info("[1/3] Reasoning 완료: %d건 (호출 대상 %d건)", len(drugs), len(todo))
+        return results
+
+    async def _verify_batch(
+        self,
+        drugs: list[dict[str, Any]],
+        reasoning_results: list[dict[str, Any]],
+        raw_sources: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Step 2 묶음 실행 — reasoning 결과가 있는 약물만 검증"""
+        results: list[dict[str, Any]] = [{} for _ in drugs]
+        todo = [i for i, result in enumerate(reasoning_results) if result]
+        if not settings.ENABLE_AI_VERIFIER or not todo:
+            logger.info("[2/3] Verification 비활성화 또는 reasoning 결과 없음")
+            return results
+
+        try:
+            verified = await self.verifier.verify_batch(
+                [(drugs[i], reasoning_results[i], raw_sources[i]) for i in todo],
+            )
+        except Exception as e:
+            logger.error("[2/3] Verification 묶음 실패 (%d건): %s", len(todo), e)
+            return results
+        for i, result in zip(todo, verified):
+            results[i] = result
+        logger.info("[2/3] Verification 완료: %d건", len(todo))
+        return results
+
+    def _attach_batch(self, collector: Optional[BatchCollector]) -> None:
+        """세 엔진에 Batch API 수집기 연결/해제"""
+        for engine in (self.reasoning, self.verifier, self.writer):
+            engine.batch = collector
 
     @staticmethod
     def get_daily_usage() -> dict[str, int]:
         """오늘의 API 호출 사용량 조회"""
-        today = date.today().isoformat()
-        counts = _daily_counts.get(today, {})
         return {
-            "reasoning_calls": counts.get("reasoning", 0),
-            "writer_calls": counts.get("writer", 0),
+            "reasoning_calls": _get_daily_count("reasoning"),
+            "writer_calls": _get_daily_count("writer"),
             "reasoning_limit": settings.MAX_REASONING_CALLS_PER_DAY,
             "writer_limit": settings.MAX_WRITER_CALLS_PER_DAY,
         }
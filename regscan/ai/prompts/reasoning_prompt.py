@@ -2,6 +2,9 @@
 
 Chain-of-Thought(CoT) 기법을 활용한 다차원 분석 프롬프트.
 4대 스트림: 규제(A) + 연구(B) + 시장(C) + 현장반응(D)
+
+모든 호출에서 동일한 시스템 프롬프트·분석 지침은 메시지 앞쪽(system)에 두고
+약물별 데이터만 user 메시지에 담아 프롬프트 캐시(prefix) 적중을 높인다.
 """
 
 REASONING_SYSTEM_PROMPT = """당신은 의약품 규제·시장 전문 분석가입니다.
@@ -19,7 +22,7 @@ D. 현장반응 스트림: 전문가 리뷰, KPIC 평가
 ## 출력 요구사항
 반드시 JSON 형식으로 응답하세요."""
 
-REASONING_PROMPT = """## 분석 대상 약물
+REASONING_DRUG_BLOCK = """## 분석 대상 약물
 {drug_data}
 
 ## 규제 데이터 (A 스트림)
@@ -33,11 +36,10 @@ REASONING_PROMPT = """## 분석 대상 약물
 {market_data}
 
 ## 현장반응 데이터 (D 스트림)
-{expert_data}
-
----
+{expert_data}"""
 
-## 분석 지침
+# 두 번째 system 메시지 — 약물과 무관하게 고정
+REASONING_FRAMEWORK_PROMPT = """## 분석 지침
 
 ### Step 1: 각 스트림별 핵심 시그널 추출
 - A: 규제 진행 속도, 특수 지정(희귀/돌파/가속) 여부
@@ -52,10 +54,9 @@ REASONING_PROMPT = """## 분석 대상 약물
 - C+D: 시장 전망과 실무 기대의 격차
 
 ### Step 3: 종합 영향도 산출
+- Step 1·2 결과를 종합하여 요청된 JSON 형식으로 출력"""
 
-다음 JSON 형식으로 응답하세요:
-```json
-{{
+_REASONING_RESULT_SCHEMA = """{{
     "impact_score": 0-100,
     "risk_factors": ["리스크1", "리스크2", ...],
     "opportunity_factors": ["기회1", "기회2", ...],
@@ -68,5 +69,29 @@ REASONING_PROMPT = """## 분석 대상 약물
         "field_reaction": "핵심 시그널"
     }},
     "cross_analysis": "크로스 스트림 분석 요약"
+}}"""
+
+REASONING_PROMPT = REASONING_DRUG_BLOCK + """
+
+---
+
+분석 지침(Step 1→3)에 따라 다음 JSON 형식으로 응답하세요:
+```json
+""" + _REASONING_RESULT_SCHEMA + """
+```"""
+
+# 여러 약물을 한 번에 분석 (키: d0, d1, ...) — 시스템/지침 프롬프트를 약물 간 공유
+REASONING_BATCH_PROMPT = """아래 {count}개 약물을 각각 독립적으로 분석하세요.
+각 약물은 [d0], [d1] ... 키로 구분됩니다.
+
+{drug_blocks}
+
+---
+
+분석 지침(Step 1→3)에 따라 약물 키별로 다음 JSON 형식으로 응답하세요 (모든 키 포함):
+```json
+{{
+    "d0": """ + _REASONING_RESULT_SCHEMA.replace("\n", "\n    ") + """,
+    "d1": {{ ... }}
 }}
 ```"""
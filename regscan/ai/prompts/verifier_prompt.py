@@ -1,6 +1,7 @@
 """GPT-5.2 Verifier 프롬프트
 
 o4-mini 추론 결과를 원본 데이터와 대조하여 팩트체크.
+고정 지침은 system 메시지로 분리 (프롬프트 캐시 prefix 공유).
 """
 
 VERIFIER_SYSTEM_PROMPT = """당신은 의약품 규제 데이터 검증 전문가입니다.
@@ -17,7 +18,7 @@ AI가 생성한 분석 결과를 원본 데이터와 대조하여 팩트체크
 ## 출력 형식
 반드시 JSON으로 응답하세요."""
 
-VERIFIER_PROMPT = """## 검증 대상: AI 분석 결과
+VERIFIER_DATA_BLOCK = """## 검증 대상: AI 분석 결과
 {reasoning_result}
 
 ## 원본 데이터
@@ -31,22 +32,21 @@ VERIFIER_PROMPT = """## 검증 대상: AI 분석 결과
 {market_data}
 
 ### 전문가 리뷰
-{expert_data}
+{expert_data}"""
 
----
-
-## 검증 지침
+# 두 번째 system 메시지 — 약물과 무관하게 고정
+VERIFIER_GUIDE_PROMPT = """## 검증 지침
 
 1. **사실 확인**: 분석 결과의 각 주장이 원본 데이터에 근거하는지 확인
 2. **점수 검증**: impact_score가 데이터 대비 합리적인지 평가
 3. **오류 수정**: 잘못된 부분이 있다면 구체적으로 수정 제안
-4. **신뢰도 평가**: 전체 분석의 신뢰 수준 판단
+4. **신뢰도 평가**: 전체 분석의 신뢰 수준 판단"""
 
-다음 JSON 형식으로 응답하세요:
-```json
-{{
+
+def _verifier_result_schema(original_score: str) -> str:
+    return """{{
     "verified_score": 0-100,
-    "original_score": {original_score},
+    "original_score": """ + original_score + """,
     "score_adjustment": "점수 조정 사유 (조정 없으면 빈 문자열)",
     "corrections": [
         {{
@@ -65,5 +65,31 @@ VERIFIER_PROMPT = """## 검증 대상: AI 분석 결과
         "expert": true/false
     }},
     "verification_notes": "추가 검증 코멘트"
+}}"""
+
+
+VERIFIER_PROMPT = VERIFIER_DATA_BLOCK + """
+
+---
+
+검증 지침에 따라 다음 JSON 형식으로 응답하세요:
+```json
+""" + _verifier_result_schema("{original_score}") + """
+```"""
+
+# 여러 약물의 분석 결과를 한 번에 검증 (키: d0, d1, ...)
+VERIFIER_BATCH_PROMPT = """아래 {count}개 약물의 AI 분석 결과를 각각 독립적으로 검증하세요.
+각 약물은 [d0], [d1] ... 키로 구분됩니다.
+
+{data_blocks}
+
+---
+
+검증 지침에 따라 약물 키별로 다음 JSON 형식으로 응답하세요 (모든 키 포함,
+original_score는 해당 약물의 impact_score):
+```json
+{{
+    "d0": """ + _verifier_result_schema("원래 점수").replace("\n", "\n    ") + """,
+    "d1": {{ ... }}
 }}
 ```"""
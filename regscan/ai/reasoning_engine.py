@@ -6,18 +6,41 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from typing import Any, Optional
 
+import orjson
+
 from regscan.config import settings
+from regscan.utils.serialization import dumps_str
+from regscan.ai.batch_runner import BatchCollector
+from regscan.ai.breaker import call_with_retry, get_breaker
+from regscan.ai.http_client import get_llm_http_client
+from regscan.ai.cache import content_key, get_result, put_result
+from regscan.ai.sources import MIN_SOURCE_BUDGET, pack_sources
+from regscan.ai.tokens import count_message_tokens
 from regscan.ai.prompts.reasoning_prompt import (
     REASONING_SYSTEM_PROMPT,
+    REASONING_FRAMEWORK_PROMPT,
     REASONING_PROMPT,
+    REASONING_DRUG_BLOCK,
+    REASONING_BATCH_PROMPT,
 )
 
 logger = logging.getLogger(__name__)
 
+# OpenAI 프롬프트 캐시 라우팅 키 — 동일 prefix 요청을 같은 캐시로 유도
+_PROMPT_CACHE_KEY = "regscan-reasoning"
+
+# 프롬프트 렌더러 — format_map에 변수 dict를 그대로 전달 (**kwargs 재구성 생략)
+_render_prompt = REASONING_PROMPT.format_map
+_render_drug_block = REASONING_DRUG_BLOCK.format_map
+_render_batch_prompt = REASONING_BATCH_PROMPT.format_map
+
+# reasoning_effort 파라미터를 받는 모델 계열 (gpt-4o 계열은 미지원)
+_REASONING_MODEL_PREFIXES = ("o1", "o3", "o4", "gpt-5")
 
 class ReasoningEngine:
     """o4-mini 기반 Reasoning Engine
@@ -33,19 +56,78 @@ class ReasoningEngine:
         self.model = model or settings.REASONING_MODEL
         self.api_key = api_key or settings.OPENAI_API_KEY
         self._client = None
+        self._http_client = None
+        # OpenAI Batch API 수집기 (설정 시 요청을 모아 일괄 제출)
+        self.batch: Optional[BatchCollector] = None
 
     def _get_client(self):
-        """OpenAI 클라이언트 lazy init"""
-        if self._client is None:
+        """OpenAI 클라이언트 lazy init (공용 httpx 풀 사용, 루프 변경 시 재생성)"""
+        http_client = get_llm_http_client()
+        if self._client is None or (
+            self._http_client is not None and self._http_client is not http_client
+        ):
             try:
                 from openai import AsyncOpenAI
-                self._client = AsyncOpenAI(api_key=self.api_key)
+                # 재시도는 call_with_retry가 담당 — SDK 자체 재시도와 곱해지지 않게 끔
+                self._client = AsyncOpenAI(
+                    api_key=self.api_key, http_client=http_client, max_retries=0,
+                )
+                self._http_client = http_client
             except ImportError:
                 raise ImportError(
                     "openai 패키지가 필요합니다. pip install 'regscan[llm]'"
                 )
         return self._client
 
+    @staticmethod
+    def _messages(prompt: str) -> list[dict[str, str]]:
+        """고정 system 프롬프트 2개 + 약물별 user 프롬프트 (캐시 prefix 유지)"""
+        return [
+            {"role": "system", "content": REASONING_SYSTEM_PROMPT},
+            {"role": "system", "content": REASONING_FRAMEWORK_PROMPT},
+            {"role": "user", "content": prompt},
+        ]
+
+    def _select_model(
+        self,
+        drug: dict[str, Any],
+        preprints: list[dict] | None = None,
+        market_reports: list[dict] | None = None,
+        expert_opinions: list[dict] | None = None,
+    ) -> tuple[str, str]:
+        """복잡도 기반 모델 라우팅 → (model, reasoning_effort)
+
+        추론할 소스가 거의 없고 점수가 낮으며 급여 정보도 없는 약물
+        (전임상·미보도 단계)은 경량 모델로, 나머지는 기본 모델(high)로 보낸다.
+        """
+        if settings.ENABLE_REASONING_ROUTING:
+            n_sources = (
+                len(preprints or []) + len(market_reports or []) + len(expert_opinions or [])
+            )
+            if (
+                n_sources <= settings.REASONING_LIGHT_MAX_SOURCES
+                and (drug.get("global_score") or 0) < settings.REASONING_LIGHT_MAX_SCORE
+                and not drug.get("hira_status")
+            ):
+                return settings.REASONING_LIGHT_MODEL, "low"
+        return self.model, "high"
+
+    @staticmethod
+    def _model_kwargs(model: str, effort: str) -> dict[str, Any]:
+        """모델별 호출 인자 (reasoning_effort는 지원 모델에만 전달)"""
+        kwargs: dict[str, Any] = {"model": model}
+        if model.startswith(_REASONING_MODEL_PREFIXES):
+            kwargs["reasoning_effort"] = effort
+        return kwargs
+
+    async def _create_completion(self, **kwargs):
+        """chat.completions 호출 (batch 수집기 설정 시 Batch API 경유, 아니면 재시도·회로 차단)"""
+        if self.batch is not None:
+            return await self.batch.submit(kwargs, label="reasoning")
+        return await call_with_retry(
+            "openai", self._get_client().chat.completions.create, **kwargs,
+        )
+
     async def analyze_impact(
         self,
         drug: dict[str, Any],
@@ -69,38 +151,48 @@ class ReasoningEngine:
             logger.warning("OPENAI_API_KEY 미설정 — reasoning 건너뜀")
             return self._fallback_result(drug)
 
-        prompt = REASONING_PROMPT.format(
-            drug_data=json.dumps(drug, ensure_ascii=False, default=str),
-            regulatory_data=self._format_regulatory(drug),
-            preprint_data=self._format_preprints(preprints or []),
-            market_data=self._format_market(market_reports or []),
-            expert_data=self._format_experts(expert_opinions or []),
+        model, effort = self._select_model(drug, preprints, market_reports, expert_opinions)
+
+        # 입력(약물+소스)이 지난 실행과 같으면 API 호출 생략
+        cache_key = self._cache_key(drug, preprints, market_reports, expert_opinions, model)
+        cached = get_result(cache_key)
+        if cached is not None:
+            logger.debug("Reasoning 캐시 히트: %s", drug.get("inn", "?"))
+            return cached
+
+        # OpenAI 회로 개방 중이면 프롬프트 조립 없이 즉시 fallback
+        if self.batch is None and get_breaker("openai").is_open:
+            logger.warning("OpenAI 회로 개방 — reasoning 건너뜀 (%s)", drug.get("inn", "?"))
+            return self._fallback_result(drug)
+
+        messages, prompt_tokens = self._build_messages(
+            drug, preprints, market_reports, expert_opinions,
         )
+        if messages is None:
+            return self._fallback_result(drug)
 
         try:
-            client = self._get_client()
-            response = await client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": REASONING_SYSTEM_PROMPT},
-                    {"role": "user", "content": prompt},
-                ],
-                reasoning_effort="high",
+            response = await self._create_completion(
+                **self._model_kwargs(model, effort),
+                messages=messages,
                 response_format={"type": "json_object"},
+                extra_body={"prompt_cache_key": _PROMPT_CACHE_KEY},
             )
 
             result_text = response.choices[0].message.content
             tokens = response.usage.total_tokens if response.usage else 0
 
             result = json.loads(result_text)
-            result["reasoning_model"] = self.model
+            result["reasoning_model"] = model
             result["reasoning_tokens"] = tokens
+            put_result(cache_key, result)
 
             logger.info(
-                "Reasoning 완료: %s, impact=%d, tokens=%d",
+                "Reasoning 완료: %s, impact=%d, tokens=%d (prompt 추정 %d)",
                 drug.get("inn", "?"),
                 result.get("impact_score", 0),
                 tokens,
+                prompt_tokens,
             )
             return result
 
@@ -108,6 +200,232 @@ class ReasoningEngine:
             logger.error("Reasoning 실패 (%s): %s", drug.get("inn", "?"), e)
             return self._fallback_result(drug)
 
+    async def analyze_impact_batch(
+        self,
+        drugs: list[dict[str, Any]],
+        sources: dict[str, dict[str, list[dict]]] | None = None,
+        batch_size: Optional[int] = None,
+    ) -> list[dict[str, Any]]:
+        """여러 약물 영향도를 묶음 호출로 분석
+
+        batch_size개씩 하나의 요청에 담아(키: d0, d1, ...) 시스템·지침 프롬프트를
+        약물 간 공유한다. 묶음들은 동시에 전송하며, 응답에서 누락된 약물은
+        단건 analyze_impact()로 재시도한다.
+
+        Args:
+            drugs: 약물 기본 데이터 목록
+            sources: INN → {"preprints", "market_reports", "expert_opinions"}
+            batch_size: 요청당 약물 수 (None이면 settings.REASONING_BATCH_SIZE)
+
+        Returns:
+            입력 순서대로 analyze_impact()와 동일한 형식의 결과 목록
+        """
+        if not self.api_key:
+            logger.warning("OPENAI_API_KEY 미설정 — reasoning 건너뜀")
+            return [self._fallback_result(d) for d in drugs]
+
+        sources = sources or {}
+        results: list[Optional[dict[str, Any]]] = []
+        # 라우팅 티어(model, effort)별로 묶어야 한 요청에 한 모델만 사용
+        todo: dict[tuple[str, str], list[int]] = {}
+        for i, drug in enumerate(drugs):
+            src = sources.get(drug.get("inn", ""), {})
+            args = (src.get("preprints"), src.get("market_reports"), src.get("expert_opinions"))
+            tier = self._select_model(drug, *args)
+            cached = get_result(self._cache_key(drug, *args, tier[0]))
+            results.append(cached)
+            if cached is None:
+                todo.setdefault(tier, []).append(i)
+
+        # OpenAI 회로 개방 중이면 프롬프트 조립 없이 즉시 fallback (단건 경로와 동일)
+        if todo and self.batch is None and get_breaker("openai").is_open:
+            logger.warning("OpenAI 회로 개방 — reasoning 묶음 건너뜀")
+            for idx in todo.values():
+                for i in idx:
+                    results[i] = self._fallback_result(drugs[i])
+            return results
+
+        size = max(1, batch_size or settings.REASONING_BATCH_SIZE)
+        chunks = [
+            (tier, idx[i:i + size])
+            for tier, idx in todo.items()
+            for i in range(0, len(idx), size)
+        ]
+        chunk_results = await asyncio.gather(*(
+            self._analyze_chunk([drugs[i] for i in chunk], sources, tier)
+            for tier, chunk in chunks
+        ))
+        for (_, chunk), chunk_result in zip(chunks, chunk_results):
+            for i, result in zip(chunk, chunk_result):
+                results[i] = result
+        return results
+
+    async def _analyze_chunk(
+        self,
+        drugs: list[dict[str, Any]],
+        sources: dict[str, dict[str, list[dict]]],
+        tier: tuple[str, str],
+    ) -> list[dict[str, Any]]:
+        """묶음 1회 호출 (같은 라우팅 티어). 누락·실패 약물은 단건 호출로 fallback."""
+        model, effort = tier
+
+        def _src(drug: dict) -> dict[str, list[dict]]:
+            return sources.get(drug.get("inn", ""), {})
+
+        async def _single(drug: dict) -> dict[str, Any]:
+            src = _src(drug)
+            return await self.analyze_impact(
+                drug=drug,
+                preprints=src.get("preprints"),
+                market_reports=src.get("market_reports"),
+                expert_opinions=src.get("expert_opinions"),
+            )
+
+        if len(drugs) == 1:
+            return [await _single(drugs[0])]
+
+        blocks = []
+        for i, drug in enumerate(drugs):
+            src = _src(drug)
+            block = _render_drug_block(self._prompt_vars(
+                drug, src.get("preprints"), src.get("market_reports"), src.get("expert_opinions"),
+            ))
+            blocks.append(f"### [d{i}]\n{block}")
+        prompt = _render_batch_prompt(
+            {"count": len(drugs), "drug_blocks": "\n\n".join(blocks)},
+        )
+        messages = self._messages(prompt)
+        prompt_tokens = count_message_tokens(messages)
+        if prompt_tokens > settings.REASONING_CTX_BUDGET:
+            logger.info(
+                "Reasoning 묶음 프롬프트 %d토큰 > 예산 %d — 단건 호출로 분할",
+                prompt_tokens, settings.REASONING_CTX_BUDGET,
+            )
+            return list(await asyncio.gather(*(_single(d) for d in drugs)))
+
+        parsed: dict[str, Any] = {}
+        tokens = 0
+        try:
+            response = await self._create_completion(
+                **self._model_kwargs(model, effort),
+                messages=messages,
+                response_format={"type": "json_object"},
+                extra_body={"prompt_cache_key": _PROMPT_CACHE_KEY},
+            )
+            tokens = response.usage.total_tokens if response.usage else 0
+            # 묶음 응답은 커질 수 있어 orjson으로 파싱
+            parsed = orjson.loads(response.choices[0].message.content)
+        except Exception as e:
+            logger.error("Reasoning 묶음 호출 실패 (%d건): %s", len(drugs), e)
+
+        results: list[Optional[dict[str, Any]]] = []
+        missing = []
+        for i, drug in enumerate(drugs):
+            item = parsed.get(f"d{i}") if isinstance(parsed, dict) else None
+            if isinstance(item, dict) and "impact_score" in item:
+                item["reasoning_model"] = model
+                item["reasoning_tokens"] = tokens // len(drugs)
+                src = _src(drug)
+                put_result(self._cache_key(
+                    drug, src.get("preprints"), src.get("market_reports"), src.get("expert_opinions"),
+                    model,
+                ), item)
+                results.append(item)
+            else:
+                results.append(None)
+                missing.append(i)
+
+        if missing:
+            logger.info("Reasoning 묶음 누락 %d건 — 단건 재시도", len(missing))
+            retried = await asyncio.gather(*(_single(drugs[i]) for i in missing))
+            for i, result in zip(missing, retried):
+                results[i] = result
+
+        logger.info(
+            "Reasoning 묶음 완료: %d건, tokens=%d (prompt 추정 %d)",
+            len(drugs), tokens, prompt_tokens,
+        )
+        return results
+
+    def cached_impact(
+        self,
+        drug: dict[str, Any],
+        preprints: list[dict] | None = None,
+        market_reports: list[dict] | None = None,
+        expert_opinions: list[dict] | None = None,
+    ) -> Optional[dict[str, Any]]:
+        """analyze_impact()가 캐시에서 바로 돌려줄 결과 (없으면 None) — 일일 한도 선점 전 확인용"""
+        model, _ = self._select_model(drug, preprints, market_reports, expert_opinions)
+        return get_result(self._cache_key(drug, preprints, market_reports, expert_opinions, model))
+
+    def _cache_key(
+        self,
+        drug: dict[str, Any],
+        preprints: list[dict] | None = None,
+        market_reports: list[dict] | None = None,
+        expert_opinions: list[dict] | None = None,
+        model: Optional[str] = None,
+    ) -> str:
+        """결과 캐시 키 — 모델명 포함 (모델 변경 시 자동 무효화)"""
+        return content_key(
+            "reasoning", model or self.model, drug,
+            preprints or [], market_reports or [], expert_opinions or [],
+        )
+
+    def _build_messages(
+        self,
+        drug: dict[str, Any],
+        preprints: list[dict] | None = None,
+        market_reports: list[dict] | None = None,
+        expert_opinions: list[dict] | None = None,
+    ) -> tuple[Optional[list[dict[str, str]]], int]:
+        """단건 요청 메시지 + 프롬프트 토큰 수
+
+        REASONING_CTX_BUDGET을 넘으면 초과분만큼 소스 예산을 줄여 1회
+        재포장한다. 그래도 넘으면 (None, 토큰 수) — 실패가 확실한 호출 생략.
+        """
+        args = (drug, preprints, market_reports, expert_opinions)
+        messages = self._messages(_render_prompt(self._prompt_vars(*args)))
+        prompt_tokens = count_message_tokens(messages)
+        ctx_budget = settings.REASONING_CTX_BUDGET
+        if prompt_tokens <= ctx_budget:
+            return messages, prompt_tokens
+
+        source_budget = max(
+            MIN_SOURCE_BUDGET,
+            settings.REASONING_SOURCE_BUDGET_TOKENS - (prompt_tokens - ctx_budget),
+        )
+        logger.warning(
+            "Reasoning 프롬프트 %d토큰 > 예산 %d (%s) — 소스 %d토큰으로 재포장",
+            prompt_tokens, ctx_budget, drug.get("inn", "?"), source_budget,
+        )
+        messages = self._messages(_render_prompt(
+            self._prompt_vars(*args, source_budget=source_budget),
+        ))
+        prompt_tokens = count_message_tokens(messages)
+        if prompt_tokens > ctx_budget:
+            logger.error(
+                "Reasoning 프롬프트 재포장 후에도 %d토큰 (%s) — 호출 생략",
+                prompt_tokens, drug.get("inn", "?"),
+            )
+            return None, prompt_tokens
+        return messages, prompt_tokens
+
+    def _prompt_vars(
+        self,
+        drug: dict[str, Any],
+        preprints: list[dict] | None = None,
+        market_reports: list[dict] | None = None,
+        expert_opinions: list[dict] | None = None,
+        source_budget: Optional[int] = None,
+    ) -> dict[str, str]:
+        """약물 1건의 프롬프트 변수 (단건/묶음 프롬프트 공용)"""
+        return {
+            "drug_data": dumps_str(drug),
+            "regulatory_data": self._format_regulatory(drug),
+            **pack_sources(preprints, market_reports, expert_opinions, source_budget),
+        }
+
     def _fallback_result(self, drug: dict) -> dict:
         """API 실패 시 기본 분석 결과 반환"""
         return {
@@ -141,42 +459,15 @@ class ReasoningEngine:
 
     @staticmethod
     def _format_preprints(preprints: list[dict]) -> str:
-        """프리프린트 데이터 포맷팅"""
-        if not preprints:
-            return "관련 프리프린트 없음"
-        lines = []
-        for p in preprints[:10]:
-            lines.append(f"- [{p.get('doi', '')}] {p.get('title', '')}")
-            if p.get("abstract"):
-                # 500자로 확장 — 임상 결과(PFS, OS, 환자수)는 보통 초록 후반에 위치
-                abstract = p["abstract"]
-                if len(abstract) > 500:
-                    abstract = abstract[:500] + "..."
-                lines.append(f"  요약: {abstract}")
-        return "\n".join(lines)
+        """프리프린트 데이터 포맷팅 (단일 스트림 pack_sources)"""
+        return pack_sources(preprints=preprints)["preprint_data"]
 
     @staticmethod
     def _format_market(reports: list[dict]) -> str:
-        """시장 데이터 포맷팅"""
-        if not reports:
-            return "시장 데이터 없음"
-        lines = []
-        for r in reports[:5]:
-            lines.append(f"- {r.get('title', '')}")
-            if r.get("market_size_krw"):
-                lines.append(f"  시장 규모: {r['market_size_krw']}억 원")
-            if r.get("growth_rate"):
-                lines.append(f"  성장률: {r['growth_rate']}%")
-        return "\n".join(lines)
+        """시장 데이터 포맷팅 (단일 스트림 pack_sources)"""
+        return pack_sources(market_reports=reports)["market_data"]
 
     @staticmethod
     def _format_experts(opinions: list[dict]) -> str:
-        """전문가 의견 포맷팅"""
-        if not opinions:
-            return "전문가 리뷰 없음"
-        lines = []
-        for o in opinions[:5]:
-            lines.append(f"- [{o.get('source', '')}] {o.get('title', '')}")
-            if o.get("summary"):
-                lines.append(f"  요약: {o['summary'][:200]}...")
-        return "\n".join(lines)
+        """전문가 의견 포맷팅 (단일 스트림 pack_sources)"""
+        return pack_sources(expert_opinions=opinions)["expert_data"]
@@ -0,0 +1,97 @@
+"""프롬프트용 원본 소스 포장 — Reasoning/Verifier 공용
+
+프리프린트·시장 리포트·전문가 리뷰 3개 스트림을 토큰 예산 안에서
+프롬프트 변수(preprint_data / market_data / expert_data)로 축약합니다.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from regscan.config import settings
+from regscan.ai.tokens import count_tokens
+
+# 소스 스트림 (우선순위 순) → 프롬프트 변수 / 빈 목록 문구 / 본문 최대 글자 수
+_SOURCE_STREAMS = (
+    ("preprints", "preprint_data", "관련 프리프린트 없음", 500),
+    ("market_reports", "market_data", "시장 데이터 없음", 0),
+    ("expert_opinions", "expert_data", "전문가 리뷰 없음", 200),
+)
+_MIN_TEXT_CAP = 100  # 예산이 줄어도 본문은 최소 이만큼 유지
+MIN_SOURCE_BUDGET = 1000  # 컨텍스트 초과 재포장 시 소스 예산 하한
+
+
+def _clip(text: str, cap: int) -> str:
+    return text[:cap] + "..." if len(text) > cap else text
+
+
+def _render_source(stream: str, item: dict, cap: int) -> str:
+    """소스 1건 → 프롬프트 라인 (본문은 cap 글자로 절단)"""
+    if stream == "preprints":
+        lines = [f"- [{item.get('doi', '')}] {item.get('title', '')}"]
+        if item.get("abstract"):
+            # 임상 결과(PFS, OS, 환자수)는 보통 초록 후반에 위치 — 예산 내 최대한 유지
+            lines.append(f"  요약: {_clip(item['abstract'], cap)}")
+    elif stream == "market_reports":
+        lines = [f"- {item.get('title', '')}"]
+        if item.get("market_size_krw"):
+            lines.append(f"  시장 규모: {item['market_size_krw']}억 원")
+        if item.get("growth_rate"):
+            lines.append(f"  성장률: {item['growth_rate']}%")
+    else:
+        lines = [f"- [{item.get('source', '')}] {item.get('title', '')}"]
+        if item.get("summary"):
+            lines.append(f"  요약: {_clip(item['summary'], cap)}")
+    return "\n".join(lines)
+
+
+def pack_sources(
+    preprints: list[dict] | None = None,
+    market_reports: list[dict] | None = None,
+    expert_opinions: list[dict] | None = None,
+    budget_tokens: Optional[int] = None,
+) -> dict[str, str]:
+    """3개 소스 스트림을 하나의 정렬 목록으로 보고 토큰 예산 내에서 채움
+
+    (스트림 우선순위, 최신순, 관련도순)으로 정렬한 뒤 예산이 남는 동안
+    앞에서부터 담는다. 남은 예산이 줄수록 초록·요약 절단 길이도 줄인다.
+    프롬프트의 스트림별 섹션(B/C/D) 구성은 유지한다.
+
+    Returns:
+        {"preprint_data", "market_data", "expert_data"} 프롬프트 변수
+    """
+    budget = budget_tokens or settings.REASONING_SOURCE_BUDGET_TOKENS
+    given = {"preprints": preprints, "market_reports": market_reports,
+             "expert_opinions": expert_opinions}
+
+    ranked = [
+        (priority, stream, cap, item)
+        for priority, (stream, _, _, cap) in enumerate(_SOURCE_STREAMS)
+        for item in given[stream] or []
+    ]
+    # 안정 정렬 3회: 관련도 → 날짜 → 스트림 우선순위
+    ranked.sort(key=lambda r: r[3].get("relevance_score") or r[3].get("score") or 0, reverse=True)
+    ranked.sort(key=lambda r: str(r[3].get("published_date") or r[3].get("date") or ""), reverse=True)
+    ranked.sort(key=lambda r: r[0])
+
+    packed: dict[str, list[str]] = {stream: [] for stream, *_ in _SOURCE_STREAMS}
+    dropped: dict[str, int] = {stream: 0 for stream, *_ in _SOURCE_STREAMS}
+    remaining = budget
+    for _, stream, cap, item in ranked:
+        if cap:
+            cap = max(_MIN_TEXT_CAP, cap * remaining // budget)
+        text = _render_source(stream, item, cap)
+        tokens = count_tokens(text)
+        if tokens > remaining:
+            dropped[stream] += 1
+            continue
+        remaining -= tokens
+        packed[stream].append(text)
+
+    result = {}
+    for stream, var, empty, _ in _SOURCE_STREAMS:
+        lines = packed[stream]
+        if dropped[stream]:
+            lines.append(f"- (토큰 예산 초과로 {dropped[stream]}건 생략)")
+        result[var] = "\n".join(lines) if lines else empty
+    return result
@@ -0,0 +1,45 @@
+"""chat.completions 호출 공용 헬퍼
+
+verifier/writer 단건 호출(complete_text)과 briefing 스트리밍 인자(STREAM_KWARGS).
+스트리밍 응답의 usage는 stream_options.include_usage로 마지막 청크에서 받습니다.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from regscan.ai.breaker import call_with_retry
+
+if TYPE_CHECKING:
+    from regscan.ai.batch_runner import BatchCollector
+
+# stream=True 호출에 함께 넘기는 인자
+STREAM_KWARGS: dict[str, Any] = {
+    "stream": True,
+    "stream_options": {"include_usage": True},
+}
+
+
+def response_text(response) -> tuple[str, int]:
+    """비스트리밍 응답 → (본문, total_tokens)"""
+    tokens = response.usage.total_tokens if response.usage else 0
+    return response.choices[0].message.content, tokens
+
+
+async def complete_text(
+    get_client: Callable[[], Any],
+    batch: Optional[BatchCollector],
+    label: str,
+    **kwargs: Any,
+) -> tuple[str, int]:
+    """단건 chat.completions → (응답 본문, total_tokens)
+
+    batch 수집기가 있으면 Batch API 경유, 아니면 call_with_retry로 직접 호출.
+    JSON 응답은 완성돼야 파싱할 수 있으므로 스트리밍으로 받아도 이득이 없다.
+    """
+    if batch is not None:
+        return response_text(await batch.submit(kwargs, label=label))
+    response = await call_with_retry(
+        "openai", get_client().chat.completions.create, **kwargs,
+    )
+    return response_text(response)
@@ -0,0 +1,39 @@
+"""프롬프트 토큰 수 추정
+
+tiktoken(o200k_base — gpt-4o/o4-mini 계열 토크나이저)이 설치되어 있으면
+정확히 세고, 없으면 UTF-8 바이트 수 기반으로 보수적으로 근사합니다.
+"""
+
+from __future__ import annotations
+
+import logging
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _get_encoder():
+    """tiktoken 인코더 (프로세스당 1회 로드, 실패 시 None)"""
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("o200k_base")
+    except Exception as e:  # 미설치 또는 인코딩 파일 다운로드 실패
+        logger.debug("tiktoken 사용 불가 — 바이트 기반 토큰 추정: %s", e)
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """텍스트 토큰 수"""
+    if not text:
+        return 0
+    encoder = _get_encoder()
+    if encoder is not None:
+        return len(encoder.encode(text, disallowed_special=()))
+    # 영문 ~4바이트/토큰, 한글 ~3바이트/토큰 → 3바이트 기준으로 과대 추정
+    return len(text.encode("utf-8")) // 3 + 1
+
+
+def count_message_tokens(messages: list[dict[str, str]]) -> int:
+    """chat 메시지 목록의 프롬프트 토큰 수 (메시지당 포맷 오버헤드 포함)"""
+    return sum(count_tokens(m.get("content") or "") + 4 for m in messages) + 2
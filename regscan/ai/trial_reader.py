@@ -1,18 +1,35 @@
 """AI Trial Result Reader — 완료된 임상시험 결과 성공/실패 판독
 
 COMPLETED + HasResults 임상시험에 대해 LLM으로 Primary Outcome 판독.
+실시간이 필요 없는 대량 판독은 submit_batch()로 OpenAI Batch API(50% 할인)에
+제출하고, 스케줄러가 poll_batches()로 완료분을 수거해 판독 캐시에 저장합니다.
 """
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
+import re
 from typing import Any, Optional
 
+import orjson
+
+from regscan.ai.batch_runner import create_batch, fetch_batch_results, is_batch_failed
+from regscan.ai.breaker import call_with_retry
+from regscan.ai.cache import get_cache, get_or_set, prompt_key
+from regscan.ai.http_client import get_llm_http_client
 from regscan.config import settings
+from regscan.utils.serialization import dumps_str
 
 logger = logging.getLogger(__name__)
 
+ANTHROPIC_MODEL = "claude-sonnet-4-5-20250929"
+OPENAI_MODEL = "gpt-4o-mini"
+
+# get_or_set 응답 캐시 / 제출된 batch 목록 (batch_id → {nct_id: 캐시 키})
+_RESPONSE_CACHE = "llm_responses"
+_PENDING_BATCHES = "trial_batches"
+
 TRIAL_READER_PROMPT = """You are an expert clinical trial analyst. Analyze the following Phase 3 clinical trial data and determine if the trial was successful.
 
 **Trial Information:**
@@ -41,12 +58,37 @@ If you cannot determine success/failure from the available data, set success to
 """
 
 
+# 프롬프트 렌더러 — format_map에 변수 dict를 그대로 전달 (**kwargs 재구성 생략)
+_render_prompt = TRIAL_READER_PROMPT.format_map
+
+# 코드펜스(```json ... ```) 안의 JSON 객체
+_JSON_BLOCK_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+
+
+class _UnparsableResponseError(ValueError):
+    """JSON으로 파싱되지 않는 LLM 응답 — 캐시에 저장하지 않도록 factory에서 던짐"""
+
+    def __init__(self, text: str):
+        super().__init__("LLM 응답 JSON 파싱 실패")
+        self.text = text
+
+
 class TrialResultReader:
     """AI 기반 임상시험 결과 판독기"""
 
     def __init__(self):
         self._anthropic_client = None
         self._openai_client = None
+        self._http_client = None
+
+    def _sync_http_client(self) -> Any:
+        """공용 httpx 풀 — 이벤트 루프가 바뀌었으면 SDK 클라이언트 재생성"""
+        http_client = get_llm_http_client()
+        if self._http_client is not http_client:
+            self._anthropic_client = None
+            self._openai_client = None
+            self._http_client = http_client
+        return http_client
 
     async def read_trial(self, study: dict[str, Any]) -> dict[str, Any]:
         """단일 임상시험 AI 판독
@@ -57,30 +99,183 @@ class TrialResultReader:
         Returns:
             {success: bool|None, confidence: float, summary: str, primary_endpoint_met: bool|None}
         """
-        prompt = TRIAL_READER_PROMPT.format(
-            title=study.get("title", ""),
-            nct_id=study.get("nct_id", ""),
-            conditions=", ".join(study.get("conditions", [])),
-            interventions=json.dumps(study.get("interventions", []), ensure_ascii=False),
-            sponsor=study.get("sponsor", ""),
-            enrollment=study.get("enrollment", 0),
-            status=study.get("status", ""),
-        )
+        prompt = self._build_prompt(study)
 
         try:
-            result_text = await self._call_llm(prompt)
+            # 동일 프롬프트(같은 NCT 데이터) 재판독 시 LLM 응답 재사용 (파싱되는 응답만 캐시)
+            result_text = await get_or_set(
+                self._cache_key(prompt), lambda: self._call_llm_parsable(prompt), _RESPONSE_CACHE,
+            )
             return self._parse_result(result_text)
+        except _UnparsableResponseError as e:
+            return self._parse_result(e.text)
         except Exception as e:
             logger.warning("AI 임상결과 판독 실패 (%s): %s", study.get("nct_id"), e)
-            return {
-                "success": None,
-                "confidence": 0.0,
-                "summary": f"판독 실패: {e}",
-                "primary_endpoint_met": None,
+            return self._failure_result(e)
+
+    async def read_trials_batch(
+        self,
+        studies: list[dict[str, Any]],
+        concurrency: Optional[int] = None,
+    ) -> list[dict[str, Any]]:
+        """여러 임상시험 동시 판독 (입력 순서 유지)
+
+        Args:
+            studies: ClinicalTrialsGovParser 파싱 결과 목록
+            concurrency: 동시 LLM 호출 수 (None이면 settings.LLM_MAX_CONCURRENCY)
+
+        Returns:
+            read_trial()과 동일한 형식의 결과 목록
+        """
+        sem = asyncio.Semaphore(max(1, concurrency or settings.LLM_MAX_CONCURRENCY))
+
+        async def _one(study: dict[str, Any]) -> dict[str, Any]:
+            async with sem:
+                return await self.read_trial(study)
+
+        results = await asyncio.gather(
+            *(_one(s) for s in studies), return_exceptions=True,
+        )
+        out = []
+        for study, result in zip(studies, results):
+            if isinstance(result, BaseException):
+                logger.warning("AI 임상결과 판독 실패 (%s): %s", study.get("nct_id"), result)
+                result = self._failure_result(result)
+            out.append(result)
+        return out
+
+    async def submit_batch(self, studies: list[dict[str, Any]]) -> Optional[str]:
+        """여러 임상시험을 OpenAI Batch API로 일괄 제출 (≤24h, 50% 할인)
+
+        이미 판독 캐시에 있는 임상시험은 제외한다. 결과는 poll_batches()가
+        수거하여 read_trial()과 같은 캐시에 저장하므로, 완료 후 read_trial()은
+        LLM 호출 없이 바로 반환된다.
+
+        Returns:
+            batch id (제출할 건이 없거나 OPENAI_API_KEY 미설정이면 None)
+        """
+        if not settings.OPENAI_API_KEY:
+            logger.warning("OPENAI_API_KEY 미설정 — 임상결과 batch 제출 건너뜀")
+            return None
+
+        responses = get_cache(_RESPONSE_CACHE)
+        requests: dict[str, dict[str, Any]] = {}
+        keys: dict[str, str] = {}
+        for study in studies:
+            nct_id = study.get("nct_id")
+            if not nct_id or nct_id in requests:
+                continue
+            prompt = self._build_prompt(study)
+            key = self._cache_key(prompt)
+            if key in responses:
+                continue
+            requests[nct_id] = {
+                "model": OPENAI_MODEL,
+                "messages": [{"role": "user", "content": prompt}],
+                "max_tokens": 500,
             }
+            keys[nct_id] = key
+
+        if not requests:
+            return None
+
+        batch = await create_batch(self._get_openai_client(), requests)
+        get_cache(_PENDING_BATCHES).set(batch.id, keys)
+        return batch.id
+
+    async def collect_batch(self, batch_id: str) -> Optional[dict[str, dict[str, Any]]]:
+        """제출한 batch 결과 수거
+
+        Returns:
+            완료 시 {nct_id: 판독 결과}, 진행 중이면 None
+        """
+        pending = get_cache(_PENDING_BATCHES)
+        client = self._get_openai_client()
+        batch = await client.batches.retrieve(batch_id)
+        if is_batch_failed(batch):
+            pending.delete(batch_id)
+            raise RuntimeError(f"Batch {batch_id} 종료 상태: {batch.status}")
+        if batch.status != "completed":
+            return None
+
+        keys = pending.get(batch_id) or {}
+        responses = get_cache(_RESPONSE_CACHE)
+        ttl = settings.AI_CACHE_TTL_DAYS * 86400
+        results: dict[str, dict[str, Any]] = {}
+        for nct_id, body in (await fetch_batch_results(client, batch)).items():
+            text = (body.get("choices") or [{}])[0].get("message", {}).get("content") or ""
+            if nct_id in keys and self._parse_json(text) is not None:
+                responses.set(keys[nct_id], text, ttl=ttl)
+            results[nct_id] = self._parse_result(text)
+
+        pending.delete(batch_id)
+        logger.info("임상결과 batch 수거: %s (%d/%d건)", batch_id, len(results), len(keys))
+        return results
+
+    async def poll_batches(self) -> dict[str, dict[str, Any]]:
+        """등록된 모든 batch 확인 — 완료분 결과 병합 (스케줄러 주기 작업용)"""
+        merged: dict[str, dict[str, Any]] = {}
+        for batch_id in get_cache(_PENDING_BATCHES).keys():
+            try:
+                results = await self.collect_batch(batch_id)
+            except Exception as e:
+                logger.error("임상결과 batch 수거 실패 (%s): %s", batch_id, e)
+                continue
+            if results:
+                merged.update(results)
+        return merged
+
+    @staticmethod
+    def _build_prompt(study: dict[str, Any]) -> str:
+        """판독 프롬프트 (단건/batch 공용)"""
+        return _render_prompt({
+            "title": study.get("title", ""),
+            "nct_id": study.get("nct_id", ""),
+            "conditions": ", ".join(study.get("conditions", [])),
+            "interventions": dumps_str(study.get("interventions", [])),
+            "sponsor": study.get("sponsor", ""),
+            "enrollment": study.get("enrollment", 0),
+            "status": study.get("status", ""),
+        })
+
+    @staticmethod
+    def _cache_key(prompt: str) -> str:
+        return prompt_key(f"{ANTHROPIC_MODEL}|{OPENAI_MODEL}", prompt)
+
+    def _get_openai_client(self):
+        """OpenAI 클라이언트 lazy init (공용 httpx 풀)"""
+        http_client = self._sync_http_client()
+        if not self._openai_client:
+            import openai
+            # 재시도는 call_with_retry가 담당 — SDK 자체 재시도는 끔
+            self._openai_client = openai.AsyncOpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                http_client=http_client,
+                max_retries=0,
+            )
+        return self._openai_client
+
+    @staticmethod
+    def _failure_result(error: BaseException) -> dict[str, Any]:
+        """판독 실패 시 기본 결과"""
+        return {
+            "success": None,
+            "confidence": 0.0,
+            "summary": f"판독 실패: {error}",
+            "primary_endpoint_met": None,
+        }
+
+    async def _call_llm_parsable(self, prompt: str) -> str:
+        """_call_llm 결과가 JSON으로 파싱될 때만 반환, 아니면 _UnparsableResponseError"""
+        text = await self._call_llm(prompt)
+        if self._parse_json(text) is None:
+            raise _UnparsableResponseError(text)
+        return text
 
     async def _call_llm(self, prompt: str) -> str:
-        """LLM 호출 (Anthropic → OpenAI fallback)"""
+        """LLM 호출 (Anthropic → OpenAI fallback, 각각 429/5xx 재시도)"""
+        http_client = self._sync_http_client()
+
         # Anthropic 우선
         if settings.ANTHROPIC_API_KEY:
             try:
@@ -88,9 +283,12 @@ class TrialResultReader:
                 if not self._anthropic_client:
                     self._anthropic_client = anthropic.AsyncAnthropic(
                         api_key=settings.ANTHROPIC_API_KEY,
+                        http_client=http_client,
+                        max_retries=0,
                     )
-                response = await self._anthropic_client.messages.create(
-                    model="claude-sonnet-4-5-20250929",
+                response = await call_with_retry(
+                    "anthropic", self._anthropic_client.messages.create,
+                    model=ANTHROPIC_MODEL,
                     max_tokens=500,
                     messages=[{"role": "user", "content": prompt}],
                 )
@@ -101,13 +299,9 @@ class TrialResultReader:
         # OpenAI fallback
         if settings.OPENAI_API_KEY:
             try:
-                import openai
-                if not self._openai_client:
-                    self._openai_client = openai.AsyncOpenAI(
-                        api_key=settings.OPENAI_API_KEY,
-                    )
-                response = await self._openai_client.chat.completions.create(
-                    model="gpt-4o-mini",
+                response = await call_with_retry(
+                    "openai", self._get_openai_client().chat.completions.create,
+                    model=OPENAI_MODEL,
                     messages=[{"role": "user", "content": prompt}],
                     max_tokens=500,
                 )
@@ -117,27 +311,30 @@ class TrialResultReader:
 
         raise RuntimeError("LLM API 키 미설정 (ANTHROPIC_API_KEY 또는 OPENAI_API_KEY)")
 
+    @staticmethod
+    def _parse_json(text: str) -> Optional[dict[str, Any]]:
+        """LLM 응답에서 JSON 객체 추출 (펜스가 없으면 응답 전체), 실패 시 None"""
+        m = _JSON_BLOCK_RE.search(text)
+        try:
+            data = orjson.loads(m.group(1) if m else text.strip())
+        except ValueError:  # orjson.JSONDecodeError 포함
+            return None
+        return data if isinstance(data, dict) else None
+
     def _parse_result(self, text: str) -> dict[str, Any]:
         """LLM 응답 JSON 파싱"""
-        # JSON 블록 추출
-        text = text.strip()
-        if "```json" in text:
-            text = text.split("```json")[1].split("```")[0].strip()
-        elif "```" in text:
-            text = text.split("```")[1].split("```")[0].strip()
-
-        try:
-            data = json.loads(text)
-            return {
-                "success": data.get("success"),
-                "confidence": float(data.get("confidence", 0.0)),
-                "summary": str(data.get("summary", "")),
-                "primary_endpoint_met": data.get("primary_endpoint_met"),
-            }
-        except (json.JSONDecodeError, ValueError):
+        data = self._parse_json(text)
+        if data is None:
+            m = _JSON_BLOCK_RE.search(text)
             return {
                 "success": None,
                 "confidence": 0.0,
-                "summary": text[:200],
+                "summary": (m.group(1) if m else text.strip())[:200],
                 "primary_endpoint_met": None,
             }
+        return {
+            "success": data.get("success"),
+            "confidence": float(data.get("confidence", 0.0)),
+            "summary": str(data.get("summary", "")),
+            "primary_endpoint_met": data.get("primary_endpoint_met"),
+        }
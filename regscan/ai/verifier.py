@@ -5,18 +5,39 @@ o4-mini 추론 결과를 원본 데이터와 대조 검증합니다.
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 from typing import Any, Optional
 
+import orjson
+
 from regscan.config import settings
+from regscan.utils.serialization import dumps_str
+from regscan.ai.batch_runner import BatchCollector
+from regscan.ai.breaker import call_with_retry, get_breaker
+from regscan.ai.http_client import get_llm_http_client
+from regscan.ai.streaming import complete_text
+from regscan.ai.cache import content_key, get_result, put_result
+from regscan.ai.sources import MIN_SOURCE_BUDGET, pack_sources
+from regscan.ai.tokens import count_message_tokens
 from regscan.ai.prompts.verifier_prompt import (
     VERIFIER_SYSTEM_PROMPT,
+    VERIFIER_GUIDE_PROMPT,
     VERIFIER_PROMPT,
+    VERIFIER_DATA_BLOCK,
+    VERIFIER_BATCH_PROMPT,
 )
 
 logger = logging.getLogger(__name__)
 
+# 프롬프트 렌더러 — format_map에 변수 dict를 그대로 전달 (**kwargs 재구성 생략)
+_render_prompt = VERIFIER_PROMPT.format_map
+_render_data_block = VERIFIER_DATA_BLOCK.format_map
+_render_batch_prompt = VERIFIER_BATCH_PROMPT.format_map
+
+# OpenAI 프롬프트 캐시 라우팅 키 — 동일 prefix 요청을 같은 캐시로 유도
+_PROMPT_CACHE_KEY = "regscan-verifier"
+
 
 class InsightVerifier:
     """GPT-5.2 기반 인사이트 검증기
@@ -33,19 +54,46 @@ class InsightVerifier:
         self.model = model or settings.VERIFIER_MODEL
         self.api_key = api_key or settings.OPENAI_API_KEY
         self._client = None
+        self._http_client = None
+        # OpenAI Batch API 수집기 (설정 시 요청을 모아 일괄 제출)
+        self.batch: Optional[BatchCollector] = None
 
     def _get_client(self):
-        """OpenAI 클라이언트 lazy init"""
-        if self._client is None:
+        """OpenAI 클라이언트 lazy init (공용 httpx 풀 사용, 루프 변경 시 재생성)"""
+        http_client = get_llm_http_client()
+        if self._client is None or (
+            self._http_client is not None and self._http_client is not http_client
+        ):
             try:
                 from openai import AsyncOpenAI
-                self._client = AsyncOpenAI(api_key=self.api_key)
+                # 재시도는 call_with_retry가 담당 — SDK 자체 재시도와 곱해지지 않게 끔
+                self._client = AsyncOpenAI(
+                    api_key=self.api_key, http_client=http_client, max_retries=0,
+                )
+                self._http_client = http_client
             except ImportError:
                 raise ImportError(
                     "openai 패키지가 필요합니다. pip install 'regscan[llm]'"
                 )
         return self._client
 
+    @staticmethod
+    def _messages(prompt: str) -> list[dict[str, str]]:
+        """고정 system 프롬프트 2개 + 약물별 user 프롬프트 (캐시 prefix 유지)"""
+        return [
+            {"role": "system", "content": VERIFIER_SYSTEM_PROMPT},
+            {"role": "system", "content": VERIFIER_GUIDE_PROMPT},
+            {"role": "user", "content": prompt},
+        ]
+
+    async def _create_completion(self, **kwargs):
+        """chat.completions 호출 (batch 수집기 설정 시 Batch API 경유, 아니면 재시도·회로 차단)"""
+        if self.batch is not None:
+            return await self.batch.submit(kwargs, label="verifier")
+        return await call_with_retry(
+            "openai", self._get_client().chat.completions.create, **kwargs,
+        )
+
     async def verify(
         self,
         drug: dict[str, Any],
@@ -67,57 +115,44 @@ class InsightVerifier:
             logger.warning("OPENAI_API_KEY 미설정 — verification 건너뜀")
             return self._fallback_result(reasoning_result)
 
-        raw_sources = raw_sources or {}
+        cache_key = self._cache_key(drug, reasoning_result, raw_sources)
+        cached = get_result(cache_key)
+        if cached is not None:
+            logger.debug("Verification 캐시 히트: %s", drug.get("inn", "?"))
+            return cached
 
-        prompt = VERIFIER_PROMPT.format(
-            reasoning_result=json.dumps(reasoning_result, ensure_ascii=False, default=str),
-            regulatory_data=json.dumps(
-                {k: drug.get(k) for k in [
-                    "inn", "fda_approved", "fda_date", "ema_approved", "ema_date",
-                    "mfds_approved", "mfds_date", "hira_status", "hira_price",
-                ]},
-                ensure_ascii=False, default=str,
-            ),
-            preprint_data=json.dumps(
-                raw_sources.get("preprints", [])[:5],
-                ensure_ascii=False, default=str,
-            ),
-            market_data=json.dumps(
-                raw_sources.get("market_reports", [])[:3],
-                ensure_ascii=False, default=str,
-            ),
-            expert_data=json.dumps(
-                raw_sources.get("expert_opinions", [])[:3],
-                ensure_ascii=False, default=str,
-            ),
-            original_score=reasoning_result.get("impact_score", 0),
-        )
+        if self.batch is None and get_breaker("openai").is_open:
+            logger.warning("OpenAI 회로 개방 — verification 건너뜀 (%s)", drug.get("inn", "?"))
+            return self._fallback_result(reasoning_result)
+
+        messages, prompt_tokens = self._build_messages(drug, reasoning_result, raw_sources)
+        if messages is None:
+            return self._fallback_result(reasoning_result)
 
         try:
-            client = self._get_client()
-            response = await client.chat.completions.create(
+            result_text, tokens = await complete_text(
+                self._get_client, self.batch, "verifier",
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": VERIFIER_SYSTEM_PROMPT},
-                    {"role": "user", "content": prompt},
-                ],
+                messages=messages,
                 temperature=0.2,
                 response_format={"type": "json_object"},
+                extra_body={"prompt_cache_key": _PROMPT_CACHE_KEY},
             )
 
-            result_text = response.choices[0].message.content
-            tokens = response.usage.total_tokens if response.usage else 0
-
-            result = json.loads(result_text)
+            result = orjson.loads(result_text)
             result["verifier_model"] = self.model
             result["verifier_tokens"] = tokens
+            put_result(cache_key, result)
 
             logger.info(
-                "Verification 완료: %s, original=%d → verified=%d, confidence=%s",
+                "Verification 완료: %s, original=%d → verified=%d, confidence=%s, "
+                "tokens=%d (prompt 추정 %d)",
                 drug.get("inn", "?"),
                 reasoning_result.get("impact_score", 0),
                 result.get("verified_score", 0),
                 result.get("confidence_level", "?"),
+                tokens,
+                prompt_tokens,
             )
             return result
 
@@ -125,6 +160,196 @@ class InsightVerifier:
             logger.error("Verification 실패 (%s): %s", drug.get("inn", "?"), e)
             return self._fallback_result(reasoning_result)
 
+    async def verify_batch(
+        self,
+        items: list[tuple[dict[str, Any], dict[str, Any], dict[str, Any] | None]],
+        batch_size: Optional[int] = None,
+    ) -> list[dict[str, Any]]:
+        """여러 약물의 추론 결과를 묶음 호출로 검증
+
+        Args:
+            items: (drug, reasoning_result, raw_sources) 목록
+            batch_size: 요청당 약물 수 (None이면 settings.REASONING_BATCH_SIZE)
+
+        Returns:
+            입력 순서대로 verify()와 동일한 형식의 결과 목록
+        """
+        if not self.api_key:
+            logger.warning("OPENAI_API_KEY 미설정 — verification 건너뜀")
+            return [self._fallback_result(reasoning) for _, reasoning, _ in items]
+
+        results: list[Optional[dict[str, Any]]] = [
+            get_result(self._cache_key(*item)) for item in items
+        ]
+        todo = [i for i, r in enumerate(results) if r is None]
+
+        if todo and self.batch is None and get_breaker("openai").is_open:
+            logger.warning("OpenAI 회로 개방 — verification 묶음 건너뜀 (%d건)", len(todo))
+            for i in todo:
+                results[i] = self._fallback_result(items[i][1])
+            return results
+
+        size = max(1, batch_size or settings.REASONING_BATCH_SIZE)
+        chunks = [todo[i:i + size] for i in range(0, len(todo), size)]
+        chunk_results = await asyncio.gather(
+            *(self._verify_chunk([items[i] for i in chunk]) for chunk in chunks)
+        )
+        for chunk, chunk_result in zip(chunks, chunk_results):
+            for i, result in zip(chunk, chunk_result):
+                results[i] = result
+        return results
+
+    async def _verify_chunk(
+        self,
+        items: list[tuple[dict[str, Any], dict[str, Any], dict[str, Any] | None]],
+    ) -> list[dict[str, Any]]:
+        """묶음 1회 호출. 누락·실패 약물은 단건 호출로 fallback."""
+        if len(items) == 1:
+            drug, reasoning, raw = items[0]
+            return [await self.verify(drug, reasoning, raw)]
+
+        blocks = [
+            f"### [d{i}]\n"
+            + _render_data_block(self._prompt_vars(drug, reasoning, raw))
+            for i, (drug, reasoning, raw) in enumerate(items)
+        ]
+        prompt = _render_batch_prompt(
+            {"count": len(items), "data_blocks": "\n\n".join(blocks)},
+        )
+        messages = self._messages(prompt)
+        prompt_tokens = count_message_tokens(messages)
+        if prompt_tokens > settings.REASONING_CTX_BUDGET:
+            logger.info(
+                "Verification 묶음 프롬프트 %d토큰 > 예산 %d — 단건 호출로 분할",
+                prompt_tokens, settings.REASONING_CTX_BUDGET,
+            )
+            return list(await asyncio.gather(*(self.verify(*item) for item in items)))
+
+        parsed: dict[str, Any] = {}
+        tokens = 0
+        try:
+            response = await self._create_completion(
+                model=self.model,
+                messages=messages,
+                temperature=0.2,
+                response_format={"type": "json_object"},
+                extra_body={"prompt_cache_key": _PROMPT_CACHE_KEY},
+            )
+            tokens = response.usage.total_tokens if response.usage else 0
+            # 묶음 응답은 커질 수 있어 orjson으로 파싱
+            parsed = orjson.loads(response.choices[0].message.content)
+        except Exception as e:
+            logger.error("Verification 묶음 호출 실패 (%d건): %s", len(items), e)
+
+        results: list[Optional[dict[str, Any]]] = []
+        missing = []
+        for i in range(len(items)):
+            item = parsed.get(f"d{i}") if isinstance(parsed, dict) else None
+            if isinstance(item, dict) and "verified_score" in item:
+                item["verifier_model"] = self.model
+                item["verifier_tokens"] = tokens // len(items)
+                put_result(self._cache_key(*items[i]), item)
+                results.append(item)
+            else:
+                results.append(None)
+                missing.append(i)
+
+        if missing:
+            logger.info("Verification 묶음 누락 %d건 — 단건 재시도", len(missing))
+            retried = await asyncio.gather(*(self.verify(*items[i]) for i in missing))
+            for i, result in zip(missing, retried):
+                results[i] = result
+
+        return results
+
+    def _cache_key(
+        self,
+        drug: dict[str, Any],
+        reasoning_result: dict[str, Any],
+        raw_sources: dict[str, Any] | None = None,
+    ) -> str:
+        """결과 캐시 키 — 프롬프트 입력 + 모델명 (캐시 히트 표시는 제외)"""
+        reasoning = {k: v for k, v in reasoning_result.items() if k != "cached"}
+        return content_key(
+            "verifier", self.model, self._prompt_vars(drug, reasoning, raw_sources),
+        )
+
+    def _build_messages(
+        self,
+        drug: dict[str, Any],
+        reasoning_result: dict[str, Any],
+        raw_sources: dict[str, Any] | None = None,
+    ) -> tuple[Optional[list[dict[str, str]]], int]:
+        """단건 검증 메시지 + 프롬프트 토큰 수
+
+        REASONING_CTX_BUDGET을 넘으면 원본 소스를 토큰 예산 내로 재포장해
+        1회 재계산한다. 그래도 넘으면 (None, 토큰 수).
+        """
+        original_score = reasoning_result.get("impact_score", 0)
+        prompt_vars = self._prompt_vars(drug, reasoning_result, raw_sources)
+        prompt_vars["original_score"] = original_score
+        messages = self._messages(_render_prompt(prompt_vars))
+        prompt_tokens = count_message_tokens(messages)
+        ctx_budget = settings.REASONING_CTX_BUDGET
+        if prompt_tokens <= ctx_budget:
+            return messages, prompt_tokens
+
+        source_budget = max(
+            MIN_SOURCE_BUDGET,
+            settings.REASONING_SOURCE_BUDGET_TOKENS - (prompt_tokens - ctx_budget),
+        )
+        logger.warning(
+            "Verification 프롬프트 %d토큰 > 예산 %d (%s) — 소스 %d토큰으로 재포장",
+            prompt_tokens, ctx_budget, drug.get("inn", "?"), source_budget,
+        )
+        prompt_vars = self._prompt_vars(drug, reasoning_result, raw_sources, source_budget)
+        prompt_vars["original_score"] = original_score
+        messages = self._messages(_render_prompt(prompt_vars))
+        prompt_tokens = count_message_tokens(messages)
+        if prompt_tokens > ctx_budget:
+            logger.error(
+                "Verification 프롬프트 재포장 후에도 %d토큰 (%s) — 호출 생략",
+                prompt_tokens, drug.get("inn", "?"),
+            )
+            return None, prompt_tokens
+        return messages, prompt_tokens
+
+    @staticmethod
+    def _prompt_vars(
+        drug: dict[str, Any],
+        reasoning_result: dict[str, Any],
+        raw_sources: dict[str, Any] | None = None,
+        source_budget: Optional[int] = None,
+    ) -> dict[str, str]:
+        """약물 1건의 검증 프롬프트 변수 (단건/묶음 프롬프트 공용)
+
+        source_budget이 주어지면 원본 소스를 JSON 대신 pack_sources로 축약.
+        """
+        raw_sources = raw_sources or {}
+        if source_budget is not None:
+            sources = pack_sources(
+                raw_sources.get("preprints"),
+                raw_sources.get("market_reports"),
+                raw_sources.get("expert_opinions"),
+                source_budget,
+            )
+        else:
+            sources = {
+                "preprint_data": dumps_str(raw_sources.get("preprints", [])[:5]),
+                "market_data": dumps_str(raw_sources.get("market_reports", [])[:3]),
+                "expert_data": dumps_str(raw_sources.get("expert_opinions", [])[:3]),
+            }
+        return {
+            "reasoning_result": dumps_str(reasoning_result),
+            "regulatory_data": dumps_str(
+                {k: drug.get(k) for k in [
+                    "inn", "fda_approved", "fda_date", "ema_approved", "ema_date",
+                    "mfds_approved", "mfds_date", "hira_status", "hira_price",
+                ]},
+            ),
+            **sources,
+        }
+
     def _fallback_result(self, reasoning_result: dict) -> dict:
         """API 실패 시 기본 검증 결과 반환"""
         return {
@@ -6,11 +6,18 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from typing import Any, Optional
 
+import orjson
+
 from regscan.config import settings
+from regscan.utils.serialization import dumps_str
+from regscan.ai.batch_runner import BatchCollector
+from regscan.ai.breaker import get_breaker
+from regscan.ai.http_client import get_llm_http_client
+from regscan.ai.streaming import complete_text
+from regscan.ai.cache import get_result, prompt_key, put_result
 from regscan.ai.prompts.writer_prompt import (
     WRITER_SYSTEM_PROMPT,
     BRIEFING_WRITER_PROMPT,
@@ -19,6 +26,9 @@ from regscan.ai.prompts.writer_prompt import (
 
 logger = logging.getLogger(__name__)
 
+# 프롬프트 렌더러 — format_map에 변수 dict를 그대로 전달 (**kwargs 재구성 생략)
+_render_prompt = BRIEFING_WRITER_PROMPT.format_map
+
 
 class WritingEngine:
     """GPT-5.2 기반 기사 작성 엔진"""
@@ -31,13 +41,23 @@ class WritingEngine:
         self.model = model or settings.WRITER_MODEL
         self.api_key = api_key or settings.OPENAI_API_KEY
         self._client = None
+        self._http_client = None
+        # OpenAI Batch API 수집기 (설정 시 요청을 모아 일괄 제출)
+        self.batch: Optional[BatchCollector] = None
 
     def _get_client(self):
-        """OpenAI 클라이언트 lazy init"""
-        if self._client is None:
+        """OpenAI 클라이언트 lazy init (공용 httpx 풀 사용, 루프 변경 시 재생성)"""
+        http_client = get_llm_http_client()
+        if self._client is None or (
+            self._http_client is not None and self._http_client is not http_client
+        ):
             try:
                 from openai import AsyncOpenAI
-                self._client = AsyncOpenAI(api_key=self.api_key)
+                # 재시도는 call_with_retry가 담당 — SDK 자체 재시도와 곱해지지 않게 끔
+                self._client = AsyncOpenAI(
+                    api_key=self.api_key, http_client=http_client, max_retries=0,
+                )
+                self._http_client = http_client
             except ImportError:
                 raise ImportError(
                     "openai 패키지가 필요합니다. pip install 'regscan[llm]'"
@@ -65,18 +85,22 @@ class WritingEngine:
             logger.warning("OPENAI_API_KEY 미설정 — writing 건너뜀")
             return self._fallback_result(drug, article_type)
 
-        source_summary = self._build_source_summary(drug, verified_insight)
+        prompt = self._build_prompt(drug, verified_insight, article_type)
 
-        prompt = BRIEFING_WRITER_PROMPT.format(
-            article_type=article_type,
-            drug_name=drug.get("inn", "Unknown"),
-            verified_insight=json.dumps(verified_insight, ensure_ascii=False, default=str),
-            source_summary=source_summary,
-        )
+        # 렌더링된 프롬프트가 지난 실행과 같으면 API 호출 생략
+        cache_key = self._cache_key(prompt)
+        cached = get_result(cache_key)
+        if cached is not None:
+            logger.debug("기사 캐시 히트: %s [%s]", drug.get("inn", "?"), article_type)
+            return cached
+
+        if self.batch is None and get_breaker("openai").is_open:
+            logger.warning("OpenAI 회로 개방 — writing 건너뜀 (%s)", drug.get("inn", "?"))
+            return self._fallback_result(drug, article_type)
 
         try:
-            client = self._get_client()
-            response = await client.chat.completions.create(
+            result_text, tokens = await complete_text(
+                self._get_client, self.batch, "writer",
                 model=self.model,
                 messages=[
                     {"role": "system", "content": WRITER_SYSTEM_PROMPT},
@@ -87,13 +111,11 @@ class WritingEngine:
                 response_format={"type": "json_object"},
             )
 
-            result_text = response.choices[0].message.content
-            tokens = response.usage.total_tokens if response.usage else 0
-
-            result = json.loads(result_text)
+            result = orjson.loads(result_text)
             result["article_type"] = article_type
             result["writer_model"] = self.model
             result["writer_tokens"] = tokens
+            put_result(cache_key, result)
 
             logger.info(
                 "기사 작성 완료: %s [%s], headline=%s, tokens=%d",
@@ -111,6 +133,29 @@ class WritingEngine:
             )
             return self._fallback_result(drug, article_type)
 
+    def cached_article(
+        self,
+        drug: dict[str, Any],
+        verified_insight: dict[str, Any],
+        article_type: str = "briefing",
+    ) -> Optional[dict[str, Any]]:
+        """write_article()이 캐시에서 바로 돌려줄 기사 (없으면 None) — 일일 한도 선점 전 확인용"""
+        return get_result(self._cache_key(self._build_prompt(drug, verified_insight, article_type)))
+
+    def _build_prompt(
+        self, drug: dict[str, Any], verified_insight: dict[str, Any], article_type: str,
+    ) -> str:
+        """기사 작성 프롬프트 (렌더링 결과가 캐시 키 입력)"""
+        return _render_prompt({
+            "article_type": article_type,
+            "drug_name": drug.get("inn", "Unknown"),
+            "verified_insight": dumps_str(verified_insight),
+            "source_summary": self._build_source_summary(drug, verified_insight),
+        })
+
+    def _cache_key(self, prompt: str) -> str:
+        return prompt_key(self.model, WRITER_SYSTEM_PROMPT, WRITER_FEW_SHOT, prompt)
+
     def _fallback_result(self, drug: dict, article_type: str) -> dict:
         """API 실패 시 기본 기사 반환"""
         inn = drug.get("inn", "Unknown")
@@ -5,38 +5,199 @@
 2. PG 모드 (settings.is_postgres == True): 카운트만 캐시, 나머지 온디맨드 DB 쿼리
 """
 
-import json
+from __future__ import annotations
+
+import asyncio
+import hashlib
 import logging
-from datetime import datetime
+import math
+import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
 from pathlib import Path
-from typing import Optional
+from typing import (
+    TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Hashable, Iterable, Iterator, Optional,
+)
 
-from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
+import orjson
+from fastapi import HTTPException, Request, Response
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import joinedload, selectinload
 
 from regscan.config import settings
 from regscan.db.database import get_async_session
 from regscan.db.models import DrugDB, RegulatoryEventDB, HIRAReimbursementDB, ClinicalTrialDB
 from regscan.map.ingredient_bridge import ReimbursementStatus
-from regscan.parse.fda_parser import FDADrugParser
-from regscan.parse.ema_parser import EMAMedicineParser
-from regscan.parse.mfds_parser import MFDSPermitParser
-from regscan.parse.cris_parser import CRISTrialParser
-from regscan.map.global_status import merge_global_status, GlobalRegulatoryStatus
 from regscan.scan.domestic import (
-    DomesticImpactAnalyzer,
     DomesticImpact,
     DomesticStatus,
     ClinicalTrialInfo,
 )
 
+if TYPE_CHECKING:
+    from regscan.map.global_status import GlobalRegulatoryStatus
+    from regscan.scan.domestic import DomesticImpactAnalyzer
+
 logger = logging.getLogger(__name__)
 
+# PG 모드 drugs 스트리밍 조회 시 한 번에 가져오는 행 수 (selectinload도 청크 단위)
+_DRUG_STREAM_CHUNK = 1000
+
+# JSON 모드 DataStore.search 부분 일치 인덱스 n-gram 길이
+_NGRAM = 3
+
+# PG 모드 aget_by_inn 프로세스 내 캐시 — 미등록 INN은 짧게 캐시해 신규 약물 반영
+# 다른 프로세스의 DB 적재(batch 파이프라인 등)는 무효화 신호가 없어 TTL 만료로만 반영
+_INN_CACHE_SIZE = 512
+_INN_CACHE_TTL = 300.0  # 초
+_INN_CACHE_MISS_TTL = 60.0
+
+# /drugs/{inn}/briefing·insight·article 응답 캐시 — 파이프라인 완료 시 비움
+_RESPONSE_CACHE_SIZE = 1024
+_RESPONSE_CACHE_TTL = 3600.0  # 초
+
+# /stats·/hot-issues·/drugs 목록 응답 바이트 스냅샷 — 로드 단위로 유지, 파라미터 조합 수 상한
+_SNAPSHOT_MAX_KEYS = 256
+
+# /stats 핫이슈 집계 기준 점수 (get_hot_issues 기본값과 동일)
+_HOT_ISSUE_MIN_SCORE = 60
+
+_MISSING = object()
+
+
+class _TTLCache:
+    """키 → 값 TTL + LRU 캐시 (maxsize 초과 시 가장 오래 쓰지 않은 항목부터 제거)
+
+    ttl은 set()의 기본 만료 시간(초) — 항목별로 다른 ttl을 줄 수 있다.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable):
+        """캐시 값 반환, 없거나 만료면 _MISSING"""
+        entry = self._data.get(key)
+        if entry is None:
+            return _MISSING
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return _MISSING
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+class ResponseCache(_TTLCache):
+    """요청 키 → API 응답 TTL + LRU 캐시 (LLM 호출·DB 조회 결과 재사용)
+
+    같은 키의 동시 요청은 키별 asyncio.Lock으로 묶어 생성은 한 번만 한다.
+    info는 스케줄러 상태에 그대로 노출되는 통계 dict (제자리 갱신).
+    """
+
+    def __init__(self, maxsize: int = _RESPONSE_CACHE_SIZE, ttl: float = _RESPONSE_CACHE_TTL):
+        super().__init__(maxsize, ttl)
+        self._pending: dict[Hashable, list] = {}  # 키 → [Lock, 대기 요청 수]
+        self.info = {"maxsize": maxsize, "ttl": ttl, "currsize": 0, "hits": 0, "misses": 0}
+
+    def get(self, key: Hashable):
+        """캐시 값 반환, 없거나 만료면 _MISSING (적중 통계 갱신)"""
+        value = super().get(key)
+        self.info["hits" if value is not _MISSING else "misses"] += 1
+        self.info["currsize"] = len(self._data)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        super().set(key, value, ttl)
+        self.info["currsize"] = len(self._data)
+
+    async def get_or_set(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """캐시 값, 없으면 factory() 결과를 저장 후 반환 (예외·취소 시 저장 안 함)"""
+        value = self.get(key)
+        if value is not _MISSING:
+            return value
+
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = self._pending[key] = [asyncio.Lock(), 0]
+        pending[1] += 1
+        try:
+            async with pending[0]:
+                # 앞선 요청이 채웠으면 재사용 (통계 중복 집계 없이 조회)
+                value = super().get(key)
+                if value is not _MISSING:
+                    return value
+                value = await factory()
+                self.set(key, value)
+                return value
+        finally:
+            pending[1] -= 1
+            if pending[1] == 0:
+                del self._pending[key]
+
+    def clear(self) -> None:
+        super().clear()
+        self.info["currsize"] = 0
+
+
+briefing_cache = ResponseCache()
+
 
 def _find_latest(directory: Path, pattern: str) -> Optional[Path]:
-    """디렉토리에서 패턴과 일치하는 가장 최근 파일 반환"""
-    files = sorted(directory.glob(pattern))
-    return files[-1] if files else None
+    """디렉토리에서 패턴과 일치하는 가장 최근 파일 반환 (파일명 날짜 기준 최댓값)"""
+    return max(directory.glob(pattern), default=None)
+
+
+# 이 크기 이상의 JSON 배열 파일은 ijson으로 레코드 단위 스트리밍 파싱
+_STREAM_MIN_BYTES = 10 * 1024 * 1024
+
+
+def _iter_json_items(path: Path, ijson) -> Iterator[dict[str, Any]]:
+    """JSON 배열 파일의 원소를 하나씩 yield (파일 전체를 메모리에 올리지 않음)"""
+    with open(path, "rb") as f:
+        yield from ijson.items(f, "item", use_float=True)
+
+
+def _load_records(path: Path) -> Iterable[dict[str, Any]]:
+    """JSON 배열 파일 → 레코드 iterable
+
+    작은 파일은 orjson으로 한 번에 파싱(지연 최소), _STREAM_MIN_BYTES 이상은
+    ijson이 설치되어 있으면 스트리밍(피크 메모리 ≈ 레코드 1건).
+    """
+    if path.stat().st_size >= _STREAM_MIN_BYTES:
+        try:
+            import ijson
+        except ImportError:  # 선택 의존성 — 없으면 일괄 파싱
+            pass
+        else:
+            return _iter_json_items(path, ijson)
+    return orjson.loads(path.read_bytes())
+
+
+def _page_end(end: int, offset: int, limit: Optional[int]) -> int:
+    """정렬 뷰 [0, end) 구간에서 offset부터 limit건의 끝 위치"""
+    return end if limit is None else min(end, offset + limit)
+
+
+def _load_source(parser: Any, path: Path) -> list:
+    """소스 파일 1개 읽기 + 파싱 (DataStore.load 워커 스레드에서 실행)"""
+    return parser.parse_many(_load_records(path))
 
 
 class DataStore:
@@ -53,6 +214,25 @@ class DataStore:
 
         # 인덱스 (JSON 모드에서만 사용)
         self._by_inn: dict[str, DomesticImpact] = {}
+        # search용 (casefold INN, impact) — 로드 순서 / INN 정렬(prefix 이분 탐색)
+        self._search_pairs: list[tuple[str, DomesticImpact]] = []
+        self._search_sorted: list[tuple[str, DomesticImpact]] = []
+        self._search_keys: list[str] = []
+        self._trigrams: dict[str, set[int]] = {}
+        # 정렬 뷰 — global_score 내림차순 / 도입 임박 / hira_price 내림차순
+        self._by_score: list[DomesticImpact] = []
+        self._imminent: list[DomesticImpact] = []
+        self._by_price: list[DomesticImpact] = []
+        # 정렬 뷰와 나란한 음수 키 열 (오름차순) — 임계치 경계를 이분 탐색
+        self._score_keys: list[int] = []
+        self._price_keys: list[float] = []
+        # HIRA 급여 상태별 버킷 (로드 순서) — hira_status 값 문자열 키
+        self._by_status: dict[str, list[DomesticImpact]] = {}
+        self._reimbursed: list[DomesticImpact] = []
+        # aget_by_inn 결과 캐시 (PG 모드)
+        self._inn_cache = _TTLCache(_INN_CACHE_SIZE, _INN_CACHE_TTL)
+        # 직렬화된 응답 (body, ETag) — 데이터가 바뀌면 비움 (재로드는 새 DataStore)
+        self._snapshots: dict[Hashable, tuple[bytes, str]] = {}
 
         # 메타
         self.loaded_at: Optional[datetime] = None
@@ -61,6 +241,10 @@ class DataStore:
         self.mfds_count = 0
         self.cris_count = 0
         self.drug_count = 0
+        # /stats 카운트 — JSON 모드는 인덱스 빌드 시, PG 모드는 aload_counts 집계 쿼리 1회
+        self.hot_issues_count = 0
+        self.imminent_count = 0
+        self.reimbursed_count = 0
 
     # ──────────────────────────────────────────────
     # JSON 모드 (동기) — 기존 동작 유지
@@ -68,6 +252,14 @@ class DataStore:
 
     def load(self, data_dir: Path) -> None:
         """데이터 로드 - 각 소스의 최신 파일을 자동 탐색"""
+        # JSON 모드 전용 — PG 모드 기동 시에는 파서/병합 모듈을 import하지 않음
+        from regscan.map.global_status import merge_global_status
+        from regscan.parse.cris_parser import CRISTrialParser
+        from regscan.parse.ema_parser import EMAMedicineParser
+        from regscan.parse.fda_parser import FDADrugParser
+        from regscan.parse.mfds_parser import MFDSPermitParser
+        from regscan.scan.domestic import DomesticImpactAnalyzer
+
         # 최신 파일 자동 탐색
         files = {
             "fda": _find_latest(data_dir / "fda", "approvals_*.json"),
@@ -79,21 +271,32 @@ class DataStore:
             "cris": _find_latest(data_dir / "cris", "trials_full_*.json"),
         }
 
-        # 로드
-        raw_data = {}
-        for key, path in files.items():
-            if path and path.exists():
-                with open(path, encoding="utf-8") as f:
-                    raw_data[key] = json.load(f)
-                logger.info(f"[DataStore] {key} 로드: {path.name}")
-            else:
-                logger.warning(f"[DataStore] {key} 데이터 파일 없음")
-
-        # 파싱
-        fda_parsed = FDADrugParser().parse_many(raw_data.get("fda", []))
-        ema_parsed = EMAMedicineParser().parse_many(raw_data.get("ema", []))
-        mfds_parsed = MFDSPermitParser().parse_many(raw_data.get("mfds", []))
-        cris_parsed = CRISTrialParser().parse_many(raw_data.get("cris", []))
+        # 로드 + 파싱 (큰 파일은 레코드 단위로 읽으면서 바로 파싱)
+        # 소스끼리 독립적이므로 스레드로 동시에 실행해 디스크 읽기를 겹친다
+        parsers = {
+            "fda": FDADrugParser(),
+            "ema": EMAMedicineParser(),
+            "mfds": MFDSPermitParser(),
+            "cris": CRISTrialParser(),
+        }
+        jobs = {key: path for key, path in files.items() if path and path.exists()}
+        parsed = {key: [] for key in files}
+        if jobs:
+            with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+                futures = {
+                    key: pool.submit(_load_source, parsers[key], path)
+                    for key, path in jobs.items()
+                }
+                for key, future in futures.items():
+                    parsed[key] = future.result()
+                    logger.info(f"[DataStore] {key} 로드: {jobs[key].name}")
+        for key in (k for k in files if k not in jobs):
+            logger.warning(f"[DataStore] {key} 데이터 파일 없음")
+
+        fda_parsed = parsed["fda"]
+        ema_parsed = parsed["ema"]
+        mfds_parsed = parsed["mfds"]
+        cris_parsed = parsed["cris"]
 
         self.fda_count = len(fda_parsed)
         self.ema_count = len(ema_parsed)
@@ -112,52 +315,129 @@ class DataStore:
         self.analyzer.load_cris_data(cris_parsed)
         self.impacts = self.analyzer.analyze_batch(self.statuses)
 
-        # 인덱스 생성
-        self._by_inn = {
-            impact.inn.lower(): impact
-            for impact in self.impacts
-            if impact.inn
-        }
+        self._build_indexes()
 
         self.drug_count = len(self.impacts)
         self.loaded_at = datetime.now()
 
+    def _build_indexes(self) -> None:
+        """impacts 기반 조회 인덱스 생성 (casefold: 유니코드 대소문자 무시 비교)"""
+        self._snapshots.clear()
+        # casefold 키는 한 번만 만들고 _search_pairs / _by_inn / _search_sorted가 같은 문자열 객체를 공유
+        self._search_pairs = [
+            (impact.inn.casefold(), impact) for impact in self.impacts if impact.inn
+        ]
+        self._by_inn = dict(self._search_pairs)
+        self._search_sorted = sorted(self._search_pairs, key=lambda pair: pair[0])
+        self._search_keys = [key for key, _ in self._search_sorted]
+        # 부분 일치용 3-gram 역인덱스: trigram → _search_pairs 위치 집합
+        trigrams: dict[str, set[int]] = defaultdict(set)
+        for pos, (key, _) in enumerate(self._search_pairs):
+            for j in range(len(key) - _NGRAM + 1):
+                trigrams[key[j:j + _NGRAM]].add(pos)
+        self._trigrams = dict(trigrams)
+
+        # 조회마다 filter+sort 하지 않도록 한 번만 정렬 (안정 정렬 → 동점은 로드 순서)
+        self._by_score = sorted(self.impacts, key=lambda x: -x.global_score)
+        self._imminent = [
+            i for i in self._by_score if i.domestic_status == DomesticStatus.IMMINENT
+        ]
+        # NaN 가격은 truthy지만 비교가 항상 False — 정렬·bisect 키에서 제외
+        self._by_price = sorted(
+            (i for i in self.impacts if i.hira_price and not math.isnan(i.hira_price)),
+            key=lambda x: -x.hira_price,
+        )
+        self._score_keys = [-i.global_score for i in self._by_score]
+        self._price_keys = [-i.hira_price for i in self._by_price]
+
+        by_status: dict[str, list[DomesticImpact]] = defaultdict(list)
+        for impact in self.impacts:
+            if impact.hira_status:
+                by_status[impact.hira_status.value].append(impact)
+        self._by_status = dict(by_status)
+        self._reimbursed = self._by_status.get(ReimbursementStatus.REIMBURSED.value, [])
+
+        self.hot_issues_count = bisect_right(self._score_keys, -_HOT_ISSUE_MIN_SCORE)
+        self.imminent_count = len(self._imminent)
+        self.reimbursed_count = len(self._reimbursed)
+
+    def snapshot(self, key: Hashable, build: Callable[[], bytes]) -> tuple[bytes, str]:
+        """응답 JSON 바이트 + ETag — 키별 첫 요청에 build()로 만들고 다음 로드까지 재사용"""
+        hit = self._snapshots.get(key)
+        if hit is None:
+            body = build()
+            hit = (body, f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"')
+            if len(self._snapshots) < _SNAPSHOT_MAX_KEYS:
+                self._snapshots[key] = hit
+        return hit
+
     def get_by_inn(self, inn: str) -> Optional[DomesticImpact]:
         """INN으로 조회 (JSON 모드)"""
-        return self._by_inn.get(inn.lower())
+        return self._by_inn.get(inn.casefold())
 
     def search(self, query: str, limit: int = 20) -> list[DomesticImpact]:
-        """검색 (JSON 모드)"""
-        query_lower = query.lower()
+        """검색 (JSON 모드)
+
+        INN이 query로 시작하는 약물을 정렬 인덱스 이분 탐색으로 먼저 채우고
+        (O(log N + k)), 부족하면 중간에 query가 포함된 약물을 로드 순서대로 추가.
+        부분 일치 후보는 query 3-gram 포스팅 교집합으로 좁힌 뒤 확인
+        (3자 미만 query만 전체 스캔).
+        """
+        query_key = query.casefold()
         results = []
-        for impact in self.impacts:
-            if query_lower in impact.inn.lower():
+        keys = self._search_keys
+        i = bisect_left(keys, query_key)
+        while i < len(keys) and len(results) < limit and keys[i].startswith(query_key):
+            results.append(self._search_sorted[i][1])
+            i += 1
+        if len(results) >= limit:
+            return results
+
+        if len(query_key) >= _NGRAM:
+            postings = []
+            for j in range(len(query_key) - _NGRAM + 1):
+                posting = self._trigrams.get(query_key[j:j + _NGRAM])
+                if not posting:
+                    return results
+                postings.append(posting)
+            postings.sort(key=len)
+            candidates = sorted(set.intersection(*postings))
+            pairs = (self._search_pairs[pos] for pos in candidates)
+        else:
+            pairs = iter(self._search_pairs)
+
+        for key, impact in pairs:
+            if query_key in key and not key.startswith(query_key):
                 results.append(impact)
                 if len(results) >= limit:
                     break
         return results
 
-    def get_hot_issues(self, min_score: int = 60) -> list[DomesticImpact]:
-        """핫이슈 조회 (JSON 모드)"""
-        return sorted(
-            [i for i in self.impacts if i.global_score >= min_score],
-            key=lambda x: -x.global_score
-        )
+    def get_by_score(self) -> list[DomesticImpact]:
+        """전체 약물 global_score 내림차순 (JSON 모드, 로드 시 정렬해 둔 목록)"""
+        return list(self._by_score)
+
+    def get_hot_issues(
+        self, min_score: int = 60, offset: int = 0, limit: Optional[int] = None,
+    ) -> list[DomesticImpact]:
+        """핫이슈 조회 (JSON 모드) — offset/limit 구간만 잘라 반환"""
+        end = bisect_right(self._score_keys, -min_score)
+        return self._by_score[offset:_page_end(end, offset, limit)]
 
-    def get_imminent(self) -> list[DomesticImpact]:
+    def get_imminent(self, offset: int = 0, limit: Optional[int] = None) -> list[DomesticImpact]:
         """국내 도입 임박 약물 (JSON 모드)"""
-        return sorted(
-            [i for i in self.impacts if i.domestic_status == DomesticStatus.IMMINENT],
-            key=lambda x: -x.global_score
-        )
+        return self._imminent[offset:_page_end(len(self._imminent), offset, limit)]
 
-    def get_high_value(self, min_price: float = 1_000_000) -> list[DomesticImpact]:
+    def get_high_value(
+        self, min_price: float = 1_000_000, offset: int = 0, limit: Optional[int] = None,
+    ) -> list[DomesticImpact]:
         """고가 급여 약물 (JSON 모드)"""
-        return sorted(
-            [i for i in self.impacts
-             if i.hira_price and i.hira_price >= min_price],
-            key=lambda x: -(x.hira_price or 0)
-        )
+        end = bisect_right(self._price_keys, -min_price)
+        return self._by_price[offset:_page_end(end, offset, limit)]
+
+    def get_reimbursed(self) -> list[DomesticImpact]:
+        """급여 등재 약물, 로드 순서 (JSON 모드) — 로드 시 만든 버킷이므로 수정하지 말 것"""
+        return self._reimbursed
 
     # ──────────────────────────────────────────────
     # PG 모드 (비동기) — 온디맨드 DB 쿼리
@@ -168,27 +448,23 @@ class DataStore:
 
         drug 객체는 events, hira, trials 관계가 이미 eager-load 된 상태여야 함.
         """
-        # --- 규제 이벤트에서 승인 정보 추출 ---
-        fda_approved = False
-        fda_date = None
-        ema_approved = False
-        ema_date = None
-        mfds_approved = False
-        mfds_date = None
-        mfds_brand_name = ""
-
-        for event in (drug.events or []):
-            agency = event.agency.lower() if event.agency else ""
-            if agency == "fda":
-                fda_approved = True
-                fda_date = event.approval_date
-            elif agency == "ema":
-                ema_approved = True
-                ema_date = event.approval_date
-            elif agency == "mfds":
-                mfds_approved = True
-                mfds_date = event.approval_date
-                mfds_brand_name = event.brand_name or ""
+        # --- 규제 이벤트에서 승인 정보 추출 (agency별 마지막 이벤트) ---
+        by_agency = {
+            event.agency.lower(): event
+            for event in (drug.events or [])
+            if event.agency
+        }
+        fda = by_agency.get("fda")
+        ema = by_agency.get("ema")
+        mfds = by_agency.get("mfds")
+
+        fda_approved = fda is not None
+        fda_date = fda.approval_date if fda else None
+        ema_approved = ema is not None
+        ema_date = ema.approval_date if ema else None
+        mfds_approved = mfds is not None
+        mfds_date = mfds.approval_date if mfds else None
+        mfds_brand_name = (mfds.brand_name or "") if mfds else ""
 
         # --- HIRA 급여 정보 (첫 번째 레코드 사용) ---
         hira_status = None
@@ -287,71 +563,154 @@ class DataStore:
             cris_result = await session.execute(cris_stmt)
             self.cris_count = cris_result.scalar() or 0
 
-            # 전체 drug 수
-            drug_stmt = select(func.count(DrugDB.id))
+            # 전체 drug 수 + /stats 카운트를 집계 쿼리 1회로 (목록을 만들지 않음)
+            reimbursed = (
+                select(HIRAReimbursementDB.id)
+                .where(
+                    HIRAReimbursementDB.drug_id == DrugDB.id,
+                    HIRAReimbursementDB.status == ReimbursementStatus.REIMBURSED.value,
+                )
+                .exists()
+            )
+            drug_stmt = select(
+                func.count(DrugDB.id),
+                func.count(DrugDB.id).filter(DrugDB.global_score >= _HOT_ISSUE_MIN_SCORE),
+                func.count(DrugDB.id).filter(
+                    DrugDB.domestic_status == DomesticStatus.IMMINENT.value
+                ),
+                func.count(DrugDB.id).filter(reimbursed),
+            )
             drug_result = await session.execute(drug_stmt)
-            self.drug_count = drug_result.scalar() or 0
-
+            (
+                self.drug_count,
+                self.hot_issues_count,
+                self.imminent_count,
+                self.reimbursed_count,
+            ) = drug_result.one()
+
+        self._snapshots.clear()
         self.loaded_at = datetime.now()
         logger.info(
             f"[DataStore] PG 카운트 로드 완료: drugs={self.drug_count}, "
             f"fda={self.fda_count}, ema={self.ema_count}, "
-            f"mfds={self.mfds_count}, cris={self.cris_count}"
+            f"mfds={self.mfds_count}, cris={self.cris_count}, "
+            f"hot={self.hot_issues_count}, imminent={self.imminent_count}, "
+            f"reimbursed={self.reimbursed_count}"
         )
 
-    async def _aquery_drugs(self, stmt) -> list[DomesticImpact]:
-        """공통 DB 쿼리 실행 + DomesticImpact 변환 헬퍼"""
+    async def _aiter_drugs(
+        self, stmt, chunk: int = _DRUG_STREAM_CHUNK,
+    ) -> AsyncIterator[DomesticImpact]:
+        """DB 쿼리 결과를 chunk 행씩 스트리밍하며 DomesticImpact로 변환
+
+        전체 ORM 행을 한 번에 적재하지 않으므로 대량 조회(min_score=0 등)에서도
+        메모리에는 변환 중인 청크만 남고, 첫 청크부터 변환이 시작됨.
+        """
         session_factory = get_async_session()
         async with session_factory() as session:
-            result = await session.execute(stmt)
-            drugs = result.scalars().all()
-            return [self._drug_row_to_impact(drug) for drug in drugs]
+            result = await session.stream_scalars(
+                stmt.execution_options(yield_per=chunk),
+            )
+            async for drug in result:
+                yield self._drug_row_to_impact(drug)
+
+    async def _aquery_drugs(self, stmt) -> list[DomesticImpact]:
+        """공통 DB 쿼리 실행 + DomesticImpact 변환 헬퍼"""
+        return [impact async for impact in self._aiter_drugs(stmt)]
+
+    def _base_drug_query(self, loader=selectinload):
+        """eagerly-loaded relationships가 포함된 기본 DrugDB 쿼리문 반환
 
-    def _base_drug_query(self):
-        """eagerly-loaded relationships가 포함된 기본 DrugDB 쿼리문 반환"""
+        Args:
+            loader: selectinload(기본 — 관계별 1쿼리, 스트리밍 가능) 또는
+                joinedload(단건 조회용 — LEFT JOIN 1쿼리, 결과에 .unique() 필요)
+        """
         return (
             select(DrugDB)
             .options(
-                selectinload(DrugDB.events),
-                selectinload(DrugDB.hira),
-                selectinload(DrugDB.trials),
+                loader(DrugDB.events),
+                loader(DrugDB.hira),
+                loader(DrugDB.trials),
             )
         )
 
-    async def aget_hot_issues(self, min_score: int = 60) -> list[DomesticImpact]:
-        """DB에서 핫이슈 조회 (PG 모드)"""
+    async def aget_hot_issues(
+        self, min_score: int = 60, offset: int = 0, limit: Optional[int] = None,
+    ) -> list[DomesticImpact]:
+        """DB에서 핫이슈 조회 (PG 모드) — 페이지는 LIMIT/OFFSET으로 DB에서 자름"""
         stmt = (
             self._base_drug_query()
             .where(DrugDB.global_score >= min_score)
-            .order_by(DrugDB.global_score.desc())
+            .order_by(DrugDB.global_score.desc(), DrugDB.id)
+            .offset(offset)
+            .limit(limit)
         )
         return await self._aquery_drugs(stmt)
 
-    async def aget_imminent(self) -> list[DomesticImpact]:
-        """DB에서 도입 임박 약물 조회 (PG 모드)"""
+    async def aget_imminent(
+        self, limit: Optional[int] = None, after: Optional[tuple[int, str]] = None,
+    ) -> list[DomesticImpact]:
+        """DB에서 도입 임박 약물 조회 (PG 모드)
+
+        (global_score 내림차순, inn) 순. after=(이전 페이지 마지막 global_score, inn)을
+        주면 그 다음부터 — OFFSET 없이 keyset으로 깊은 페이지도 같은 비용.
+        """
         stmt = (
             self._base_drug_query()
             .where(DrugDB.domestic_status == DomesticStatus.IMMINENT.value)
-            .order_by(DrugDB.global_score.desc())
+            .order_by(DrugDB.global_score.desc(), DrugDB.inn)
+            .limit(limit)
         )
+        if after is not None:
+            score, inn = after
+            stmt = stmt.where(
+                or_(
+                    DrugDB.global_score < score,
+                    and_(DrugDB.global_score == score, DrugDB.inn > inn),
+                )
+            )
         return await self._aquery_drugs(stmt)
 
     async def aget_by_inn(self, inn: str) -> Optional[DomesticImpact]:
-        """DB에서 INN으로 약물 조회 (PG 모드, case insensitive)"""
+        """DB에서 INN으로 약물 조회 (PG 모드, case insensitive)
+
+        약물 1건이므로 joinedload로 관계까지 1회 왕복에 로드.
+        결과는 _INN_CACHE_TTL(미등록은 _INN_CACHE_MISS_TTL) 동안 캐시.
+        """
+        key = inn.casefold()
+        cached = self._inn_cache.get(key)
+        if cached is not _MISSING:
+            return cached
+
+        # DB 쪽은 lower()만 가능 → idx_drugs_inn_lower 함수 인덱스 사용
         stmt = (
-            self._base_drug_query()
+            self._base_drug_query(loader=joinedload)
             .where(func.lower(DrugDB.inn) == inn.lower())
         )
         session_factory = get_async_session()
         async with session_factory() as session:
             result = await session.execute(stmt)
-            drug = result.scalars().first()
+            drug = result.unique().scalars().first()
             if drug is None:
+                self._inn_cache.set(key, None, _INN_CACHE_MISS_TTL)
                 return None
-            return self._drug_row_to_impact(drug)
+            impact = self._drug_row_to_impact(drug)
+        self._inn_cache.set(key, impact)
+        return impact
+
+    def invalidate_inn(self, inn: Optional[str] = None) -> None:
+        """aget_by_inn 캐시 무효화 (inn=None이면 전체)
+
+        이 DataStore가 서비스 중인 프로세스에서 DB를 갱신한 경우에만 호출 가능하다.
+        프로세스 밖 적재는 _INN_CACHE_TTL(300초) 만료 후 반영된다.
+        """
+        if inn is None:
+            self._inn_cache.clear()
+        else:
+            self._inn_cache.pop(inn.casefold())
 
     async def asearch(self, query: str, limit: int = 20) -> list[DomesticImpact]:
-        """DB에서 검색 (PG 모드, ILIKE)"""
+        """DB에서 검색 (PG 모드, ILIKE — idx_drugs_inn_trgm trigram 인덱스 사용)"""
         stmt = (
             self._base_drug_query()
             .where(DrugDB.inn.ilike(f"%{query}%"))
@@ -359,13 +718,28 @@ class DataStore:
         )
         return await self._aquery_drugs(stmt)
 
-    async def aget_high_value(self, min_price: float = 1_000_000) -> list[DomesticImpact]:
-        """DB에서 고가 약물 조회 (PG 모드)"""
+    async def aget_high_value(
+        self, min_price: float = 1_000_000, limit: int = 50,
+    ) -> list[DomesticImpact]:
+        """DB에서 고가 약물 상위 limit건 조회 (PG 모드)
+
+        약물당 최고 상한가로 집계한 뒤 정렬·LIMIT → 급여 행이 여러 개인 약물도
+        1회만 반환되고, relationship은 상위 limit건만 로드.
+        """
+        top_price = (
+            select(
+                HIRAReimbursementDB.drug_id,
+                func.max(HIRAReimbursementDB.price_ceiling).label("price"),
+            )
+            .where(HIRAReimbursementDB.price_ceiling >= min_price)
+            .group_by(HIRAReimbursementDB.drug_id)
+            .subquery()
+        )
         stmt = (
             self._base_drug_query()
-            .join(DrugDB.hira)
-            .where(HIRAReimbursementDB.price_ceiling >= min_price)
-            .order_by(HIRAReimbursementDB.price_ceiling.desc())
+            .join(top_price, top_price.c.drug_id == DrugDB.id)
+            .order_by(top_price.c.price.desc())
+            .limit(limit)
         )
         return await self._aquery_drugs(stmt)
 
@@ -374,6 +748,48 @@ class DataStore:
 # 싱글톤 + 모듈 레벨 함수
 # ──────────────────────────────────────────────
 
+async def require_postgres() -> None:
+    """PG 모드 전용 라우트 가드 — dependencies=[Depends(require_postgres)]
+
+    본문·파라미터 처리 전에 501로 끝낸다. async라 스레드풀을 거치지 않는다.
+    """
+    if not settings.is_postgres:
+        raise HTTPException(status_code=501, detail="PostgreSQL 모드에서만 지원됩니다")
+
+
+def _not_modified_since(request: Request, loaded_at: datetime) -> bool:
+    """If-Modified-Since가 로드 시각(초 단위) 이후인지 — If-None-Match가 있으면 그쪽이 우선"""
+    since = request.headers.get("if-modified-since")
+    if not since or "if-none-match" in request.headers:
+        return False
+    try:
+        since_at = parsedate_to_datetime(since)
+    except (TypeError, ValueError):
+        return False
+    if since_at.tzinfo is None:
+        return False
+    return loaded_at.replace(microsecond=0) <= since_at
+
+
+def snapshot_response(
+    request: Request, store: DataStore, key: Hashable, build: Callable[[], bytes],
+) -> Response:
+    """DataStore 스냅샷 JSON 응답 — 검증자(ETag / Last-Modified)가 맞으면 본문 없이 304
+
+    스냅샷 자체가 로드 단위로만 바뀌므로 직렬화 없이 조건부 요청에 답할 수 있다.
+    """
+    body, etag = store.snapshot(key, build)
+    headers = {"ETag": etag}
+    loaded_at = store.loaded_at.astimezone(timezone.utc) if store.loaded_at else None
+    if loaded_at is not None:
+        headers["Last-Modified"] = format_datetime(loaded_at, usegmt=True)
+    if request.headers.get("if-none-match") == etag or (
+        loaded_at is not None and _not_modified_since(request, loaded_at)
+    ):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
 _store: Optional[DataStore] = None
 
 
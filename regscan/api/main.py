@@ -13,6 +13,7 @@ from regscan.api.routes import changes as changes_routes
 from regscan.api.routes import pdufa as pdufa_routes
 from regscan.api.routes import briefings as briefing_routes
 from regscan.api.deps import get_data_store
+from regscan.api.schemas import HealthResponse, ServiceInfo
 from regscan.config import settings
 
 # 로깅 설정
@@ -73,6 +74,13 @@ async def lifespan(app: FastAPI):
 
         stop_scheduler()
 
+    # Gemini PDF 다운로드 / LLM SDK 공유 HTTP 클라이언트 종료
+    from regscan.ai.gemini_parser import close_http_client
+    from regscan.ai.http_client import close_llm_http_client
+
+    await close_http_client()
+    await close_llm_http_client()
+
     # DB 엔진 종료
     if settings.is_postgres:
         try:
@@ -109,24 +117,23 @@ app.include_router(briefing_routes.router, prefix="/api/v1/briefings", tags=["Br
 app.include_router(health_routes.router, tags=["Health"])
 
 
-@app.get("/")
+# 응답 직렬화: response_model이 있는 라우트는 FastAPI가 기본 JSONResponse에서
+# Pydantic(model_dump_json)으로 바로 JSON 바이트를 만든다. ORJSONResponse를
+# 기본 클래스로 두면 이 경로가 꺼지고 jsonable_encoder를 거치므로 쓰지 않는다.
+@app.get("/", response_model=ServiceInfo)
 def root():
     """API 상태"""
-    return {
-        "service": "RegScan API",
-        "version": "1.0.0",
-        "status": "running",
-    }
+    return ServiceInfo(service="RegScan API", version="1.0.0", status="running")
 
 
-@app.get("/health")
+@app.get("/health", response_model=HealthResponse)
 def health():
     """헬스체크"""
     store = get_data_store()
     drug_count = store.drug_count if settings.is_postgres else len(store.impacts)
-    return {
-        "status": "healthy",
-        "loaded_at": store.loaded_at.isoformat() if store.loaded_at else None,
-        "drug_count": drug_count,
-        "mode": "postgres" if settings.is_postgres else "json",
-    }
+    return HealthResponse(
+        status="healthy",
+        loaded_at=store.loaded_at,
+        drug_count=drug_count,
+        mode="postgres" if settings.is_postgres else "json",
+    )
@@ -2,31 +2,108 @@
 
 GET /api/v1/briefings/latest?stream=therapeutic_area&area=oncology
 GET /api/v1/briefings/unified/latest
-GET /api/v1/briefings/history?days=7
+GET /api/v1/briefings/history?days=7&limit=100&cursor=2026-02-01T09:00:00&cursor_id=123
 """
 
-from datetime import datetime, timedelta
-from typing import Optional
+import json
+import time
+from datetime import datetime, timezone
+from typing import AsyncIterator, Optional
 
+import orjson
 from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel
+from fastapi.responses import StreamingResponse
+from pydantic import Field
+from starlette.background import BackgroundTask
+
+from regscan.api.schemas import APIModel
 
 router = APIRouter()
 
 
 # ── Schemas ──
 
-class BriefingItem(BaseModel):
+class BriefingItem(APIModel):
     id: int
     stream_name: str
     sub_category: str = ""
     briefing_type: str
     headline: str = ""
-    content_json: dict = {}
+    content_json: dict = Field(default_factory=dict)
     generated_at: Optional[datetime] = None
     pipeline_run_id: Optional[str] = None
 
 
+def _briefing_columns(raw_content: bool = False) -> tuple:
+    """BriefingItem에 필요한 컬럼만 조회 (ORM 객체 생성·identity map 생략)
+
+    raw_content=True면 content_json을 DB의 JSON 텍스트 그대로 받는다 (파싱 생략).
+    """
+    from regscan.db.models import StreamBriefingDB
+    from sqlalchemy import Text, cast
+
+    content = StreamBriefingDB.content_json
+    if raw_content:
+        content = cast(content, Text).label("content_json")
+    return (
+        StreamBriefingDB.id,
+        StreamBriefingDB.stream_name,
+        StreamBriefingDB.sub_category,
+        StreamBriefingDB.briefing_type,
+        StreamBriefingDB.headline,
+        content,
+        StreamBriefingDB.generated_at,
+        StreamBriefingDB.pipeline_run_id,
+    )
+
+
+def _to_item(row) -> BriefingItem:
+    """컬럼 Row → BriefingItem"""
+    return BriefingItem(
+        id=row.id,
+        stream_name=row.stream_name,
+        sub_category=row.sub_category or "",
+        briefing_type=row.briefing_type,
+        headline=row.headline or "",
+        content_json=row.content_json or {},
+        generated_at=row.generated_at,
+        pipeline_run_id=row.pipeline_run_id,
+    )
+
+
+def _raw_content_bytes(raw: Optional[str]) -> bytes:
+    """DB의 content_json 텍스트 → 응답에 이어 붙일 JSON 객체 바이트
+
+    보통은 텍스트를 그대로 쓴다. 기본 json.dumps로 저장된 NaN/Infinity 리터럴은
+    JSON이 아니므로, 그런 토큰이 보이거나 객체가 아니면 파싱 후 다시 직렬화한다
+    (orjson은 NaN/Infinity를 null로 기록).
+    """
+    if not raw or raw == "null":
+        return b"{}"
+    if raw.lstrip().startswith("{") and "NaN" not in raw and "Infinity" not in raw:
+        return raw.encode()
+    value = json.loads(raw)
+    return orjson.dumps(value if isinstance(value, dict) else {})
+
+
+def _to_json_bytes(row) -> bytes:
+    """raw_content 컬럼 Row → BriefingItem JSON 바이트
+
+    content_json은 DB가 돌려준 JSON 텍스트를 그대로 이어 붙인다
+    (dict 파싱 → 재직렬화 왕복 없음). 나머지 필드는 BriefingItem으로 직렬화.
+    """
+    head = BriefingItem(
+        id=row.id,
+        stream_name=row.stream_name,
+        sub_category=row.sub_category or "",
+        briefing_type=row.briefing_type,
+        headline=row.headline or "",
+        generated_at=row.generated_at,
+        pipeline_run_id=row.pipeline_run_id,
+    ).model_dump_json(exclude={"content_json"}).encode()
+    return head[:-1] + b',"content_json":' + _raw_content_bytes(row.content_json) + b"}"
+
+
 # ── Endpoints ──
 
 @router.get("/latest", response_model=list[BriefingItem])
@@ -42,7 +119,7 @@ async def get_latest_briefings(
     try:
         async with get_async_session()() as session:
             stmt = (
-                select(StreamBriefingDB)
+                select(*_briefing_columns())
                 .where(StreamBriefingDB.briefing_type == "stream")
                 .order_by(StreamBriefingDB.generated_at.desc())
                 .limit(20)
@@ -54,20 +131,10 @@ async def get_latest_briefings(
                 stmt = stmt.where(StreamBriefingDB.sub_category == area)
 
             result = await session.execute(stmt)
-            rows = result.scalars().all()
+            rows = result.all()
 
             return [
-                BriefingItem(
-                    id=row.id,
-                    stream_name=row.stream_name,
-                    sub_category=row.sub_category or "",
-                    briefing_type=row.briefing_type,
-                    headline=row.headline or "",
-                    content_json=row.content_json or {},
-                    generated_at=row.generated_at,
-                    pipeline_run_id=row.pipeline_run_id,
-                )
-                for row in rows
+                _to_item(row) for row in rows
             ]
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"브리핑 조회 실패: {e}")
@@ -83,64 +150,94 @@ async def get_latest_unified_briefing():
     try:
         async with get_async_session()() as session:
             stmt = (
-                select(StreamBriefingDB)
+                select(*_briefing_columns())
                 .where(StreamBriefingDB.briefing_type == "unified")
                 .order_by(StreamBriefingDB.generated_at.desc())
                 .limit(1)
             )
             result = await session.execute(stmt)
-            row = result.scalar_one_or_none()
+            row = result.one_or_none()
 
             if not row:
                 return None
 
-            return BriefingItem(
-                id=row.id,
-                stream_name=row.stream_name,
-                sub_category=row.sub_category or "",
-                briefing_type=row.briefing_type,
-                headline=row.headline or "",
-                content_json=row.content_json or {},
-                generated_at=row.generated_at,
-                pipeline_run_id=row.pipeline_run_id,
-            )
+            return _to_item(row)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"통합 브리핑 조회 실패: {e}")
 
 
+# 응답 전에 미리 받아 두는 행 수 — 쿼리·첫 fetch 오류를 500으로 돌려주기 위함
+_HISTORY_FIRST_CHUNK = 20
+
+
+async def _stream_json_array(first: list, result) -> AsyncIterator[bytes]:
+    """미리 받은 첫 청크 + 나머지 스트리밍 결과 → JSON 배열을 행 단위로 전송 (전체 목록 미적재)
+
+    연결이 끊겨도 커서는 여기서 닫고, 세션은 응답의 BackgroundTask가 닫는다.
+    """
+    try:
+        yield b"[" + b",".join(_to_json_bytes(row) for row in first)
+        sep = b"," if first else b""
+        async for row in result:
+            yield sep + _to_json_bytes(row)
+            sep = b","
+        yield b"]"
+    finally:
+        await result.close()
+
+
 @router.get("/history", response_model=list[BriefingItem])
 async def get_briefing_history(
     days: int = Query(7, ge=1, le=90, description="조회 기간 (일)"),
+    limit: int = Query(100, ge=1, le=100, description="최대 건수"),
+    offset: int = Query(0, ge=0, description="건너뛸 건수 (cursor 사용 권장)"),
+    cursor: Optional[datetime] = Query(
+        None, description="이전 페이지 마지막 항목의 generated_at — 이보다 오래된 항목부터",
+    ),
+    cursor_id: Optional[int] = Query(
+        None, description="이전 페이지 마지막 항목의 id — cursor와 함께 넘기면 같은 시각 항목도 누락 없음",
+    ),
 ):
-    """브리핑 히스토리"""
+    """브리핑 히스토리
+
+    content_json이 큰 행을 한꺼번에 직렬화하지 않도록 JSON 배열을 행 단위로
+    스트리밍한다. 쿼리 실행과 첫 청크 fetch까지는 응답 전에 끝내므로 DB 오류는 500으로 반환.
+    다음 페이지는 마지막 항목의 (generated_at, id)를 cursor, cursor_id로 넘긴다 (keyset —
+    idx_briefing_generated_at 인덱스를 역순 탐색, OFFSET처럼 앞 행을 읽고 버리지 않음).
+    한 파이프라인 실행의 브리핑은 generated_at이 같을 수 있어 id로 동률을 가른다.
+    """
     from regscan.db.database import get_async_session
     from regscan.db.models import StreamBriefingDB
-    from sqlalchemy import select
-
+    from sqlalchemy import and_, or_, select
+
+    # 컬럼이 naive UTC(generated_at=utcnow)이므로 tzinfo 없이 비교
+    cutoff = datetime.fromtimestamp(time.time() - days * 86400, timezone.utc).replace(tzinfo=None)
+    stmt = (
+        select(*_briefing_columns(raw_content=True))
+        .where(StreamBriefingDB.generated_at >= cutoff)
+        .order_by(StreamBriefingDB.generated_at.desc(), StreamBriefingDB.id.desc())
+    )
+    if cursor is not None:
+        if cursor.tzinfo is not None:
+            cursor = cursor.astimezone(timezone.utc).replace(tzinfo=None)
+        if cursor_id is None:
+            stmt = stmt.where(StreamBriefingDB.generated_at < cursor)
+        else:
+            stmt = stmt.where(or_(
+                StreamBriefingDB.generated_at < cursor,
+                and_(StreamBriefingDB.generated_at == cursor, StreamBriefingDB.id < cursor_id),
+            ))
+    stmt = stmt.offset(offset).limit(limit)
+    session = get_async_session()()
     try:
-        cutoff = datetime.utcnow() - timedelta(days=days)
-        async with get_async_session()() as session:
-            stmt = (
-                select(StreamBriefingDB)
-                .where(StreamBriefingDB.generated_at >= cutoff)
-                .order_by(StreamBriefingDB.generated_at.desc())
-                .limit(100)
-            )
-            result = await session.execute(stmt)
-            rows = result.scalars().all()
-
-            return [
-                BriefingItem(
-                    id=row.id,
-                    stream_name=row.stream_name,
-                    sub_category=row.sub_category or "",
-                    briefing_type=row.briefing_type,
-                    headline=row.headline or "",
-                    content_json=row.content_json or {},
-                    generated_at=row.generated_at,
-                    pipeline_run_id=row.pipeline_run_id,
-                )
-                for row in rows
-            ]
+        result = await session.stream(stmt)
+        first = await result.fetchmany(_HISTORY_FIRST_CHUNK)
     except Exception as e:
+        await session.close()
         raise HTTPException(status_code=500, detail=f"브리핑 히스토리 조회 실패: {e}")
+
+    return StreamingResponse(
+        _stream_json_array(first, result),
+        media_type="application/json",
+        background=BackgroundTask(session.close),
+    )
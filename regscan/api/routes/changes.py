@@ -1,9 +1,10 @@
 """변경 감지 로그 API"""
 
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timezone
 
-from fastapi import APIRouter, HTTPException, Query
-from regscan.api.schemas import ChangeLogResponse
+from fastapi import APIRouter, HTTPException, Query, Response
+from regscan.api.schemas import CHANGE_LOG_LIST, ChangeLogResponse
 
 router = APIRouter()
 
@@ -29,11 +30,23 @@ async def get_recent_changes(
     from regscan.db.models import DrugChangeLogDB, DrugDB
     from sqlalchemy import select
 
-    since = datetime.utcnow() - timedelta(hours=hours)
+    # 컬럼이 naive UTC(detected_at=utcnow)이므로 tzinfo 없이 비교
+    since = datetime.fromtimestamp(time.time() - hours * 3600, timezone.utc).replace(tzinfo=None)
 
     async with get_async_session()() as session:
         stmt = (
-            select(DrugChangeLogDB, DrugDB.inn)
+            # 응답에 필요한 컬럼만 조회 (ORM 객체 생성 생략)
+            select(
+                DrugChangeLogDB.id,
+                DrugChangeLogDB.drug_id,
+                DrugDB.inn,
+                DrugChangeLogDB.change_type,
+                DrugChangeLogDB.field_name,
+                DrugChangeLogDB.old_value,
+                DrugChangeLogDB.new_value,
+                DrugChangeLogDB.pipeline_run_id,
+                DrugChangeLogDB.detected_at,
+            )
             .join(DrugDB, DrugChangeLogDB.drug_id == DrugDB.id)
             .where(DrugChangeLogDB.detected_at >= since)
         )
@@ -46,17 +59,19 @@ async def get_recent_changes(
         result = await session.execute(stmt)
         rows = result.all()
 
-        return [
-            ChangeLogResponse(
-                id=row.DrugChangeLogDB.id,
-                drug_id=row.DrugChangeLogDB.drug_id,
-                inn=row.inn or "",
-                change_type=row.DrugChangeLogDB.change_type,
-                field_name=row.DrugChangeLogDB.field_name,
-                old_value=row.DrugChangeLogDB.old_value,
-                new_value=row.DrugChangeLogDB.new_value,
-                pipeline_run_id=row.DrugChangeLogDB.pipeline_run_id,
-                detected_at=row.DrugChangeLogDB.detected_at,
-            )
-            for row in rows
-        ]
+    # 목록은 한 번에 직렬화 (response_model 재검증 단계 생략)
+    items = [
+        ChangeLogResponse(
+            id=row.id,
+            drug_id=row.drug_id,
+            inn=row.inn or "",
+            change_type=row.change_type,
+            field_name=row.field_name,
+            old_value=row.old_value,
+            new_value=row.new_value,
+            pipeline_run_id=row.pipeline_run_id,
+            detected_at=row.detected_at,
+        )
+        for row in rows
+    ]
+    return Response(CHANGE_LOG_LIST.dump_json(items), media_type="application/json")
@@ -1,11 +1,13 @@
 """대시보드 HTML 라우트"""
 
-import json
 import logging
-from datetime import datetime
+import time
+from datetime import date
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
@@ -20,17 +22,47 @@ router = APIRouter()
 
 _templates_dir = Path(__file__).parent.parent / "templates"
 templates = Jinja2Templates(directory=str(_templates_dir))
+# 배포 후 템플릿은 바뀌지 않으므로 렌더마다 파일 mtime을 확인하지 않음
+templates.env.auto_reload = settings.TEMPLATE_AUTO_RELOAD
+# import(앱 기동) 시 미리 컴파일 — 첫 요청이 파싱·컴파일 비용을 떠안지 않도록
+for _name in ("dashboard.html", "briefing.html", "stream_briefing.html"):
+    templates.get_template(_name)
+
+
+def _render(name: str, context: dict) -> HTMLResponse:
+    """컴파일된 템플릿을 바로 렌더링 (TemplateResponse 래퍼 생략)"""
+    return HTMLResponse(templates.get_template(name).render(context))
+
+
+_WEEKDAYS = ("월", "화", "수", "목", "금", "토", "일")
+
+
+@lru_cache(maxsize=2)
+def _format_day(ordinal: int) -> str:
+    """날짜 서수 → "YYYY년 MM월 DD일 (요일)" (워커당 하루 1회 계산)"""
+    day = date.fromordinal(ordinal)
+    return day.strftime(f"%Y년 %m월 %d일 ({_WEEKDAYS[day.weekday()]})")
 
 
 def _today_str() -> str:
-    now = datetime.now()
-    weekday = ["월", "화", "수", "목", "금", "토", "일"][now.weekday()]
-    return now.strftime(f"%Y년 %m월 %d일 ({weekday})")
+    return _format_day(date.today().toordinal())
+
+
+# /dashboard 렌더링 결과 캐시 — (store, loaded_at, 날짜)가 같으면 TTL 동안 재사용
+# (스케줄러 상태 등 loaded_at 외 변화는 최대 TTL만큼 늦게 반영)
+_DASHBOARD_CACHE_TTL = 30.0  # 초
+_dashboard_cache: Optional[tuple[tuple, float, bytes]] = None  # (key, 만료 시각, HTML)
 
 
 @router.get("/dashboard", response_class=HTMLResponse)
 async def dashboard(request: Request, store: DataStore = Depends(get_data_store)):
     """메인 대시보드"""
+    global _dashboard_cache
+    cache_key = (id(store), store.loaded_at, date.today())
+    now = time.monotonic()
+    if _dashboard_cache and _dashboard_cache[0] == cache_key and now < _dashboard_cache[1]:
+        return HTMLResponse(_dashboard_cache[2])
+
     if settings.is_postgres:
         hot_issues = await store.aget_hot_issues(min_score=40)
         imminent = await store.aget_imminent()
@@ -45,8 +77,8 @@ async def dashboard(request: Request, store: DataStore = Depends(get_data_store)
 
     scheduler = get_scheduler_status()
 
-    return templates.TemplateResponse(
-        "dashboard.html",
+    # 렌더링 결과를 UTF-8 바이트로 한 번만 인코딩해 캐시
+    html = templates.get_template("dashboard.html").render(
         {
             "request": request,
             "today": _today_str(),
@@ -64,8 +96,10 @@ async def dashboard(request: Request, store: DataStore = Depends(get_data_store)
                 else None
             ),
             "scheduler": scheduler,
-        },
-    )
+        }
+    ).encode("utf-8")
+    _dashboard_cache = (cache_key, now + _DASHBOARD_CACHE_TTL, html)
+    return HTMLResponse(html)
 
 
 @router.get("/dashboard/drug/{inn}", response_class=HTMLResponse)
@@ -102,7 +136,7 @@ async def drug_briefing(
         generator = LLMBriefingGenerator()
         briefing = generator._generate_fallback(drug)
 
-    return templates.TemplateResponse(
+    return _render(
         "briefing.html",
         {
             "request": request,
@@ -130,7 +164,7 @@ async def stream_briefing_page(
 
     current_run = run_id or runs[0]["id"]
 
-    return templates.TemplateResponse(
+    return _render(
         "stream_briefing.html",
         {
             "request": request,
@@ -187,7 +221,7 @@ def _load_briefings_sqlite(run_id: str | None):
     unified = None
     streams = []
     for row in rows:
-        content = json.loads(row["content_json"]) if row["content_json"] else {}
+        content = orjson.loads(row["content_json"]) if row["content_json"] else {}
         entry = {
             "stream_name": row["stream_name"],
             "sub_category": row["sub_category"] or "",
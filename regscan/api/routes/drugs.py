@@ -1,41 +1,75 @@
 """약물 조회 API"""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from regscan.api.deps import get_data_store, DataStore
+import asyncio
+import hashlib
+import logging
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import AsyncIterator, Hashable, Optional
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from regscan.api.deps import (
+    briefing_cache, get_data_store, require_postgres, snapshot_response, DataStore,
+)
 from regscan.api.schemas import (
-    DrugSummary, DrugDetail, MedclaimInsight, BriefingReportResponse,
-    PreprintResponse, MarketReportResponse, ExpertOpinionResponse,
-    AIInsightResponse, ArticleResponse, ChangeLogResponse,
+    DrugSummary, DrugDetail, CrisTrialBrief, MedclaimInsight, BriefingReportResponse,
+    PreprintResponse, MarketReportResponse,
+    AIInsightResponse, ArticleResponse, DrugPageResponse,
     DrugCardSummary, DrugCardDetail, DrugCardListResponse,
-    RegulatoryEventBrief, FeedItem, FeedResponse,
+    RegulatoryEventBrief, FeedItem, FeedResponse, DRUG_SUMMARY_LIST,
     DOMESTIC_STATUS_KO,
 )
+from regscan.config import settings
+from regscan.db.database import get_async_session
+from regscan.db.models import (
+    AIInsightDB, ArticleDB, DrugChangeLogDB, DrugDB, MarketReportDB, PreprintDB,
+    RegulatoryEventDB,
+)
 from regscan.map.ingredient_bridge import ReimbursementStatus
 from regscan.report import LLMBriefingGenerator
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+# v2 (DB 전용) 라우트 — SQLite 모드에서는 본문 진입 전 501
+_POSTGRES_ONLY = [Depends(require_postgres)]
+
 # LLM 생성기 (싱글톤)
 _llm_generator: LLMBriefingGenerator | None = None
 
+# 브리핑 LLM 동시 호출 상한 — 대기 시간도 BRIEFING_LLM_DEADLINE에 포함되어 초과 시 fallback
+_briefing_slots = asyncio.Semaphore(max(1, settings.BRIEFING_LLM_MAX_CONCURRENCY))
+
 
 def get_llm_generator() -> LLMBriefingGenerator:
     global _llm_generator
     if _llm_generator is None:
         # OpenAI 키가 있으면 OpenAI 사용, 없으면 Anthropic
-        from regscan.config import settings
-        if settings.OPENAI_API_KEY:
-            _llm_generator = LLMBriefingGenerator(provider="openai")
-        else:
-            _llm_generator = LLMBriefingGenerator(provider="anthropic")
+        provider = "openai" if settings.OPENAI_API_KEY else "anthropic"
+        _llm_generator = LLMBriefingGenerator(
+            provider=provider,
+            timeout=settings.BRIEFING_LLM_TIMEOUT,
+            max_retries=settings.BRIEFING_LLM_MAX_RETRIES,
+            max_output_tokens=settings.BRIEFING_LLM_MAX_TOKENS,
+        )
     return _llm_generator
 
 
 # ── 신약 도입정보 카드 엔드포인트 (MedicinePage용) ──
 
 
-def _impact_to_card_summary(impact, article_row=None) -> DrugCardSummary:
-    """DomesticImpact + optional ArticleDB → DrugCardSummary 변환"""
+def _impact_to_card_summary(
+    impact, article_row=None, model: type[DrugCardSummary] = DrugCardSummary, **extra,
+) -> DrugCardSummary:
+    """DomesticImpact + optional ArticleDB → DrugCardSummary 변환
+
+    model=DrugCardDetail과 상세 필드(extra)를 넘기면 요약을 dict로 덤프했다가
+    다시 검증하지 않고 상세 카드를 바로 만든다.
+    """
     # 기관 목록
     agencies = []
     if impact.fda_approved:
@@ -46,19 +80,14 @@ def _impact_to_card_summary(impact, article_row=None) -> DrugCardSummary:
         agencies.append("MFDS")
 
     # 가장 빠른 허가일 (datetime→date 통일)
-    from datetime import date as _date, datetime as _dt
     raw_dates = [d for d in [impact.fda_date, impact.ema_date, impact.mfds_date] if d]
-    dates = [d.date() if isinstance(d, _dt) else d for d in raw_dates]
+    dates = [d.date() if isinstance(d, datetime) else d for d in raw_dates]
     earliest = min(dates) if dates else None
 
     # 한글 domestic_status
     status_val = impact.domestic_status.value if hasattr(impact.domestic_status, "value") else str(impact.domestic_status)
     domestic_ko = DOMESTIC_STATUS_KO.get(status_val, "임상단계")
 
-    # hot issue level
-    score = impact.global_score
-    hot_level = "HOT" if score >= 80 else "HIGH" if score >= 60 else "MID" if score >= 40 else "LOW"
-
     # 기사 정보
     issue_title = ""
     description = ""
@@ -77,7 +106,7 @@ def _impact_to_card_summary(impact, article_row=None) -> DrugCardSummary:
     # 카테고리
     category = impact.therapeutic_areas[0] if impact.therapeutic_areas else ""
 
-    return DrugCardSummary(
+    return model(
         inn=impact.inn,
         brand_name_ko=brand_ko,
         brand_name_en=brand_en,
@@ -87,11 +116,12 @@ def _impact_to_card_summary(impact, article_row=None) -> DrugCardSummary:
         agencies=agencies,
         global_score=impact.global_score,
         korea_relevance_score=impact.korea_relevance_score,
-        hot_issue_level=hot_level,
+        hot_issue_level=impact.hot_issue_level,
         issue_title=issue_title,
         description=description,
         earliest_approval_date=earliest,
         has_article=has_article,
+        **extra,
     )
 
 
@@ -110,10 +140,9 @@ async def list_drug_cards(
     - category: therapeutic area 필터
     - q: 검색어 (INN, 브랜드명, 적응증)
     """
-    from regscan.config import settings
 
     # 기본 목록 (score 내림차순)
-    items = sorted(store.impacts, key=lambda i: i.global_score, reverse=True)
+    items = store.get_by_score()
 
     # 검색 필터
     if q:
@@ -150,10 +179,6 @@ async def list_drug_cards(
     article_map: dict[str, object] = {}
     if settings.is_postgres and page_items:
         try:
-            from regscan.db.database import get_async_session
-            from regscan.db.models import ArticleDB, DrugDB
-            from sqlalchemy import select
-
             inns = [i.inn for i in page_items]
             async with get_async_session()() as session:
                 stmt = (
@@ -188,19 +213,13 @@ async def get_drug_feed(
     since: str | None = Query(default=None, description="ISO date, e.g. 2026-05-01"),
 ):
     """대시보드 피드 — 최근 기사 + 약물 변경 이력 (시간순)"""
-    from regscan.config import settings
     if not settings.is_postgres:
         return FeedResponse(items=[], total_count=0)
 
-    from regscan.db.database import get_async_session
-    from regscan.db.models import ArticleDB, DrugDB, DrugChangeLogDB
-    from sqlalchemy import select, union_all, literal
-    from datetime import datetime as dt
-
     since_dt = None
     if since:
         try:
-            since_dt = dt.fromisoformat(since)
+            since_dt = datetime.fromisoformat(since)
         except ValueError:
             pass
 
@@ -252,51 +271,63 @@ async def get_drug_feed(
             ))
 
     # 시간순 정렬
-    items.sort(key=lambda x: x.timestamp or dt.min, reverse=True)
+    items.sort(key=lambda x: x.timestamp or datetime.min, reverse=True)
     items = items[:limit]
 
     return FeedResponse(items=items, total_count=len(items))
 
 
+def _impact_to_summary(i) -> DrugSummary:
+    """DomesticImpact → DrugSummary (slots 데이터클래스 — 검증은 pydantic-core에서, NaN 가격은 None)"""
+    return DrugSummary(
+        inn=i.inn,
+        fda_approved=i.fda_approved,
+        ema_approved=i.ema_approved,
+        mfds_approved=i.mfds_approved,
+        hira_reimbursed=i.hira_status == ReimbursementStatus.REIMBURSED,
+        hira_price=i.hira_price,
+        global_score=i.global_score,
+        korea_relevance_score=i.korea_relevance_score,
+        hot_issue_level=i.hot_issue_level,
+        domestic_status=i.domestic_status.value,
+        quadrant=i.quadrant,
+    )
+
+
+def _summary_list_json(items) -> bytes:
+    """DrugSummary 목록 JSON 바이트 (리스트 전체를 pydantic-core에서 한 번에)"""
+    return DRUG_SUMMARY_LIST.dump_json([_impact_to_summary(i) for i in items])
+
+
+def _summary_list_response(items) -> Response:
+    """DrugSummary 목록 JSON 응답 (response_model 검증 단계 생략, 스키마는 OpenAPI용)"""
+    return Response(_summary_list_json(items), media_type="application/json")
+
+
 @router.get("", response_model=list[DrugSummary])
 def list_drugs(
+    request: Request,
     offset: int = 0,
     limit: int = Query(default=50, le=200),
     status: str = None,  # reimbursed, imminent, hot 등
     store: DataStore = Depends(get_data_store),
 ):
-    """약물 목록"""
-    items = store.impacts
-
-    # 필터링
-    if status == "reimbursed":
-        items = [i for i in items if i.hira_status == ReimbursementStatus.REIMBURSED]
-    elif status == "imminent":
-        items = store.get_imminent()
-    elif status == "hot":
-        items = store.get_hot_issues(min_score=60)
-    elif status == "high_value":
-        items = store.get_high_value()
-
-    # 페이지네이션
-    items = items[offset:offset + limit]
-
-    return [
-        DrugSummary(
-            inn=i.inn,
-            fda_approved=i.fda_approved,
-            ema_approved=i.ema_approved,
-            mfds_approved=i.mfds_approved,
-            hira_reimbursed=i.hira_status == ReimbursementStatus.REIMBURSED,
-            hira_price=i.hira_price,
-            global_score=i.global_score,
-            korea_relevance_score=i.korea_relevance_score,
-            hot_issue_level="HOT" if i.global_score >= 80 else "HIGH" if i.global_score >= 60 else "MID" if i.global_score >= 40 else "LOW",
-            domestic_status=i.domestic_status.value,
-            quadrant=i.quadrant,
-        )
-        for i in items
-    ]
+    """약물 목록 (필터별 사전 정렬 뷰에서 페이지 구간만 잘라 옴, 로드 단위 스냅샷)"""
+
+    def build() -> bytes:
+        if status == "reimbursed":
+            items = store.get_reimbursed()[offset:offset + limit]
+        elif status == "imminent":
+            items = store.get_imminent(offset=offset, limit=limit)
+        elif status == "hot":
+            items = store.get_hot_issues(min_score=60, offset=offset, limit=limit)
+        elif status == "high_value":
+            items = store.get_high_value(offset=offset, limit=limit)
+        else:
+            items = store.impacts[offset:offset + limit]
+        return _summary_list_json(items)
+
+    return snapshot_response(request, store, ("drugs", status, offset, limit), build)
 
 
 @router.get("/search", response_model=list[DrugSummary])
@@ -308,22 +339,7 @@ def search_drugs(
     """약물 검색"""
     items = store.search(q, limit=limit)
 
-    return [
-        DrugSummary(
-            inn=i.inn,
-            fda_approved=i.fda_approved,
-            ema_approved=i.ema_approved,
-            mfds_approved=i.mfds_approved,
-            hira_reimbursed=i.hira_status == ReimbursementStatus.REIMBURSED,
-            hira_price=i.hira_price,
-            global_score=i.global_score,
-            korea_relevance_score=i.korea_relevance_score,
-            hot_issue_level="HOT" if i.global_score >= 80 else "HIGH" if i.global_score >= 60 else "MID" if i.global_score >= 40 else "LOW",
-            domestic_status=i.domestic_status.value,
-            quadrant=i.quadrant,
-        )
-        for i in items
-    ]
+    return _summary_list_response(items)
 
 
 @router.get("/{inn}", response_model=DrugDetail)
@@ -351,17 +367,12 @@ def get_drug_detail(
         hira_price=impact.hira_price,
         cris_trial_count=len(impact.cris_trials),
         cris_trials=[
-            {
-                "trial_id": t.trial_id,
-                "title": t.title,
-                "phase": t.phase,
-                "status": t.status,
-            }
+            CrisTrialBrief(trial_id=t.trial_id, title=t.title, phase=t.phase, status=t.status)
             for t in impact.cris_trials
         ],
         global_score=impact.global_score,
         korea_relevance_score=impact.korea_relevance_score,
-        hot_issue_level="HOT" if impact.global_score >= 80 else "HIGH" if impact.global_score >= 60 else "MID" if impact.global_score >= 40 else "LOW",
+        hot_issue_level=impact.hot_issue_level,
         hot_issue_reasons=impact.hot_issue_reasons,
         domestic_status=impact.domestic_status.value,
         quadrant=impact.quadrant,
@@ -380,8 +391,6 @@ async def get_drug_card_detail(
     if not impact:
         raise HTTPException(status_code=404, detail=f"Drug not found: {inn}")
 
-    from regscan.config import settings
-
     # 기본 카드 생성
     article_row = None
     reg_events: list[RegulatoryEventBrief] = []
@@ -390,10 +399,6 @@ async def get_drug_card_detail(
 
     if settings.is_postgres:
         try:
-            from regscan.db.database import get_async_session
-            from regscan.db.models import ArticleDB, DrugDB, RegulatoryEventDB
-            from sqlalchemy import select
-
             async with get_async_session()() as session:
                 # 기사
                 art_stmt = (
@@ -433,10 +438,10 @@ async def get_drug_card_detail(
         except Exception:
             pass
 
-    card = _impact_to_card_summary(impact, article_row)
-
-    return DrugCardDetail(
-        **card.model_dump(),
+    return _impact_to_card_summary(
+        impact,
+        article_row,
+        DrugCardDetail,
         regulatory_events=reg_events,
         article_headline=article_row.headline if article_row else "",
         article_body_html=article_body,
@@ -474,7 +479,7 @@ def get_medclaim_insight(
         insights.append("급여 삭제됨 - 이전 급여 이력 있음")
 
     # 희귀의약품 분석
-    is_orphan = any("희귀" in r or "Orphan" in r for r in impact.hot_issue_reasons)
+    is_orphan = impact.is_orphan
     if is_orphan:
         insights.append("희귀의약품 지정 - 산정특례 적용 가능성")
         insights.append("본인부담률 10% 예상")
@@ -506,16 +511,98 @@ def get_medclaim_insight(
     )
 
 
+def _briefing_response(report) -> BriefingReportResponse:
+    """BriefingReport → API 응답"""
+    return BriefingReportResponse(
+        inn=report.inn,
+        headline=report.headline,
+        subtitle=report.subtitle,
+        key_points=report.key_points,
+        global_section=report.global_section,
+        domestic_section=report.domestic_section,
+        medclaim_section=report.medclaim_section,
+        generated_at=report.generated_at,
+        markdown=report.to_markdown(),
+    )
+
+
+def _conditional(
+    request: Request, response: Response, key: Hashable, generated_at: Optional[datetime],
+) -> Optional[Response]:
+    """generated_at 기반 ETag/Last-Modified 설정 — If-None-Match 일치 시 304 응답 반환"""
+    if generated_at is None:
+        return None
+    if generated_at.tzinfo is None:
+        generated_at = generated_at.replace(tzinfo=timezone.utc)
+    digest = hashlib.blake2b(
+        f"{key}|{generated_at.isoformat()}".encode(), digest_size=8,
+    ).hexdigest()
+    headers = {
+        "ETag": f'"{digest}"',
+        "Last-Modified": format_datetime(generated_at.astimezone(timezone.utc), usegmt=True),
+    }
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
+async def _briefing_events(generator: LLMBriefingGenerator, impact) -> AsyncIterator[bytes]:
+    """SSE 프레임: 생성 중 본문 델타는 data: {"delta": ...}, 완성본은 event: done
+
+    슬롯 대기부터 BRIEFING_LLM_DEADLINE이 지나면 스트림을 끊고 fallback 리포트를
+    done으로 보낸다 (공급자가 계속 스트리밍해도 슬롯을 무기한 점유하지 않음).
+    기한은 await 단위로 걸어 yield 중(클라이언트 전송)에는 타이머가 개입하지 않는다.
+    """
+    deadline = asyncio.get_running_loop().time() + settings.BRIEFING_LLM_DEADLINE
+    report = None
+    try:
+        async with asyncio.timeout_at(deadline):
+            await _briefing_slots.acquire()
+        try:
+            items = generator.generate_stream(impact)
+            try:
+                while True:
+                    async with asyncio.timeout_at(deadline):
+                        item = await anext(items, None)
+                    if item is None:
+                        break
+                    if isinstance(item, str):
+                        yield b"data: " + orjson.dumps({"delta": item}) + b"\n\n"
+                    else:
+                        report = item
+            finally:
+                await items.aclose()
+        finally:
+            _briefing_slots.release()
+    except asyncio.TimeoutError:
+        logger.warning(
+            "브리핑 LLM 스트림 시간 초과 (%.0fs) — fallback 사용: %s",
+            settings.BRIEFING_LLM_DEADLINE, impact.inn,
+        )
+    if report is None:
+        report = generator._generate_fallback(impact)
+    body = _briefing_response(report).model_dump_json().encode()
+    yield b"event: done\ndata: " + body + b"\n\n"
+
+
 @router.get("/{inn}/briefing", response_model=BriefingReportResponse)
 async def get_briefing_report(
     inn: str,
+    request: Request,
+    response: Response,
     use_llm: bool = Query(default=True, description="LLM 사용 여부 (False면 템플릿 기반)"),
+    stream: bool = Query(
+        default=False,
+        description="True면 text/event-stream으로 생성 중 본문을 전송하고 마지막 done 이벤트에 리포트 (use_llm일 때)",
+    ),
     store: DataStore = Depends(get_data_store),
 ):
     """LLM 브리핑 리포트 생성
 
     약물의 글로벌 규제 현황과 국내 도입 전망을 분석한 브리핑 리포트를 생성합니다.
     LLM(Claude)을 사용하여 자연어 리포트를 생성하거나, 템플릿 기반 리포트를 반환합니다.
+    생성 결과는 다음 파이프라인 실행 전까지 캐시되며 ETag로 304 응답을 지원합니다.
     """
     impact = store.get_by_inn(inn)
     if not impact:
@@ -523,183 +610,237 @@ async def get_briefing_report(
 
     generator = get_llm_generator()
 
+    if use_llm and stream:
+        return StreamingResponse(
+            _briefing_events(generator, impact),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    key = ("briefing", impact.inn.casefold(), use_llm)
     if use_llm:
-        report = await generator.generate(impact)
+        async def _generate() -> BriefingReportResponse:
+            async with _briefing_slots:
+                return _briefing_response(await generator.generate(impact))
+
+        try:
+            # SDK 재시도까지 포함한 전체 대기 상한 — 요청 1회 타임아웃(BRIEFING_LLM_TIMEOUT)보다
+            # 길어야 재시도가 의미 있음. 초과 시 진행 중 요청도 취소 (시간 초과분은 캐시하지 않음)
+            body = await asyncio.wait_for(
+                briefing_cache.get_or_set(key, _generate),
+                timeout=settings.BRIEFING_LLM_DEADLINE,
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                "브리핑 LLM 시간 초과 (%.0fs) — fallback 사용: %s",
+                settings.BRIEFING_LLM_DEADLINE, inn,
+            )
+            return _briefing_response(generator._generate_fallback(impact))
     else:
-        report = generator._generate_fallback(impact)
+        async def _template() -> BriefingReportResponse:
+            return _briefing_response(generator._generate_fallback(impact))
 
-    return BriefingReportResponse(
-        inn=report.inn,
-        headline=report.headline,
-        subtitle=report.subtitle,
-        key_points=report.key_points,
-        global_section=report.global_section,
-        domestic_section=report.domestic_section,
-        medclaim_section=report.medclaim_section,
-        generated_at=report.generated_at,
-        markdown=report.to_markdown(),
-    )
+        body = await briefing_cache.get_or_set(key, _template)
+
+    return _conditional(request, response, key, body.generated_at) or body
 
 
 # ── v2 엔드포인트 ──
 
 
-@router.get("/{inn}/insight", response_model=AIInsightResponse)
-async def get_ai_insight(inn: str):
-    """AI 추론·검증 결과 조회 (v2)"""
-    from regscan.config import settings
-    if not settings.is_postgres:
-        raise HTTPException(status_code=501, detail="PostgreSQL 모드에서만 지원됩니다")
+def _insight_response(row) -> AIInsightResponse:
+    """AIInsightDB → API 응답"""
+    return AIInsightResponse(
+        impact_score=row.impact_score,
+        risk_factors=row.risk_factors or [],
+        opportunity_factors=row.opportunity_factors or [],
+        reasoning_chain=row.reasoning_chain or "",
+        market_forecast=row.market_forecast or "",
+        reasoning_model=row.reasoning_model or "",
+        verified_score=row.verified_score,
+        corrections=row.corrections or [],
+        confidence_level=row.confidence_level or "",
+        generated_at=row.generated_at,
+    )
+
+
+def _article_response(row) -> ArticleResponse:
+    """ArticleDB → API 응답"""
+    return ArticleResponse(
+        article_type=row.article_type,
+        headline=row.headline or "",
+        subtitle=row.subtitle or "",
+        lead_paragraph=row.lead_paragraph or "",
+        body_html=row.body_html or "",
+        tags=row.tags or [],
+        writer_model=row.writer_model or "",
+        generated_at=row.generated_at,
+    )
 
-    from regscan.db.database import get_async_session
-    from regscan.db.models import AIInsightDB, DrugDB
-    from sqlalchemy import select
 
+def _preprint_response(r) -> PreprintResponse:
+    """PreprintDB → API 응답"""
+    return PreprintResponse(
+        doi=r.doi or "",
+        title=r.title or "",
+        authors=r.authors or "",
+        abstract=r.abstract or "",
+        server=r.server or "",
+        category=r.category or "",
+        published_date=r.published_date,
+        pdf_url=r.pdf_url or "",
+        gemini_parsed=r.gemini_parsed or False,
+        extracted_facts=r.extracted_facts,
+    )
+
+
+def _market_report_response(r) -> MarketReportResponse:
+    """MarketReportDB → API 응답"""
+    return MarketReportResponse(
+        source=r.source or "",
+        title=r.title or "",
+        publisher=r.publisher or "",
+        published_date=r.published_date,
+        market_size_krw=r.market_size_krw,
+        growth_rate=r.growth_rate,
+        summary=r.summary or "",
+        source_url=r.source_url or "",
+    )
+
+
+async def _first_row(stmt):
+    """세션 하나로 단건 조회 (없으면 None) — gather로 묶을 때 쿼리마다 별도 커넥션"""
     async with get_async_session()() as session:
-        stmt = (
-            select(AIInsightDB)
-            .join(DrugDB, AIInsightDB.drug_id == DrugDB.id)
-            .where(DrugDB.inn == inn)
-            .order_by(AIInsightDB.generated_at.desc())
-            .limit(1)
-        )
-        result = await session.execute(stmt)
-        row = result.scalar_one_or_none()
-
-        if not row:
-            raise HTTPException(status_code=404, detail=f"AI insight not found: {inn}")
-
-        return AIInsightResponse(
-            impact_score=row.impact_score,
-            risk_factors=row.risk_factors or [],
-            opportunity_factors=row.opportunity_factors or [],
-            reasoning_chain=row.reasoning_chain or "",
-            market_forecast=row.market_forecast or "",
-            reasoning_model=row.reasoning_model or "",
-            verified_score=row.verified_score,
-            corrections=row.corrections or [],
-            confidence_level=row.confidence_level or "",
-            generated_at=row.generated_at,
-        )
+        return (await session.execute(stmt)).scalar_one_or_none()
+
+
+async def _all_rows(stmt) -> list:
+    """세션 하나로 목록 조회"""
+    async with get_async_session()() as session:
+        return list((await session.execute(stmt)).scalars().all())
+
+
+def _latest_insight_stmt(inn: str):
+    return (
+        select(AIInsightDB)
+        .join(DrugDB, AIInsightDB.drug_id == DrugDB.id)
+        .where(DrugDB.inn == inn)
+        .order_by(AIInsightDB.generated_at.desc())
+        .limit(1)
+    )
+
+
+def _latest_article_stmt(inn: str, article_type: str):
+    return (
+        select(ArticleDB)
+        .join(DrugDB, ArticleDB.drug_id == DrugDB.id)
+        .where(DrugDB.inn == inn, ArticleDB.article_type == article_type)
+        .order_by(ArticleDB.generated_at.desc())
+        .limit(1)
+    )
+
+
+def _preprints_stmt(inn: str, limit: int):
+    # 게시일 없는 행은 뒤로 (PG 기본 DESC는 NULL 먼저)
+    return (
+        select(PreprintDB)
+        .join(DrugDB, PreprintDB.drug_id == DrugDB.id)
+        .where(DrugDB.inn == inn)
+        .order_by(PreprintDB.published_date.desc().nulls_last())
+        .limit(limit)
+    )
+
+
+def _market_reports_stmt(inn: str, limit: int):
+    return (
+        select(MarketReportDB)
+        .join(DrugDB, MarketReportDB.drug_id == DrugDB.id)
+        .where(DrugDB.inn == inn)
+        .order_by(MarketReportDB.published_date.desc().nulls_last())
+        .limit(limit)
+    )
+
+
+@router.get("/{inn}/page", response_model=DrugPageResponse, dependencies=_POSTGRES_ONLY)
+async def get_drug_page(
+    inn: str,
+    article_type: str = Query(default="briefing", description="기사 유형"),
+    limit: int = Query(default=20, le=100, description="프리프린트·시장 리포트 최대 건수"),
+):
+    """약물 상세 페이지 데이터 일괄 조회 (v2)
+
+    /insight, /article, /preprints, /market을 한 번에 — 서로 독립인 4개 쿼리를
+    각자의 세션으로 동시에 실행해 지연이 합이 아니라 최댓값이 된다.
+    없는 항목은 null / 빈 목록, 모두 비었을 때만 약물 존재 여부를 확인해 404.
+    """
+    insight, article, preprints, market_reports = await asyncio.gather(
+        _first_row(_latest_insight_stmt(inn)),
+        _first_row(_latest_article_stmt(inn, article_type)),
+        _all_rows(_preprints_stmt(inn, limit)),
+        _all_rows(_market_reports_stmt(inn, limit)),
+    )
+
+    if not (insight or article or preprints or market_reports):
+        if await _first_row(select(DrugDB.id).where(DrugDB.inn == inn)) is None:
+            raise HTTPException(status_code=404, detail=f"Drug not found: {inn}")
+
+    return DrugPageResponse(
+        inn=inn,
+        insight=_insight_response(insight) if insight else None,
+        article=_article_response(article) if article else None,
+        preprints=[_preprint_response(r) for r in preprints],
+        market_reports=[_market_report_response(r) for r in market_reports],
+    )
+
+
+@router.get("/{inn}/insight", response_model=AIInsightResponse, dependencies=_POSTGRES_ONLY)
+async def get_ai_insight(inn: str, request: Request, response: Response):
+    """AI 추론·검증 결과 조회 (v2)"""
+    key = ("insight", inn)
+    body = await briefing_cache.get_or_set(key, lambda: _fetch_ai_insight(inn))
+    return _conditional(request, response, key, body.generated_at) or body
 
 
-@router.get("/{inn}/article", response_model=ArticleResponse)
+async def _fetch_ai_insight(inn: str) -> AIInsightResponse:
+    row = await _first_row(_latest_insight_stmt(inn))
+    if not row:
+        raise HTTPException(status_code=404, detail=f"AI insight not found: {inn}")
+    return _insight_response(row)
+
+
+@router.get("/{inn}/article", response_model=ArticleResponse, dependencies=_POSTGRES_ONLY)
 async def get_ai_article(
     inn: str,
+    request: Request,
+    response: Response,
     article_type: str = Query(default="briefing", description="기사 유형"),
 ):
     """AI 기사 조회 (v2)"""
-    from regscan.config import settings
-    if not settings.is_postgres:
-        raise HTTPException(status_code=501, detail="PostgreSQL 모드에서만 지원됩니다")
+    key = ("article", inn, article_type)
+    body = await briefing_cache.get_or_set(key, lambda: _fetch_ai_article(inn, article_type))
+    return _conditional(request, response, key, body.generated_at) or body
 
-    from regscan.db.database import get_async_session
-    from regscan.db.models import ArticleDB, DrugDB
-    from sqlalchemy import select
 
-    async with get_async_session()() as session:
-        stmt = (
-            select(ArticleDB)
-            .join(DrugDB, ArticleDB.drug_id == DrugDB.id)
-            .where(DrugDB.inn == inn, ArticleDB.article_type == article_type)
-            .order_by(ArticleDB.generated_at.desc())
-            .limit(1)
-        )
-        result = await session.execute(stmt)
-        row = result.scalar_one_or_none()
-
-        if not row:
-            raise HTTPException(status_code=404, detail=f"Article not found: {inn}")
-
-        return ArticleResponse(
-            article_type=row.article_type,
-            headline=row.headline or "",
-            subtitle=row.subtitle or "",
-            lead_paragraph=row.lead_paragraph or "",
-            body_html=row.body_html or "",
-            tags=row.tags or [],
-            writer_model=row.writer_model or "",
-            generated_at=row.generated_at,
-        )
+async def _fetch_ai_article(inn: str, article_type: str) -> ArticleResponse:
+    row = await _first_row(_latest_article_stmt(inn, article_type))
+    if not row:
+        raise HTTPException(status_code=404, detail=f"Article not found: {inn}")
+    return _article_response(row)
 
 
-@router.get("/{inn}/preprints", response_model=list[PreprintResponse])
+@router.get("/{inn}/preprints", response_model=list[PreprintResponse], dependencies=_POSTGRES_ONLY)
 async def get_preprints(
     inn: str,
     limit: int = Query(default=20, le=100),
 ):
     """관련 프리프린트 논문 조회 (v2)"""
-    from regscan.config import settings
-    if not settings.is_postgres:
-        raise HTTPException(status_code=501, detail="PostgreSQL 모드에서만 지원됩니다")
-
-    from regscan.db.database import get_async_session
-    from regscan.db.models import PreprintDB, DrugDB
-    from sqlalchemy import select
-
-    async with get_async_session()() as session:
-        stmt = (
-            select(PreprintDB)
-            .join(DrugDB, PreprintDB.drug_id == DrugDB.id)
-            .where(DrugDB.inn == inn)
-            .order_by(PreprintDB.published_date.desc())
-            .limit(limit)
-        )
-        result = await session.execute(stmt)
-        rows = result.scalars().all()
-
-        return [
-            PreprintResponse(
-                doi=r.doi or "",
-                title=r.title or "",
-                authors=r.authors or "",
-                abstract=r.abstract or "",
-                server=r.server or "",
-                category=r.category or "",
-                published_date=r.published_date,
-                pdf_url=r.pdf_url or "",
-                gemini_parsed=r.gemini_parsed or False,
-                extracted_facts=r.extracted_facts,
-            )
-            for r in rows
-        ]
+    return [_preprint_response(r) for r in await _all_rows(_preprints_stmt(inn, limit))]
 
 
-@router.get("/{inn}/market", response_model=list[MarketReportResponse])
+@router.get("/{inn}/market", response_model=list[MarketReportResponse], dependencies=_POSTGRES_ONLY)
 async def get_market_reports(
     inn: str,
     limit: int = Query(default=20, le=100),
 ):
     """시장 리포트 조회 (v2)"""
-    from regscan.config import settings
-    if not settings.is_postgres:
-        raise HTTPException(status_code=501, detail="PostgreSQL 모드에서만 지원됩니다")
-
-    from regscan.db.database import get_async_session
-    from regscan.db.models import MarketReportDB, DrugDB
-    from sqlalchemy import select
-
-    async with get_async_session()() as session:
-        stmt = (
-            select(MarketReportDB)
-            .join(DrugDB, MarketReportDB.drug_id == DrugDB.id)
-            .where(DrugDB.inn == inn)
-            .order_by(MarketReportDB.published_date.desc())
-            .limit(limit)
-        )
-        result = await session.execute(stmt)
-        rows = result.scalars().all()
-
-        return [
-            MarketReportResponse(
-                source=r.source or "",
-                title=r.title or "",
-                publisher=r.publisher or "",
-                published_date=r.published_date,
-                market_size_krw=r.market_size_krw,
-                growth_rate=r.growth_rate,
-                summary=r.summary or "",
-                source_url=r.source_url or "",
-            )
-            for r in rows
-        ]
+    return [_market_report_response(r) for r in await _all_rows(_market_reports_stmt(inn, limit))]
@@ -7,15 +7,17 @@ POST /api/v1/pdufa          — 수동 등록
 from datetime import date, datetime
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Response
+from pydantic import TypeAdapter
+
+from regscan.api.schemas import APIModel
 
 router = APIRouter()
 
 
 # ── Schemas ──
 
-class PdufaItem(BaseModel):
+class PdufaItem(APIModel):
     id: int
     inn: str
     brand_name: str = ""
@@ -28,7 +30,10 @@ class PdufaItem(BaseModel):
     notes: str = ""
 
 
-class PdufaCreateRequest(BaseModel):
+_PDUFA_LIST = TypeAdapter(list[PdufaItem])
+
+
+class PdufaCreateRequest(APIModel):
     inn: str
     brand_name: str = ""
     company: str = ""
@@ -47,36 +52,48 @@ async def get_upcoming_pdufa():
     from regscan.db.models import PdufaDateDB
     from sqlalchemy import select
 
+    # 요청당 한 번만 — 행마다 date.today()를 부르면 자정 경계에서 기준일이 섞임
+    today = date.today()
     try:
         async with get_async_session()() as session:
+            # (status, pdufa_date) 인덱스 범위 스캔, ORM 엔티티 대신 필요한 컬럼만
             stmt = (
-                select(PdufaDateDB)
+                select(
+                    PdufaDateDB.id,
+                    PdufaDateDB.inn,
+                    PdufaDateDB.brand_name,
+                    PdufaDateDB.company,
+                    PdufaDateDB.pdufa_date,
+                    PdufaDateDB.indication,
+                    PdufaDateDB.application_type,
+                    PdufaDateDB.status,
+                    PdufaDateDB.notes,
+                )
                 .where(PdufaDateDB.status == "pending")
-                .where(PdufaDateDB.pdufa_date >= date.today())
+                .where(PdufaDateDB.pdufa_date >= today)
                 .order_by(PdufaDateDB.pdufa_date)
             )
-            result = await session.execute(stmt)
-            rows = result.scalars().all()
-
-            items = []
-            for row in rows:
-                days_until = (row.pdufa_date - date.today()).days
-                items.append(PdufaItem(
-                    id=row.id,
-                    inn=row.inn,
-                    brand_name=row.brand_name or "",
-                    company=row.company or "",
-                    pdufa_date=row.pdufa_date,
-                    indication=row.indication or "",
-                    application_type=row.application_type or "",
-                    status=row.status or "pending",
-                    days_until=days_until,
-                    notes=row.notes or "",
-                ))
-            return items
+            rows = (await session.execute(stmt)).all()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"PDUFA 조회 실패: {e}")
 
+    items = [
+        PdufaItem(
+            id=row.id,
+            inn=row.inn,
+            brand_name=row.brand_name or "",
+            company=row.company or "",
+            pdufa_date=row.pdufa_date,
+            indication=row.indication or "",
+            application_type=row.application_type or "",
+            status=row.status or "pending",
+            days_until=(row.pdufa_date - today).days,
+            notes=row.notes or "",
+        )
+        for row in rows
+    ]
+    return Response(_PDUFA_LIST.dump_json(items), media_type="application/json")
+
 
 @router.post("", response_model=PdufaItem)
 async def create_pdufa(req: PdufaCreateRequest):
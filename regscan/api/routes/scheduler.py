@@ -1,10 +1,8 @@
 """스케줄러 API 라우트"""
 
-import asyncio
+from fastapi import APIRouter, HTTPException
 
-from fastapi import APIRouter
-
-from regscan.scheduler import run_daily_pipeline, get_scheduler_status
+from regscan.scheduler import get_scheduler_status, start_pipeline_task
 
 router = APIRouter()
 
@@ -20,9 +18,11 @@ async def run_now():
     """일간 파이프라인 즉시 실행 (백그라운드)
 
     파이프라인을 백그라운드 태스크로 실행하고 즉시 응답합니다.
-    실행 결과는 GET /status에서 last_run으로 확인할 수 있습니다.
+    이미 실행 중이면 409를 반환합니다.
+    실행 결과는 GET /status에서 last_run / last_error로 확인할 수 있습니다.
     """
-    asyncio.create_task(run_daily_pipeline())
+    if start_pipeline_task() is None:
+        raise HTTPException(status_code=409, detail="일간 파이프라인이 이미 실행 중입니다")
     return {
         "message": "일간 파이프라인 실행이 시작되었습니다",
         "check_status": "/api/v1/scheduler/status",
@@ -1,21 +1,53 @@
-"""API 응답 스키마"""
+"""API 응답 스키마
+
+출력 전용 모델도 생성은 일반 생성자(Model(**kwargs))로 한다. pydantic-core 검증은
+Rust에서 한 번에 돌기 때문에 평평한 응답 모델에서는 Python 루프로 필드를 채우는
+model_construct()보다 2배가량 빠르다 (pydantic 2.14 측정). 반복 요청 비용은
+생성 방식이 아니라 응답 캐시(DataStore.snapshot, briefing_cache)로 줄인다.
+"""
 
-import math
 from datetime import date, datetime
-from typing import Optional
-from pydantic import BaseModel, field_validator
+from decimal import Decimal
+from typing import Annotated, Any, Literal, Optional
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, TypeAdapter, field_validator
+from pydantic.dataclasses import dataclass
 
 
-def _nan_to_none(v: Optional[float]) -> Optional[float]:
-    """NaN을 None으로 변환"""
-    if v is None:
-        return None
-    if isinstance(v, float) and math.isnan(v):
+def _price_to_won(v):
+    """상한가 → 원 단위 정수 (NaN은 None — 자기 자신과 다른 값은 NaN뿐, float/Decimal 공통)"""
+    if v is None or v != v:
         return None
-    return v
+    return round(v) if isinstance(v, (float, Decimal)) else v
+
+
+# HIRA 약가 — 상한금액은 원 단위 정수, NaN(원본 빈 값)은 None (모델마다 validator를 두지 않고 타입에 붙임)
+HiraPrice = Annotated[Optional[int], BeforeValidator(_price_to_won)]
+
+# 내부 계산값만 들어오는 열거형 문자열 — OpenAPI에 enum으로 노출
+# (scan.domestic의 _HOT_LEVELS / DomesticImpact.quadrant / DomesticStatus 값과 동일)
+HotIssueLevel = Literal["LOW", "MID", "HIGH", "HOT"]
+Quadrant = Literal["top_priority", "watch", "track", "normal"]
+DomesticStatusValue = Literal[
+    "reimbursed", "approved_not_reimbursed", "approved_deleted",
+    "imminent", "expected", "uncertain",
+    "domestic_only", "not_applicable",
+]
+
+
+class APIModel(BaseModel):
+    """API 스키마 공통 베이스 — 생성 후 불변, 정의되지 않은 입력 키는 무시
+
+    응답은 조립 후 수정하지 않으므로 frozen으로 고정해 재할당·재검증 경로를 막는다.
+    """
+    model_config = ConfigDict(frozen=True, extra="ignore")
 
 
-class StatsResponse(BaseModel):
+# 목록 행 스키마 — 응답마다 수천 개씩 만들어지므로 __dict__ 없는 slots 데이터클래스
+# (APIModel과 같은 불변·extra 무시, kw_only로 필드 순서 = JSON 키 순서 유지)
+_list_row = dataclass(config=ConfigDict(extra="ignore"), slots=True, frozen=True, kw_only=True)
+
+
+class StatsResponse(APIModel):
     """전체 통계"""
     fda_count: int
     ema_count: int
@@ -27,24 +59,31 @@ class StatsResponse(BaseModel):
     last_updated: datetime
 
 
-class DrugSummary(BaseModel):
+@_list_row
+class DrugSummary:
     """약물 요약 (목록용)"""
     inn: str
     fda_approved: bool
     ema_approved: bool
     mfds_approved: bool
     hira_reimbursed: bool
-    hira_price: Optional[float] = None
+    hira_price: HiraPrice = None
     global_score: int
     korea_relevance_score: int = 0
-    hot_issue_level: str
-    domestic_status: str
-    quadrant: str = "normal"  # top_priority / watch / track / normal
+    hot_issue_level: HotIssueLevel
+    domestic_status: DomesticStatusValue
+    quadrant: Quadrant = "normal"
 
-    _normalize_price = field_validator("hira_price", mode="before")(_nan_to_none)
+
+class CrisTrialBrief(APIModel):
+    """CRIS 임상시험 요약 (약물 상세용)"""
+    trial_id: str
+    title: str
+    phase: str = ""
+    status: str = ""
 
 
-class DrugDetail(BaseModel):
+class DrugDetail(APIModel):
     """약물 상세"""
     inn: str
 
@@ -66,30 +105,29 @@ class DrugDetail(BaseModel):
     hira_status: Optional[str] = None
     hira_code: str = ""
     hira_criteria: str = ""
-    hira_price: Optional[float] = None
+    hira_price: HiraPrice = None
 
     # CRIS 임상
     cris_trial_count: int = 0
-    cris_trials: list[dict] = []
+    cris_trials: list[CrisTrialBrief] = Field(default_factory=list)
 
     # 분석
     global_score: int
     korea_relevance_score: int = 0
-    hot_issue_level: str
-    hot_issue_reasons: list[str] = []
-    domestic_status: str
-    quadrant: str = "normal"
-    analysis_notes: list[str] = []
+    hot_issue_level: HotIssueLevel
+    hot_issue_reasons: list[str] = Field(default_factory=list)
+    domestic_status: DomesticStatusValue
+    quadrant: Quadrant = "normal"
+    analysis_notes: list[str] = Field(default_factory=list)
     summary: str = ""
 
-    _normalize_price = field_validator("hira_price", mode="before")(_nan_to_none)
 
-
-class HotIssueItem(BaseModel):
+@_list_row
+class HotIssueItem:
     """핫이슈 항목"""
     inn: str
     global_score: int
-    hot_issue_level: str
+    hot_issue_level: HotIssueLevel
     reasons: list[str]
     fda_approved: bool
     ema_approved: bool
@@ -97,29 +135,27 @@ class HotIssueItem(BaseModel):
     hira_reimbursed: bool
 
 
-class ImminentDrugItem(BaseModel):
+class ImminentDrugItem(APIModel):
     """국내 도입 임박 약물"""
     inn: str
     global_score: int
     fda_date: Optional[date] = None
     ema_date: Optional[date] = None
     hira_status: Optional[str] = None
-    hira_price: Optional[float] = None
+    hira_price: HiraPrice = None
     cris_trial_count: int
     days_since_global_approval: Optional[int] = None
-    analysis_notes: list[str] = []
-
-    _normalize_price = field_validator("hira_price", mode="before")(_nan_to_none)
+    analysis_notes: list[str] = Field(default_factory=list)
 
 
-class MedclaimInsight(BaseModel):
+class MedclaimInsight(APIModel):
     """메드클레임 시사점"""
     inn: str
 
     # 급여 현황
     hira_status: Optional[str] = None
     hira_criteria: str = ""
-    hira_price: Optional[float] = None
+    hira_price: HiraPrice = None
 
     # 분석
     is_orphan_drug: bool = False
@@ -127,35 +163,33 @@ class MedclaimInsight(BaseModel):
     estimated_burden: str = ""  # 예상 본인부담
 
     # 시사점
-    insights: list[str] = []
+    insights: list[str] = Field(default_factory=list)
 
-    _normalize_price = field_validator("hira_price", mode="before")(_nan_to_none)
 
-
-class ReportData(BaseModel):
+class ReportData(APIModel):
     """브리핑 리포트 데이터"""
     inn: str
     brand_name: str = ""
     indication: str = ""
 
     # 핵심 요약
-    key_points: list[str] = []
+    key_points: list[str] = Field(default_factory=list)
 
     # 글로벌 현황
-    global_status: dict = {}
+    global_status: dict = Field(default_factory=dict)
 
     # 국내 현황
-    domestic_status: dict = {}
+    domestic_status: dict = Field(default_factory=dict)
 
     # 메드클레임 시사점
     medclaim_insight: MedclaimInsight
 
     # 메타
     generated_at: datetime
-    data_sources: list[str] = []
+    data_sources: list[str] = Field(default_factory=list)
 
 
-class BriefingReportResponse(BaseModel):
+class BriefingReportResponse(APIModel):
     """LLM 브리핑 리포트 응답"""
     inn: str
     headline: str
@@ -170,7 +204,7 @@ class BriefingReportResponse(BaseModel):
 
 # ── v2 스키마 ──
 
-class PreprintResponse(BaseModel):
+class PreprintResponse(APIModel):
     """프리프린트 논문 응답"""
     doi: str
     title: str
@@ -184,7 +218,7 @@ class PreprintResponse(BaseModel):
     extracted_facts: Optional[dict] = None
 
 
-class MarketReportResponse(BaseModel):
+class MarketReportResponse(APIModel):
     """시장 리포트 응답"""
     source: str
     title: str
@@ -196,7 +230,7 @@ class MarketReportResponse(BaseModel):
     source_url: str = ""
 
 
-class ExpertOpinionResponse(BaseModel):
+class ExpertOpinionResponse(APIModel):
     """전문가 리뷰 응답"""
     source: str
     title: str
@@ -206,33 +240,42 @@ class ExpertOpinionResponse(BaseModel):
     source_url: str = ""
 
 
-class AIInsightResponse(BaseModel):
+class AIInsightResponse(APIModel):
     """AI 인사이트 응답"""
     impact_score: Optional[int] = None
-    risk_factors: list[str] = []
-    opportunity_factors: list[str] = []
+    risk_factors: list[str] = Field(default_factory=list)
+    opportunity_factors: list[str] = Field(default_factory=list)
     reasoning_chain: str = ""
     market_forecast: str = ""
     reasoning_model: str = ""
     verified_score: Optional[int] = None
-    corrections: list[dict] = []
+    corrections: list[Any] = Field(default_factory=list)  # 검증 LLM 출력 그대로 (요소 검증 생략)
     confidence_level: str = ""
     generated_at: Optional[datetime] = None
 
 
-class ArticleResponse(BaseModel):
+class ArticleResponse(APIModel):
     """AI 기사 응답"""
     article_type: str
     headline: str
     subtitle: str = ""
     lead_paragraph: str = ""
     body_html: str = ""
-    tags: list[str] = []
+    tags: list[str] = Field(default_factory=list)
     writer_model: str = ""
     generated_at: Optional[datetime] = None
 
 
-class ChangeLogResponse(BaseModel):
+class DrugPageResponse(APIModel):
+    """약물 상세 페이지 묶음 응답 (인사이트 + 기사 + 프리프린트 + 시장 리포트)"""
+    inn: str
+    insight: Optional[AIInsightResponse] = None
+    article: Optional[ArticleResponse] = None
+    preprints: list[PreprintResponse] = Field(default_factory=list)
+    market_reports: list[MarketReportResponse] = Field(default_factory=list)
+
+
+class ChangeLogResponse(APIModel):
     """변경 감지 로그 응답"""
     id: int
     drug_id: int
@@ -260,7 +303,7 @@ DOMESTIC_STATUS_KO = {
 }
 
 
-class RegulatoryEventBrief(BaseModel):
+class RegulatoryEventBrief(APIModel):
     """규제 이벤트 요약 (기관별 허가 정보)"""
     agency: str
     status: str = ""
@@ -270,7 +313,7 @@ class RegulatoryEventBrief(BaseModel):
     is_breakthrough: bool = False
 
 
-class DrugCardSummary(BaseModel):
+class DrugCardSummary(APIModel):
     """약물 카드 요약 (MedicinePage 리스트용)"""
     inn: str
     brand_name_ko: str = ""
@@ -278,10 +321,10 @@ class DrugCardSummary(BaseModel):
     company: str = ""
     category: str = ""
     domestic_status: str
-    agencies: list[str] = []
+    agencies: list[str] = Field(default_factory=list)
     global_score: int = 0
     korea_relevance_score: int = 0
-    hot_issue_level: str = "LOW"
+    hot_issue_level: HotIssueLevel = "LOW"
     issue_title: str = ""
     description: str = ""
     earliest_approval_date: Optional[date] = None
@@ -296,20 +339,18 @@ class DrugCardSummary(BaseModel):
 
 class DrugCardDetail(DrugCardSummary):
     """약물 카드 상세 (DrugDetailPage용)"""
-    regulatory_events: list[RegulatoryEventBrief] = []
+    regulatory_events: list[RegulatoryEventBrief] = Field(default_factory=list)
     article_headline: str = ""
     article_body_html: str = ""
     article_generated_at: Optional[datetime] = None
     hira_status: Optional[str] = None
-    hira_price: Optional[float] = None
+    hira_price: HiraPrice = None
     hira_criteria: str = ""
     indication: str = ""
     mechanism: str = ""
 
-    _normalize_hira_price = field_validator("hira_price", mode="before")(_nan_to_none)
-
 
-class DrugCardListResponse(BaseModel):
+class DrugCardListResponse(APIModel):
     """약물 카드 리스트 응답"""
     drugs: list[DrugCardSummary]
     total_count: int
@@ -317,7 +358,7 @@ class DrugCardListResponse(BaseModel):
     limit: int = 50
 
 
-class FeedItem(BaseModel):
+class FeedItem(APIModel):
     """대시보드 피드 항목"""
     feed_type: str  # "article" | "change"
     inn: str = ""
@@ -333,7 +374,30 @@ class FeedItem(BaseModel):
     new_value: str = ""
 
 
-class FeedResponse(BaseModel):
+class FeedResponse(APIModel):
     """대시보드 피드 응답"""
     items: list[FeedItem]
     total_count: int
+
+
+class ServiceInfo(APIModel):
+    """API 상태"""
+    service: str
+    version: str
+    status: str
+
+
+class HealthResponse(APIModel):
+    """헬스체크 응답"""
+    status: str
+    loaded_at: Optional[datetime] = None
+    drug_count: int
+    mode: str  # "postgres" | "json"
+
+
+# ── 목록 응답 직렬화 어댑터 (import 시 1회 빌드, 리스트 전체를 pydantic-core에서 한 번에) ──
+
+DRUG_SUMMARY_LIST = TypeAdapter(list[DrugSummary])
+HOT_ISSUE_LIST = TypeAdapter(list[HotIssueItem])
+IMMINENT_LIST = TypeAdapter(list[ImminentDrugItem])
+CHANGE_LOG_LIST = TypeAdapter(list[ChangeLogResponse])
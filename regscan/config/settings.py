@@ -14,10 +14,15 @@ class Settings(BaseSettings):
     # 프로젝트 경로
     BASE_DIR: Path = Path(__file__).parent.parent.parent
     DATA_DIR: Path = BASE_DIR / "data"
+    CACHE_DIR: Path = DATA_DIR / "cache"
 
     # DB (PostgreSQL for prod, SQLite for local dev)
     DATABASE_URL: str = f"sqlite+aiosqlite:///{DATA_DIR}/regscan.db"
     DATABASE_URL_SYNC: str = f"sqlite:///{DATA_DIR}/regscan.db"
+    # PostgreSQL 커넥션 풀 (프로세스당 엔진 1개를 공유 — 인스턴스 수 × (size + overflow) ≤ max_connections)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800  # 초
 
     # GCS (비어있으면 스킵 — 로컬 개발 시 불필요)
     GCS_BUCKET: str = ""
@@ -46,6 +51,12 @@ class Settings(BaseSettings):
     ANTHROPIC_API_KEY: Optional[str] = None
     LLM_TIMEOUT: float = 5.0
     USE_LLM: bool = True
+    # 요청 경로(/drugs/{inn}/briefing) LLM 호출 상한 — 초과 시 fallback 브리핑
+    BRIEFING_LLM_TIMEOUT: float = 60.0  # SDK 요청 1회당 타임아웃
+    BRIEFING_LLM_MAX_RETRIES: int = 2
+    BRIEFING_LLM_DEADLINE: float = 150.0  # 슬롯 대기·재시도 포함 전체 상한
+    BRIEFING_LLM_MAX_TOKENS: int = 3000
+    BRIEFING_LLM_MAX_CONCURRENCY: int = 4  # 프로세스당 동시 LLM 브리핑 생성 수
 
     # 공공데이터 API
     DATA_GO_KR_API_KEY: Optional[str] = None  # 공공데이터포털
@@ -68,9 +79,23 @@ class Settings(BaseSettings):
     GEMINI_API_KEY: Optional[str] = None
     ENABLE_GEMINI_PARSING: bool = False
     GEMINI_MODEL: str = "gemini-2.5-flash"
+    GEMINI_CACHE_TTL_DAYS: int = 30  # 프리프린트 개정 주기 고려
+    GEMINI_PDF_MODE: str = "auto"    # text / vision / auto (텍스트 추출 실패 시 vision)
+    PDF_MAX_BYTES: int = 50 * 1024 * 1024  # PDF 다운로드 상한 (50MB)
+
+    AI_MODE: str = "realtime"  # realtime / batch (OpenAI Batch API, 야간 실행용)
+    ENABLE_AI_CACHE: bool = True  # 입력 동일 시 reasoning/verifier 결과 재사용
+    AI_CACHE_TTL_DAYS: int = 30
 
     ENABLE_AI_REASONING: bool = False
     REASONING_MODEL: str = "o4-mini"
+    # 모델 라우팅: 소스가 거의 없는 단순 약물은 경량 모델(low effort)로 분석
+    ENABLE_REASONING_ROUTING: bool = True
+    REASONING_LIGHT_MODEL: str = "gpt-4o-mini"
+    REASONING_LIGHT_MAX_SOURCES: int = 2  # 프리프린트+시장+전문가 합계 상한
+    REASONING_LIGHT_MAX_SCORE: int = 40  # global_score 상한
+    REASONING_SOURCE_BUDGET_TOKENS: int = 8000  # 약물당 소스(B/C/D 스트림) 토큰 예산
+    REASONING_CTX_BUDGET: int = 100000  # 요청당 프롬프트 토큰 상한 (초과 시 소스 축소)
 
     ENABLE_AI_VERIFIER: bool = False
     VERIFIER_MODEL: str = "gpt-5.2"
@@ -81,6 +106,17 @@ class Settings(BaseSettings):
     # v2: 비용 제한
     MAX_REASONING_CALLS_PER_DAY: int = 50
     MAX_WRITER_CALLS_PER_DAY: int = 50
+    AI_CONCURRENCY: int = 8  # run_batch 동시 실행 약물 수
+    LLM_MAX_CONCURRENCY: int = 32  # 임상결과 판독 등 단일 LLM 호출 동시 실행 수
+    TRIAL_BATCH_POLL_MINUTES: int = 30  # 임상결과 판독 batch 수거 주기
+    # LLM SDK 공용 httpx 풀 (OpenAI/Anthropic)
+    LLM_HTTP_MAX_CONNECTIONS: int = 2000
+    LLM_HTTP_MAX_KEEPALIVE: int = 1500
+    LLM_HTTP_TIMEOUT: float = 300.0  # o4-mini high effort 응답 대기 포함
+    AI_RETRY_MAX_ATTEMPTS: int = 5  # 429/5xx 재시도 포함 최대 시도 횟수
+    AI_BREAKER_FAIL_MAX: int = 3  # 연속 실패 시 제공자 회로 개방
+    AI_BREAKER_RESET_SECONDS: int = 300
+    REASONING_BATCH_SIZE: int = 10  # 묶음 호출당 약물 수 (reasoning/verifier)
 
     # v2: 신규 소스 토글
     ENABLE_ASTI: bool = False
@@ -132,6 +168,9 @@ class Settings(BaseSettings):
     NEWS_FETCH_LIMIT: int = 5              # INN당 프롬프트 주입 최대 건수
     NEWS_FETCH_TIMEOUT: float = 15.0       # RSS 수집 타임아웃(초)
 
+    # 대시보드 HTML 템플릿
+    TEMPLATE_AUTO_RELOAD: bool = False  # True면 렌더마다 템플릿 파일 변경 확인 (템플릿 편집 중 개발용)
+
     # 로깅
     LOG_LEVEL: str = "INFO"
 
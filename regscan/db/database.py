@@ -7,7 +7,7 @@
 import logging
 from typing import Optional
 
-from sqlalchemy import create_engine, Engine
+from sqlalchemy import create_engine, Engine, text
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     AsyncEngine,
@@ -32,10 +32,10 @@ def _pool_kwargs() -> dict:
     """PostgreSQL 커넥션 풀링 설정 (SQLite에서는 무시)"""
     if settings.is_postgres:
         return {
-            "pool_size": 5,
-            "max_overflow": 10,
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
             "pool_pre_ping": True,
-            "pool_recycle": 1800,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
         }
     return {}
 
@@ -89,11 +89,40 @@ def get_sync_session() -> sessionmaker[Session]:
     return _sync_session_factory
 
 
+# create_all은 기존 테이블에 새 인덱스를 추가하지 않으므로 기동 시 보강 (멱등)
+_INDEX_DDL = [
+    "CREATE INDEX IF NOT EXISTS idx_hira_price_ceiling ON hira_reimbursements (price_ceiling)",
+    "CREATE INDEX IF NOT EXISTS idx_drugs_inn_lower ON drugs (lower(inn))",
+    "CREATE INDEX IF NOT EXISTS idx_briefing_generated_at ON stream_briefings (generated_at)",
+    "CREATE INDEX IF NOT EXISTS idx_article_drug_type_date ON articles (drug_id, article_type, generated_at)",
+    "CREATE INDEX IF NOT EXISTS idx_market_drug_date ON market_reports (drug_id, published_date)",
+    "CREATE INDEX IF NOT EXISTS idx_pdufa_status_date ON pdufa_dates (status, pdufa_date)",
+]
+
+# PostgreSQL 전용 — asearch ILIKE '%q%'용 trigram GIN 인덱스
+_PG_INDEX_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS idx_drugs_inn_trgm ON drugs USING gin (inn gin_trgm_ops)",
+]
+
+
+async def _ensure_indexes(engine: AsyncEngine) -> None:
+    """보조 인덱스 생성 — 권한 부족 등으로 실패해도 기동은 계속"""
+    statements = _INDEX_DDL + (_PG_INDEX_DDL if settings.is_postgres else [])
+    for ddl in statements:
+        try:
+            async with engine.begin() as conn:
+                await conn.execute(text(ddl))
+        except Exception as e:
+            logger.warning(f"인덱스 생성 건너뜀 ({ddl.split(' ON ')[0]}): {e}")
+
+
 async def init_db() -> None:
     """DB 테이블 생성 (없으면 CREATE)"""
     engine = get_async_engine()
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    await _ensure_indexes(engine)
     logger.info("DB 테이블 초기화 완료")
 
 
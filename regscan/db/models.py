@@ -32,7 +32,7 @@ from typing import Optional
 
 from sqlalchemy import (
     Column, String, DateTime, Text, Index, Integer,
-    Boolean, Float, Date, ForeignKey, JSON,
+    Boolean, Float, Date, ForeignKey, JSON, func,
 )
 from sqlalchemy.orm import DeclarativeBase, relationship
 
@@ -94,6 +94,7 @@ class DrugDB(Base):
 
     __table_args__ = (
         Index("idx_drugs_score", "global_score", "hot_issue_level"),
+        Index("idx_drugs_inn_lower", func.lower(inn)),  # aget_by_inn 대소문자 무시 조회
     )
 
 
@@ -163,6 +164,10 @@ class HIRAReimbursementDB(Base):
 
     drug = relationship("DrugDB", back_populates="hira")
 
+    __table_args__ = (
+        Index("idx_hira_price_ceiling", "price_ceiling"),  # 고가 약물 top-K
+    )
+
 
 # ──────────────────────────────────────────────
 # 4. clinical_trials — CRIS 임상
@@ -318,6 +323,7 @@ class MarketReportDB(Base):
 
     __table_args__ = (
         Index("idx_market_drug_source", "drug_id", "source"),
+        Index("idx_market_drug_date", "drug_id", "published_date"),  # 약물별 최신순
     )
 
 
@@ -409,7 +415,7 @@ class ArticleDB(Base):
     drug = relationship("DrugDB", back_populates="articles")
 
     __table_args__ = (
-        Index("idx_article_drug_type", "drug_id", "article_type"),
+        Index("idx_article_drug_type_date", "drug_id", "article_type", "generated_at"),  # 유형별 최신 기사
     )
 
 
@@ -533,7 +539,7 @@ class PdufaDateDB(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     __table_args__ = (
-        Index("idx_pdufa_date_status", "pdufa_date", "status"),
+        Index("idx_pdufa_status_date", "status", "pdufa_date"),  # status 일치 + 날짜 범위 스캔
     )
 
 
@@ -597,6 +603,7 @@ class StreamBriefingDB(Base):
 
     __table_args__ = (
         Index("idx_briefing_stream_type", "stream_name", "briefing_type"),
+        Index("idx_briefing_generated_at", "generated_at"),  # 히스토리 최신순 keyset 조회
     )
 
 
@@ -8,17 +8,16 @@
 
 from __future__ import annotations
 
-import json
 import re
 from pathlib import Path
 
+import orjson
+
 _ASSETS_DIR = Path(__file__).resolve().parent / "assets"
 
 
 def _load_json(filename: str) -> list | dict:
-    path = _ASSETS_DIR / filename
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return orjson.loads((_ASSETS_DIR / filename).read_bytes())
 
 
 # ════════════════════════════════════════════════════════════════════
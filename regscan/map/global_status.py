@@ -37,7 +37,7 @@ class HotIssueLevel(str, Enum):
     LOW = "LOW"      # 40점 미만: 일반
 
 
-@dataclass
+@dataclass(slots=True)
 class RegulatoryApproval:
     """개별 규제기관 승인 정보"""
     agency: str                          # FDA, EMA, PMDA, MFDS
@@ -72,7 +72,7 @@ class RegulatoryApproval:
         ])
 
 
-@dataclass
+@dataclass(slots=True)
 class GlobalRegulatoryStatus:
     """글로벌 규제 현황"""
 
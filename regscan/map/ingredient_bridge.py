@@ -287,6 +287,8 @@ class IngredientBridge:
         if not path.exists():
             raise FileNotFoundError(f"HIRA data not found: {path}")
 
+        # 수집기(drug_price_collector)가 빈 가격을 bare NaN으로 기록하므로
+        # NaN 리터럴을 허용하는 stdlib json으로 읽는다 (orjson은 거부)
         with open(path, "r", encoding="utf-8") as f:
             data = json.load(f)
 
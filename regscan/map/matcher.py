@@ -10,12 +10,13 @@ import re
 from dataclasses import dataclass
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Optional
-
-import pandas as pd
+from typing import TYPE_CHECKING, Any, Optional
 
 from .timeline import DrugTimeline, TimelineBuilder, FDAInfo, MFDSInfo, HIRAInfo
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class IngredientMatcher:
     """성분명 정규화 및 매칭"""
@@ -377,6 +378,8 @@ class DrugMatcher:
         """ATC 매핑 데이터 로드"""
         path = Path(path)
         if path.exists():
+            import pandas as pd  # regscan.map import 시 pandas 로드 방지 (ATC 엑셀 전용)
+
             self._atc_data = pd.read_excel(path, skiprows=1)
 
     def load_hira_data(self, path: str | Path) -> None:
@@ -1,7 +1,7 @@
 """CRIS 응답 파서"""
 
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 import re
 
 
@@ -296,8 +296,8 @@ class CRISTrialParser:
             return ""
         return f"https://cris.nih.go.kr/cris/search/detailSearch.do?search_lang=K&focus=reset&trial_id={trial_id}"
 
-    def parse_many(self, raw_list: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        """여러 결과 파싱"""
+    def parse_many(self, raw_list: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        """여러 결과 파싱 (list 또는 스트리밍 iterable)"""
         return [self.parse_trial(raw) for raw in raw_list]
 
     def find_matching_trials_for_inn(
@@ -1,7 +1,7 @@
 """EMA 응답 파서"""
 
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 
 def parse_ema_date(date_str: str) -> str:
@@ -156,8 +156,8 @@ class EMAMedicineParser:
         # EMA 제품 번호로 URL 생성
         return f"https://www.ema.europa.eu/en/medicines/human/EPAR/{ema_number}"
 
-    def parse_many(self, raw_list: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        """여러 결과 파싱"""
+    def parse_many(self, raw_list: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        """여러 결과 파싱 (list 또는 스트리밍 iterable)"""
         return [self.parse_medicine(raw) for raw in raw_list]
 
 
@@ -2,7 +2,7 @@
 
 import logging
 from datetime import date, datetime
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -184,6 +184,6 @@ class FDADrugParser:
 
         return f"https://www.accessdata.fda.gov/scripts/cder/daf/index.cfm?event=overview.process&ApplNo={app_num_only}"
 
-    def parse_many(self, raw_list: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        """여러 결과 파싱"""
+    def parse_many(self, raw_list: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        """여러 결과 파싱 (list 또는 스트리밍 iterable)"""
         return [self.parse_approval(raw) for raw in raw_list]
@@ -1,7 +1,7 @@
 """MFDS 응답 파서"""
 
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 import re
 import html
 
@@ -195,8 +195,8 @@ class MFDSPermitParser:
             return ""
         return f"https://nedrug.mfds.go.kr/pbp/CCBBB01/getItemDetail?itemSeq={item_seq}"
 
-    def parse_many(self, raw_list: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        """여러 결과 파싱"""
+    def parse_many(self, raw_list: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        """여러 결과 파싱 (list 또는 스트리밍 iterable)"""
         return [self.parse_permit(raw) for raw in raw_list]
 
     def is_new_drug(self, parsed: dict[str, Any]) -> bool:
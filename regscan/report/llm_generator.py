@@ -5,7 +5,7 @@ import logging
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from pathlib import Path
-from typing import Optional, Any
+from typing import Any, AsyncIterator, Optional
 
 from regscan.config import settings
 
@@ -165,9 +165,21 @@ class LLMBriefingGenerator:
         provider: str = "openai",  # "openai", "anthropic", or "gemini"
         model: Optional[str] = None,
         api_key: Optional[str] = None,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        max_output_tokens: int = 3000,
     ):
+        """
+        Args:
+            timeout: 요청당 SDK 타임아웃(초) — None이면 SDK 기본값
+            max_retries: SDK 재시도 횟수 — None이면 SDK 기본값
+            max_output_tokens: 응답 토큰 상한
+        """
         self.provider = provider
         self.api_key = api_key
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.max_output_tokens = max_output_tokens
 
         if provider == "anthropic":
             self.model = model or "claude-sonnet-4-20250514"
@@ -180,21 +192,60 @@ class LLMBriefingGenerator:
             self.api_key = api_key or settings.OPENAI_API_KEY
 
         self._client = None
+        self._async_client = None
+        self._async_http_client = None
+
+    def _sdk_options(self) -> dict[str, Any]:
+        """OpenAI/Anthropic 클라이언트 공통 timeout·max_retries (지정한 값만)"""
+        options: dict[str, Any] = {}
+        if self.timeout is not None:
+            options["timeout"] = self.timeout
+        if self.max_retries is not None:
+            options["max_retries"] = self.max_retries
+        return options
+
+    def _token_param(self) -> dict[str, int]:
+        """OpenAI 응답 토큰 상한 — GPT-5/o 계열은 max_completion_tokens 사용"""
+        if any(tag in self.model for tag in ("gpt-5", "o1", "o3", "o4")):
+            return {"max_completion_tokens": self.max_output_tokens}
+        return {"max_tokens": self.max_output_tokens}
 
     def _get_client(self):
         """LLM 클라이언트 lazy loading"""
         if self._client is None:
             if self.provider == "anthropic":
                 import anthropic
-                self._client = anthropic.Anthropic(api_key=self.api_key)
+                self._client = anthropic.Anthropic(api_key=self.api_key, **self._sdk_options())
             elif self.provider == "gemini":
                 from google import genai
                 self._client = genai.Client(api_key=self.api_key)
             else:
                 import openai
-                self._client = openai.OpenAI(api_key=self.api_key)
+                self._client = openai.OpenAI(api_key=self.api_key, **self._sdk_options())
         return self._client
 
+    def _get_async_client(self):
+        """OpenAI/Anthropic 비동기 클라이언트 (공용 httpx 풀 — 루프 변경 시 재생성)
+
+        요청 경로의 wait_for 취소가 진행 중인 HTTP 요청까지 끊도록
+        브리핑 생성은 동기 SDK + 스레드풀 대신 이 클라이언트를 사용한다.
+        """
+        from regscan.ai.http_client import get_llm_http_client
+
+        http_client = get_llm_http_client()
+        if self._async_client is None or self._async_http_client is not http_client:
+            if self.provider == "anthropic":
+                from anthropic import AsyncAnthropic
+                client_cls = AsyncAnthropic
+            else:
+                from openai import AsyncOpenAI
+                client_cls = AsyncOpenAI
+            self._async_client = client_cls(
+                api_key=self.api_key, http_client=http_client, **self._sdk_options(),
+            )
+            self._async_http_client = http_client
+        return self._async_client
+
     @staticmethod
     def _estimate_mfds_timeline(impact: DomesticImpact) -> str | None:
         """글로벌 승인 경과일 기반 MFDS 허가 타임라인 — 순수 사실만 제공, 해석은 LLM에 위임"""
@@ -722,98 +773,156 @@ class LLMBriefingGenerator:
     async def _call_llm_v4(
         self, prompt: str, impact: DomesticImpact,
     ) -> str:
-        """V4 LLM 호출 (툴콜링 지원, 스레드풀 기반)"""
-        import asyncio
-        return await asyncio.to_thread(
-            self._call_llm_v4_sync, prompt, impact,
-        )
+        """V4 LLM 호출 — OpenAI 툴콜링 지원, 나머지 프로바이더는 직접 호출
 
-    def _call_llm_v4_sync(self, prompt: str, impact: DomesticImpact) -> str:
-        """V4 LLM 동기 호출 — OpenAI 툴콜링 지원, 나머지 프로바이더는 직접 호출"""
-        client = self._get_client()
+        OpenAI/Anthropic은 비동기 SDK로 호출해 취소가 요청까지 전달된다.
+        Gemini는 동기 SDK라 스레드풀에서 실행 (요청 경로에서는 쓰지 않음).
+        """
+        if self.provider == "gemini":
+            import asyncio
+            return await asyncio.to_thread(self._call_gemini_v4_sync, prompt)
 
-        if self.provider == "openai":
-            return self._call_llm_v4_openai(client, prompt, impact)
-        elif self.provider == "anthropic":
-            response = client.messages.create(
+        client = self._get_async_client()
+        if self.provider == "anthropic":
+            response = await client.messages.create(
                 model=self.model,
-                max_tokens=3000,
+                max_tokens=self.max_output_tokens,
                 system=SYSTEM_PROMPT_V4,
                 messages=[{"role": "user", "content": prompt}],
             )
             if not response.content:
                 return ""
             return response.content[0].text
-        elif self.provider == "gemini":
-            full_prompt = f"{SYSTEM_PROMPT_V4}\n\n{prompt}"
-            response = client.models.generate_content(
-                model=self.model,
-                contents=full_prompt,
-            )
-            return response.text if response.text else ""
-        else:
-            return self._call_llm_v4_openai(client, prompt, impact)
+        return await self._call_llm_v4_openai(client, prompt, impact)
+
+    def _call_gemini_v4_sync(self, prompt: str) -> str:
+        """V4 Gemini 동기 호출"""
+        client = self._get_client()
+        full_prompt = f"{SYSTEM_PROMPT_V4}\n\n{prompt}"
+        response = client.models.generate_content(
+            model=self.model,
+            contents=full_prompt,
+        )
+        return response.text if response.text else ""
 
-    def _call_llm_v4_openai(
+    async def _call_llm_v4_openai(
         self, client, prompt: str, impact: DomesticImpact,
     ) -> str:
         """OpenAI V4 호출 — 툴콜링 루프"""
-        token_param = (
-            {"max_completion_tokens": 3000}
-            if "gpt-5" in self.model or "o1" in self.model
-               or "o3" in self.model or "o4" in self.model
-            else {"max_tokens": 3000}
-        )
+        parts = [
+            text async for text in self._openai_tool_loop(client, self._v4_messages(prompt), impact)
+        ]
+        return "".join(parts)
 
-        messages = [
+    @staticmethod
+    def _v4_messages(prompt: str) -> list[Any]:
+        """V4 system + user 메시지"""
+        return [
             {"role": "system", "content": SYSTEM_PROMPT_V4},
             {"role": "user", "content": prompt},
         ]
 
-        response = client.chat.completions.create(
-            model=self.model,
-            messages=messages,
-            tools=self.V4_TOOLS,
-            response_format={"type": "json_object"},
-            **token_param,
-        )
-
-        if not response.choices:
-            return ""
+    async def _openai_tool_loop(
+        self, client, messages: list[Any], impact: DomesticImpact, stream: bool = False,
+    ) -> AsyncIterator[str]:
+        """OpenAI V4 툴콜링 루프 (툴콜 최대 3회 + 최종 응답) — 최종 라운드 본문만 yield
 
-        # 툴콜링 루프 (최대 3회)
-        max_rounds = 3
-        for _ in range(max_rounds):
-            msg = response.choices[0].message
-            if not msg.tool_calls:
-                break
+        stream=True면 라운드마다 스트림으로 받아 tool_calls를 조립하고, 최종 라운드 본문은
+        델타 단위로 도착 즉시 yield한다. 라운드 구분은 첫 델타로 한다: 본문으로 시작하면
+        최종 라운드(이후 tool_calls는 무시), tool_calls로 시작하면 툴콜 라운드(본문은 버림).
+        """
+        extra: dict[str, Any] = {}
+        if stream:
+            from regscan.ai.streaming import STREAM_KWARGS
+            extra = STREAM_KWARGS
 
-            messages.append(msg)
-            for tc in msg.tool_calls:
+        for _ in range(4):
+            response = await client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                tools=self.V4_TOOLS,
+                response_format={"type": "json_object"},
+                **self._token_param(),
+                **extra,
+            )
+            if stream:
+                assembled: dict[int, dict[str, str]] = {}
+                final = None
+                async for chunk in response:
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta
+                    if final is None and (delta.content or delta.tool_calls):
+                        final = not delta.tool_calls
+                    if final:
+                        if delta.content:
+                            yield delta.content
+                        continue
+                    for tc in delta.tool_calls or ():
+                        call = assembled.setdefault(tc.index, {"id": "", "name": "", "arguments": ""})
+                        if tc.id:
+                            call["id"] = tc.id
+                        if tc.function and tc.function.name:
+                            call["name"] += tc.function.name
+                        if tc.function and tc.function.arguments:
+                            call["arguments"] += tc.function.arguments
+                calls = [assembled[i] for i in sorted(assembled)]
+            else:
+                if not response.choices:
+                    return
+                msg = response.choices[0].message
+                if not msg.tool_calls:
+                    if msg.content:
+                        yield msg.content
+                    return
+                calls = [
+                    {"id": tc.id, "name": tc.function.name, "arguments": tc.function.arguments}
+                    for tc in msg.tool_calls
+                ]
+            if not calls:
+                return
+
+            messages.append({
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [
+                    {
+                        "id": c["id"],
+                        "type": "function",
+                        "function": {"name": c["name"], "arguments": c["arguments"]},
+                    }
+                    for c in calls
+                ],
+            })
+            for c in calls:
                 try:
-                    args = json.loads(tc.function.arguments)
+                    args = json.loads(c["arguments"] or "{}")
                 except json.JSONDecodeError:
                     args = {}
-                result = self._execute_tool(
-                    tc.function.name, args, impact,
-                )
                 messages.append({
                     "role": "tool",
-                    "tool_call_id": tc.id,
-                    "content": json.dumps(result, ensure_ascii=False),
+                    "tool_call_id": c["id"],
+                    "content": json.dumps(
+                        self._execute_tool(c["name"], args, impact), ensure_ascii=False,
+                    ),
                 })
 
-            response = client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                tools=self.V4_TOOLS,
-                response_format={"type": "json_object"},
-                **token_param,
-            )
-            if not response.choices:
-                return ""
-
-        return response.choices[0].message.content or ""
+    def _report_from_v4(self, impact: DomesticImpact, response_text: str) -> BriefingReport:
+        """V4 응답 텍스트(JSON) → BriefingReport"""
+        parsed = self._parse_json_response(response_text)
+        return BriefingReport(
+            inn=self._to_display_case(impact.inn),
+            headline=parsed.get(
+                "headline",
+                f"{self._to_display_case(impact.inn)} 규제 동향",
+            ),
+            subtitle=parsed.get("subtitle", ""),
+            key_points=parsed.get("key_points", []),
+            global_section=parsed.get("global_insight_text", ""),
+            domestic_section=parsed.get("domestic_insight_text", ""),
+            medclaim_section=parsed.get("medclaim_action_text", ""),
+            source_data=impact.to_dict(),
+        )
 
     async def generate_v4(self, impact: DomesticImpact) -> BriefingReport:
         """V4 브리핑 리포트 생성 — 팩트/인사이트 분리"""
@@ -822,25 +931,38 @@ class LLMBriefingGenerator:
 
         try:
             response_text = await self._call_llm_v4(prompt, impact)
-            parsed = self._parse_json_response(response_text)
-
-            return BriefingReport(
-                inn=self._to_display_case(impact.inn),
-                headline=parsed.get(
-                    "headline",
-                    f"{self._to_display_case(impact.inn)} 규제 동향",
-                ),
-                subtitle=parsed.get("subtitle", ""),
-                key_points=parsed.get("key_points", []),
-                global_section=parsed.get("global_insight_text", ""),
-                domestic_section=parsed.get("domestic_insight_text", ""),
-                medclaim_section=parsed.get("medclaim_action_text", ""),
-                source_data=impact.to_dict(),
-            )
+            return self._report_from_v4(impact, response_text)
         except Exception as e:
             logger.error("V4 리포트 생성 실패: %s", e)
             return self._generate_fallback(impact)
 
+    async def generate_stream(
+        self, impact: DomesticImpact,
+    ) -> AsyncIterator[str | BriefingReport]:
+        """V4 브리핑을 스트리밍 생성 — 본문 델타(str)를 도착 즉시 yield, 마지막에 BriefingReport
+
+        OpenAI만 토큰 스트리밍 (툴콜 루프는 generate()와 공용, 최종 라운드 본문만 전송).
+        다른 프로바이더는 generate() 결과만 yield. 실패 시 fallback 리포트로 종료.
+        """
+        if self.provider != "openai":
+            yield await self.generate(impact)
+            return
+
+        drug_data = self._prepare_drug_data_v4(impact)
+        messages = self._v4_messages(BRIEFING_REPORT_PROMPT_V4.format(drug_data=drug_data))
+
+        try:
+            client = self._get_async_client()
+            parts: list[str] = []
+            async for text in self._openai_tool_loop(client, messages, impact, stream=True):
+                parts.append(text)
+                yield text
+            report = self._report_from_v4(impact, "".join(parts))
+        except Exception as e:
+            logger.error("V4 스트리밍 리포트 생성 실패: %s", e)
+            report = self._generate_fallback(impact)
+        yield report
+
     async def generate(self, impact: DomesticImpact) -> BriefingReport:
         """브리핑 리포트 생성 — V4.1 (팩트/인사이트 분리 + Executive Tone)"""
         return await self.generate_v4(impact)
@@ -868,7 +990,7 @@ class LLMBriefingGenerator:
         if self.provider == "anthropic":
             response = client.messages.create(
                 model=self.model,
-                max_tokens=3000,
+                max_tokens=self.max_output_tokens,
                 system=SYSTEM_PROMPT,
                 messages=[{"role": "user", "content": prompt}],
             )
@@ -887,12 +1009,7 @@ class LLMBriefingGenerator:
                 return ""
             return response.text
         else:
-            # GPT-5 등 최신 모델은 max_completion_tokens 사용
-            token_param = (
-                {"max_completion_tokens": 3000}
-                if "gpt-5" in self.model or "o1" in self.model or "o3" in self.model or "o4" in self.model
-                else {"max_tokens": 3000}
-            )
+            token_param = self._token_param()
             response = client.chat.completions.create(
                 model=self.model,
                 messages=[
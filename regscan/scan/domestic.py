@@ -8,6 +8,8 @@
 
 from __future__ import annotations
 
+import re
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum
@@ -23,6 +25,14 @@ from regscan.map.ingredient_bridge import (
 from regscan.map.matcher import IngredientMatcher
 
 
+# global_score → 핫이슈 등급 (40 / 60 / 80점 경계, 이상이면 상위 등급)
+_HOT_LEVEL_BOUNDS = (40, 60, 80)
+_HOT_LEVELS = ("LOW", "MID", "HIGH", "HOT")
+
+# hot_issue_reasons 중 희귀의약품 지정 사유 (한/영)
+_ORPHAN_RE = re.compile("희귀|Orphan")
+
+
 class DomesticStatus(str, Enum):
     """국내 시장 상태"""
 
@@ -41,7 +51,7 @@ class DomesticStatus(str, Enum):
     NOT_APPLICABLE = "not_applicable"            # 분석 대상 아님
 
 
-@dataclass
+@dataclass(slots=True)
 class ClinicalTrialInfo:
     """CRIS 임상시험 정보"""
     trial_id: str
@@ -52,7 +62,7 @@ class ClinicalTrialInfo:
     sponsor: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class DomesticImpact:
     """국내 영향 분석 결과"""
 
@@ -101,6 +111,16 @@ class DomesticImpact:
     clinical_results: Optional[dict] = None
     clinical_results_nct_id: str = ""
 
+    # 기사 생성 시 주입되는 보강 데이터 (publish_articles / LLM 생성기)
+    # slots=True라 임의 속성을 붙일 수 없으므로 필드로 선언
+    _source_urls: Optional[dict] = field(default=None, init=False, repr=False)
+    _indication_text: str = field(default="", init=False, repr=False)
+    _pharmacotherapeutic_group: str = field(default="", init=False, repr=False)
+    _limitations_text: str = field(default="", init=False, repr=False)
+    _competitors: Optional[list] = field(default=None, init=False, repr=False)
+    _copay_exemption: Optional[dict] = field(default=None, init=False, repr=False)
+    _news_cache: Optional[dict] = field(default=None, init=False, repr=False)
+
     @property
     def quadrant(self) -> str:
         """2축 분류 4분면 결정"""
@@ -112,6 +132,16 @@ class DomesticImpact:
             return "track"
         return "normal"
 
+    @property
+    def hot_issue_level(self) -> str:
+        """global_score 기반 핫이슈 등급 (HOT / HIGH / MID / LOW)"""
+        return _HOT_LEVELS[bisect_right(_HOT_LEVEL_BOUNDS, self.global_score)]
+
+    @property
+    def is_orphan(self) -> bool:
+        """희귀의약품 지정 여부 (hot_issue_reasons 기반)"""
+        return any(_ORPHAN_RE.search(r) for r in self.hot_issue_reasons)
+
     @property
     def is_globally_approved(self) -> bool:
         """FDA 또는 EMA 승인 여부"""
@@ -297,7 +327,7 @@ class KoreaRelevanceScorer:
             reasons.append("국내 다빈도 질환")
 
         # 6. MFDS 희귀의약품
-        if any("희귀" in r or "Orphan" in r for r in impact.hot_issue_reasons):
+        if impact.is_orphan:
             score += self.WEIGHTS["mfds_orphan"]
             reasons.append("희귀의약품 지정")
 
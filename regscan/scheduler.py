@@ -3,6 +3,7 @@
 매일 지정 시간에 일간 스캔 → 브리핑 생성 → HTML 생성 → 데이터 리로드를 실행합니다.
 """
 
+import asyncio
 import importlib
 import json
 import logging
@@ -11,8 +12,15 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from apscheduler.events import (
+    EVENT_JOB_ERROR,
+    EVENT_JOB_EXECUTED,
+    EVENT_JOB_MISSED,
+    EVENT_JOB_SUBMITTED,
+)
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 
 from regscan.config import settings
 
@@ -21,6 +29,11 @@ logger = logging.getLogger(__name__)
 # 모듈 레벨 상태
 _scheduler: Optional[AsyncIOScheduler] = None
 _last_run: Optional[dict] = None  # 마지막 실행 결과
+# get_scheduler_status 스냅샷 — 상태가 바뀌는 시점(시작/종료/잡 제출·완료)에만 무효화
+_status: Optional[dict] = None
+# 파이프라인 실행 태스크 (/run-now·cron 공용, 중복 실행 방지) + 마지막 실행 오류
+_current_pipeline: Optional[asyncio.Task] = None
+_last_error: Optional[str] = None
 
 OUTPUT_DIR = settings.BASE_DIR / "output" / "daily_scan"
 
@@ -174,6 +187,7 @@ async def run_daily_pipeline() -> dict:
             try:
                 from regscan.db.loader import DBLoader
                 loader = DBLoader()
+                # store는 reload_data()가 방금 만든 새 DataStore라 aget_by_inn 캐시가 비어 있음
                 load_result = await loader.upsert_impacts(store.impacts)
                 result_summary["steps"]["db_load"] = load_result
                 logger.info(f"      DB 적재 완료: {load_result}")
@@ -225,18 +239,22 @@ async def run_daily_pipeline() -> dict:
                         v2_loader = V2Loader()
                         hot_issues = store.get_hot_issues(min_score=60)
 
-                        for drug in hot_issues[:10]:
+                        drug_dicts = [
+                            {
+                                "inn": drug.inn,
+                                "fda_approved": drug.fda_approved,
+                                "ema_approved": drug.ema_approved,
+                                "mfds_approved": drug.mfds_approved,
+                                "global_score": drug.global_score,
+                                "hira_status": drug.hira_status.value if drug.hira_status else None,
+                                "hira_price": drug.hira_price,
+                            }
+                            for drug in hot_issues[:10]
+                        ]
+                        ai_results = await ai_pipeline.run_batch(drug_dicts)
+
+                        for drug, (insight, article) in zip(hot_issues[:10], ai_results):
                             try:
-                                drug_dict = {
-                                    "inn": drug.inn,
-                                    "fda_approved": drug.fda_approved,
-                                    "ema_approved": drug.ema_approved,
-                                    "mfds_approved": drug.mfds_approved,
-                                    "global_score": drug.global_score,
-                                    "hira_status": drug.hira_status.value if drug.hira_status else None,
-                                    "hira_price": drug.hira_price,
-                                }
-                                insight, article = await ai_pipeline.run(drug=drug_dict)
                                 drug_id = await v2_loader.get_drug_id(drug.inn)
                                 if insight:
                                     await v2_loader.save_ai_insight(drug_id, insight)
@@ -300,10 +318,69 @@ async def run_daily_pipeline() -> dict:
         result_summary["duration_seconds"] = round(duration, 1)
         logger.error(f"=== 일간 파이프라인 실패: {e} ({duration:.1f}초) ===", exc_info=True)
 
+    # 재생성된 브리핑·인사이트·기사가 반영되도록 API 응답 캐시 비움
+    from regscan.api.deps import briefing_cache
+    briefing_cache.clear()
+
     _last_run = result_summary
+    _invalidate_status()
     return result_summary
 
 
+def start_pipeline_task() -> Optional[asyncio.Task]:
+    """일간 파이프라인을 백그라운드 태스크로 시작 (이미 실행 중이면 None)"""
+    global _current_pipeline
+    if _current_pipeline is not None and not _current_pipeline.done():
+        return None
+    _current_pipeline = asyncio.create_task(run_daily_pipeline(), name="daily_pipeline")
+    _current_pipeline.add_done_callback(_on_pipeline_done)
+    _invalidate_status()
+    return _current_pipeline
+
+
+async def _run_scheduled_pipeline() -> None:
+    """cron 잡 — /run-now와 같은 태스크 가드로 실행 (pipeline_running/last_error 반영)
+
+    이미 실행 중이면 건너뛴다. 태스크 종료까지 기다려 잡 실행 시간에 포함시키되,
+    예외는 _on_pipeline_done이 기록하므로 여기서 다시 올리지 않는다.
+    """
+    task = start_pipeline_task()
+    if task is None:
+        logger.warning("일간 파이프라인이 이미 실행 중 — 예약 실행 건너뜀")
+        return
+    await asyncio.wait([task])
+
+
+def _on_pipeline_done(task: asyncio.Task) -> None:
+    """파이프라인 태스크 종료 — 예외를 삼키지 않고 기록해 상태 조회에 노출"""
+    global _last_error
+    if task.cancelled():
+        _last_error = "cancelled"
+        logger.warning("일간 파이프라인 태스크 취소됨")
+    elif task.exception() is not None:
+        exc = task.exception()
+        _last_error = f"{type(exc).__name__}: {exc}"
+        logger.error("일간 파이프라인 태스크 실패", exc_info=exc)
+    else:
+        result = task.result()
+        _last_error = result.get("error") if result.get("status") == "error" else None
+    _invalidate_status()
+
+
+async def poll_trial_batches() -> int:
+    """제출된 임상결과 판독 batch 수거 (OpenAI Batch API 완료분)"""
+    from regscan.ai.trial_reader import TrialResultReader
+
+    try:
+        results = await TrialResultReader().poll_batches()
+    except Exception as e:
+        logger.error(f"임상결과 batch 수거 실패: {e}")
+        return 0
+    if results:
+        logger.info(f"임상결과 batch 수거: {len(results)}건")
+    return len(results)
+
+
 def start_scheduler() -> None:
     """스케줄러 시작"""
     global _scheduler
@@ -314,7 +391,7 @@ def start_scheduler() -> None:
 
     _scheduler = AsyncIOScheduler()
     _scheduler.add_job(
-        run_daily_pipeline,
+        _run_scheduled_pipeline,
         trigger=CronTrigger(
             hour=settings.DAILY_SCAN_HOUR,
             minute=settings.DAILY_SCAN_MINUTE,
@@ -323,7 +400,21 @@ def start_scheduler() -> None:
         name="일간 규제 스캔 파이프라인",
         replace_existing=True,
     )
+    if settings.OPENAI_API_KEY:
+        _scheduler.add_job(
+            poll_trial_batches,
+            trigger=IntervalTrigger(minutes=settings.TRIAL_BATCH_POLL_MINUTES),
+            id="trial_batch_poll",
+            name="임상결과 판독 batch 수거",
+            replace_existing=True,
+        )
+    # 잡 제출 시 next_run_time이 갱신되므로 스냅샷 무효화
+    _scheduler.add_listener(
+        lambda event: _invalidate_status(),
+        EVENT_JOB_SUBMITTED | EVENT_JOB_EXECUTED | EVENT_JOB_ERROR | EVENT_JOB_MISSED,
+    )
     _scheduler.start()
+    _invalidate_status()
 
     next_run = _scheduler.get_job("daily_pipeline").next_run_time
     logger.info(
@@ -339,17 +430,40 @@ def stop_scheduler() -> None:
     if _scheduler is not None:
         _scheduler.shutdown(wait=False)
         _scheduler = None
+        _invalidate_status()
         logger.info("스케줄러 종료")
 
 
+def _invalidate_status() -> None:
+    global _status
+    _status = None
+
+
 def get_scheduler_status() -> dict:
-    """스케줄러 상태 조회"""
+    """스케줄러 상태 조회
+
+    요청마다 APScheduler 잡 스토어를 조회하지 않도록 스냅샷을 재사용한다
+    (상태 변화 시점에 _invalidate_status로 무효화). 반환 dict는 수정하지 말 것.
+    cache_info는 API 응답 캐시가 제자리 갱신하는 통계 dict라 항상 현재 값이다.
+    """
+    global _status
+    if _status is None:
+        _status = _build_status()
+    return _status
+
+
+def _build_status() -> dict:
+    from regscan.api.deps import briefing_cache
+
     if _scheduler is None:
         return {
             "enabled": settings.SCHEDULER_ENABLED,
             "running": False,
             "next_run": None,
             "last_run": _last_run,
+            "pipeline_running": _pipeline_running(),
+            "last_error": _last_error,
+            "cache_info": briefing_cache.info,
         }
 
     job = _scheduler.get_job("daily_pipeline")
@@ -363,4 +477,11 @@ def get_scheduler_status() -> dict:
         "generate_html": settings.GENERATE_HTML,
         "next_run": next_run,
         "last_run": _last_run,
+        "pipeline_running": _pipeline_running(),
+        "last_error": _last_error,
+        "cache_info": briefing_cache.info,
     }
+
+
+def _pipeline_running() -> bool:
+    return _current_pipeline is not None and not _current_pipeline.done()
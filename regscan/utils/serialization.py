@@ -0,0 +1,25 @@
+"""JSON 직렬화 헬퍼 (orjson)
+
+프롬프트 조립·캐시 키 등 반복 직렬화 경로에서 stdlib json 대신 사용.
+datetime/date/numpy는 orjson이 네이티브로 처리하고, 그 외 타입만 str()로 변환.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+
+_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def dumps_str(obj: Any, sort_keys: bool = False) -> str:
+    """객체 → JSON 문자열 (비ASCII 그대로, 공백 없는 compact 형식)"""
+    option = _DUMPS_OPTIONS | orjson.OPT_SORT_KEYS if sort_keys else _DUMPS_OPTIONS
+    return orjson.dumps(obj, default=str, option=option).decode("utf-8")
+
+
+def dumps_bytes(obj: Any, sort_keys: bool = False) -> bytes:
+    """객체 → UTF-8 JSON 바이트"""
+    option = _DUMPS_OPTIONS | orjson.OPT_SORT_KEYS if sort_keys else _DUMPS_OPTIONS
+    return orjson.dumps(obj, default=str, option=option)
@@ -25,11 +25,31 @@ logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger(__name__)
 
 
+class _SampleImpact(DomesticImpact):
+    """__new__로 일부 필드만 채운 비교용 impact — to_dict는 채운 필드만 사용
+
+    DomesticImpact는 slots=True라 인스턴스에 메서드를 덮어쓸 수 없으므로 서브클래스로 대체.
+    """
+
+    __slots__ = ()
+
+    def to_dict(self) -> dict:
+        return {
+            "inn": self.inn,
+            "fda_approved": self.fda_approved,
+            "ema_approved": self.ema_approved,
+            "mfds_approved": self.mfds_approved,
+            "domestic_status": "expected",
+            "global_score": self.global_score,
+            "therapeutic_areas": self.therapeutic_areas,
+        }
+
+
 def build_polatuzumab_impact() -> DomesticImpact:
     """POLATUZUMAB VEDOTIN의 DomesticImpact를 DB 데이터 기반으로 구성."""
     from regscan.map.ingredient_bridge import ReimbursementStatus
 
-    impact = DomesticImpact.__new__(DomesticImpact)
+    impact = _SampleImpact.__new__(_SampleImpact)
     impact.inn = "polatuzumab vedotin"
     impact.fda_approved = True
     impact.fda_date = date(2019, 6, 10)
@@ -75,18 +95,6 @@ def build_polatuzumab_impact() -> DomesticImpact:
 
     # days_since_global_approval and summary are computed properties — no manual assignment needed
 
-    def _to_dict():
-        return {
-            "inn": impact.inn,
-            "fda_approved": impact.fda_approved,
-            "ema_approved": impact.ema_approved,
-            "mfds_approved": impact.mfds_approved,
-            "domestic_status": "expected",
-            "global_score": impact.global_score,
-            "therapeutic_areas": impact.therapeutic_areas,
-        }
-    impact.to_dict = _to_dict
-
     return impact
 
 
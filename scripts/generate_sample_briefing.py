@@ -228,16 +228,15 @@ async def main(min_score: int):
         logger.warning("대상 약물 없음 (min_score=%d)", min_score)
         return
 
+    drugs = [load_drug(drug_id) for drug_id in drug_ids]
+    logger.info("=== Generating: %s ===", ", ".join(d["inn"] for d in drugs))
+
+    # 약물 간 Reasoning→Verifier→Writer를 동시 실행 (AI_CONCURRENCY로 상한)
+    pipeline = AIIntelligencePipeline()
+    results = await pipeline.run_batch(drugs, article_type="briefing")
+
     cards = []
-    for drug_id in drug_ids:
-        drug = load_drug(drug_id)
-        logger.info("=== Generating: %s ===", drug["inn"])
-
-        pipeline = AIIntelligencePipeline()
-        insight, article = await pipeline.run(
-            drug=drug, preprints=[], market_reports=[],
-            expert_opinions=[], article_type="briefing",
-        )
+    for drug, (insight, article) in zip(drugs, results):
         cards.append(build_article_card(drug, insight, article))
         logger.info("Done: %s (score=%s)", drug["inn"], insight.get("verified_score"))
 
@@ -17,6 +17,23 @@ def pytest_configure(config):
 
 # ── 공통 fixture ──
 
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path, monkeypatch):
+    """AI 결과 디스크 캐시를 테스트별 임시 디렉토리로 격리"""
+    from regscan.config import settings
+
+    monkeypatch.setattr(settings, "CACHE_DIR", tmp_path / "cache")
+
+
+@pytest.fixture(autouse=True)
+def _isolated_breakers(monkeypatch):
+    """AI 제공자 회로 차단기 상태를 테스트별로 초기화"""
+    from regscan.ai import breaker
+
+    monkeypatch.setattr(breaker, "_breakers", {})
+    monkeypatch.setattr(breaker, "_RETRY_MAX_DELAY", 0.0)
+
+
 @pytest.fixture
 def sample_drug():
     """테스트용 약물 데이터 (PEMBROLIZUMAB)"""
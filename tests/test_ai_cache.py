@@ -0,0 +1,176 @@
+"""AI 디스크 캐시 / Gemini 파서 테스트"""
+
+import pytest
+
+from regscan.ai import gemini_parser
+from regscan.ai.cache import DiskCache
+from regscan.ai.gemini_parser import GeminiParser
+
+
+@pytest.fixture
+def tmp_cache(tmp_path, monkeypatch):
+    cache = DiskCache(tmp_path / "gemini_pdf")
+    monkeypatch.setattr(gemini_parser, "_parse_cache", cache)
+    return cache
+
+
+def test_disk_cache_roundtrip(tmp_path):
+    cache = DiskCache(tmp_path / "c")
+    cache.set("k", {"facts": {"drug_names": ["A"]}})
+    assert cache.get("k") == {"facts": {"drug_names": ["A"]}}
+    assert "k" in cache
+    assert len(cache) == 1
+    assert cache.clear() == 1
+    assert cache.get("k") is None
+
+
+def test_disk_cache_persists_across_instances(tmp_path):
+    DiskCache(tmp_path / "c").set("k", [1, 2])
+    assert DiskCache(tmp_path / "c").get("k") == [1, 2]
+
+
+def test_disk_cache_ttl_expired(tmp_path):
+    cache = DiskCache(tmp_path / "c")
+    cache.set("k", 1, ttl=-1)
+    assert cache.get("k") is None
+    assert len(cache) == 0
+
+
+async def test_gemini_url_cache_hit(tmp_cache):
+    """URL 인덱스 → 내용 해시 → 결과 경로로 다운로드 없이 반환"""
+    content_key = gemini_parser._content_key(b"%PDF-1.4 test")
+    tmp_cache.set(content_key, {"full_text": "x", "facts": {"a": 1}, "cached": False})
+    tmp_cache.set(gemini_parser._url_key("https://example.org/a.pdf"), content_key)
+
+    result = await GeminiParser(api_key=None).parse_pdf_url("https://example.org/a.pdf")
+    assert result["cached"] is True
+    assert result["facts"] == {"a": 1}
+    assert GeminiParser(api_key=None).clear_cache() == 2
+
+
+async def test_gemini_legacy_key_migrated(tmp_cache):
+    """이전 형식(SHA-256) URL 키는 첫 조회 시 새 키로 이전"""
+    url = "https://example.org/b.pdf"
+    legacy_content = gemini_parser._legacy_content_key(b"%PDF-1.4 old")
+    tmp_cache.set(legacy_content, {"full_text": "", "facts": {"b": 2}, "cached": False})
+    tmp_cache.set(gemini_parser._legacy_url_key(url), legacy_content)
+
+    result = await GeminiParser(api_key=None).parse_pdf_url(url)
+    assert result["facts"] == {"b": 2}
+    assert gemini_parser._legacy_url_key(url) not in tmp_cache
+    assert tmp_cache.get(gemini_parser._url_key(url)) == legacy_content
+
+
+async def test_gemini_cache_lookup_off_loop(tmp_cache, monkeypatch):
+    """동기 sqlite 캐시 조회는 이벤트 루프 밖 스레드에서 실행"""
+    import threading
+
+    threads = []
+    get = DiskCache.get
+
+    def tracking_get(self, key):
+        threads.append(threading.current_thread())
+        return get(self, key)
+
+    monkeypatch.setattr(DiskCache, "get", tracking_get)
+    tmp_cache.set("pdf:x", {"full_text": "", "facts": {}, "cached": False})
+    tmp_cache.set(gemini_parser._url_key("https://example.org/c.pdf"), "pdf:x")
+
+    result = await GeminiParser(api_key=None).parse_pdf_url("https://example.org/c.pdf")
+
+    assert result["cached"] is True
+    assert threads and all(t is not threading.main_thread() for t in threads)
+
+
+def test_gemini_legacy_key_only_computed_on_miss(tmp_cache):
+    """새 키 히트면 이전 형식 키를 계산하지 않음"""
+    calls = []
+
+    def legacy():
+        calls.append(1)
+        return "pdf:old"
+
+    tmp_cache.set("pdf:new", {"facts": {}})
+    assert gemini_parser._get_migrating(tmp_cache, "pdf:new", legacy, ttl=60) == {"facts": {}}
+    assert calls == []
+
+    tmp_cache.set("pdf:old", {"facts": {"c": 3}})
+    assert gemini_parser._get_migrating(tmp_cache, "pdf:miss", legacy, ttl=60) == {"facts": {"c": 3}}
+    assert calls == [1]
+    assert "pdf:old" not in tmp_cache
+
+
+@pytest.mark.parametrize("text, expected", [
+    ('```json\n{"a": 1}\n```', {"a": 1}),
+    ('설명\n```\n[1, 2]\n```\n끝', [1, 2]),
+    ('~~~json\n{"a": {"b": 2}}\n~~~', {"a": {"b": 2}}),
+    ('{"a": 1,}', {"a": 1}),
+    ("JSON 없음", {}),
+])
+def test_gemini_extract_json(text, expected):
+    assert gemini_parser._extract_json(text) == expected
+
+
+async def test_download_pdf_size_cap(monkeypatch):
+    """PDF_MAX_BYTES 초과 시 스트리밍 중단"""
+    import httpx
+
+    body = b"%PDF" + b"0" * 1000
+    client = httpx.AsyncClient(transport=httpx.MockTransport(
+        lambda request: httpx.Response(200, content=body)
+    ))
+    monkeypatch.setattr(gemini_parser, "_get_http", lambda: client)
+
+    assert await gemini_parser.download_pdf("https://example.org/a.pdf", max_bytes=2000) == body
+    with pytest.raises(gemini_parser.PDFTooLargeError):
+        await gemini_parser.download_pdf("https://example.org/a.pdf", max_bytes=100)
+    await client.aclose()
+
+
+async def test_call_gemini_extracts_text_off_loop(monkeypatch):
+    """text 모드 PDF 텍스트 추출은 이벤트 루프 밖 스레드에서 실행"""
+    import threading
+    from types import SimpleNamespace
+
+    from regscan.config import settings
+
+    threads = []
+
+    def fake_extract(pdf_bytes):
+        threads.append(threading.current_thread())
+        return "본문"
+
+    client = SimpleNamespace(generate_content=lambda parts: SimpleNamespace(text='{"a": 1}'))
+    monkeypatch.setattr(settings, "GEMINI_PDF_MODE", "text")
+    monkeypatch.setattr(gemini_parser, "extract_pdf_text", fake_extract)
+
+    result = await GeminiParser(api_key="test")._call_gemini(client, b"%PDF", "prompt")
+
+    assert result["parsed"] == {"a": 1}
+    assert threads and threads[0] is not threading.main_thread()
+
+
+def test_get_http_closes_client_of_previous_loop(monkeypatch):
+    """루프가 바뀌면 새 클라이언트, 이전 루프의 클라이언트는 그 루프에서 종료"""
+    import asyncio
+
+    monkeypatch.setattr(gemini_parser, "_http", None)
+    monkeypatch.setattr(gemini_parser, "_http_loop", None)
+
+    async def get():
+        return gemini_parser._get_http()
+
+    old_loop, new_loop = asyncio.new_event_loop(), asyncio.new_event_loop()
+    try:
+        old = old_loop.run_until_complete(get())
+        assert old_loop.run_until_complete(get()) is old
+
+        new = new_loop.run_until_complete(get())
+        assert new is not old
+        old_loop.run_until_complete(asyncio.sleep(0.01))
+        assert old.is_closed and not new.is_closed
+
+        new_loop.run_until_complete(gemini_parser.close_http_client())
+    finally:
+        old_loop.close()
+        new_loop.close()
@@ -10,6 +10,7 @@ from regscan.ai.reasoning_engine import ReasoningEngine
 from regscan.ai.verifier import InsightVerifier
 from regscan.ai.writing_engine import WritingEngine
 from regscan.ai.pipeline import AIIntelligencePipeline
+from regscan.config import settings
 
 
 @pytest.fixture
@@ -144,3 +145,542 @@ def test_format_market(sample_market_reports):
     text = ReasoningEngine._format_market(sample_market_reports)
     assert "면역항암제" in text
     assert "5000" in text
+
+
+def test_pack_sources_respects_budget():
+    """토큰 예산을 넘는 소스는 생략 표시, 최신 프리프린트 우선"""
+    from regscan.ai.sources import pack_sources
+    from regscan.ai.tokens import count_tokens
+
+    preprints = [
+        {"doi": f"10.1101/{i}", "title": "PD-1 trial", "abstract": "x" * 800,
+         "published_date": f"2026-01-{i:02d}"}
+        for i in range(1, 21)
+    ]
+    packed = pack_sources(preprints, [], [], budget_tokens=600)
+
+    assert count_tokens(packed["preprint_data"]) < 700
+    assert "생략" in packed["preprint_data"]
+    assert packed["preprint_data"].startswith("- [10.1101/20]")
+    assert packed["market_data"] == "시장 데이터 없음"
+
+
+# ── Pipeline 배치 실행 ──
+
+async def test_pipeline_run_batch_preserves_order(monkeypatch):
+    """run_batch는 입력 순서대로 결과 반환"""
+    monkeypatch.setattr("regscan.ai.pipeline.settings.ENABLE_AI_REASONING", False)
+    monkeypatch.setattr("regscan.ai.pipeline.settings.ENABLE_AI_VERIFIER", False)
+    monkeypatch.setattr("regscan.ai.pipeline.settings.ENABLE_AI_WRITER", False)
+
+    drugs = [{"inn": f"DRUG{i}", "global_score": i} for i in range(5)]
+    results = await AIIntelligencePipeline().run_batch(drugs, concurrency=2)
+
+    assert [insight["impact_score"] for insight, _ in results] == [0, 1, 2, 3, 4]
+
+
+async def test_verify_and_write_feeds_verified_insight(monkeypatch):
+    """verify_and_write는 검증 결과를 병합한 insight로 기사 작성"""
+    from regscan.ai import pipeline as ai_pipeline
+
+    monkeypatch.setattr("regscan.ai.pipeline.settings.ENABLE_AI_VERIFIER", True)
+    monkeypatch.setattr("regscan.ai.pipeline.settings.ENABLE_AI_WRITER", True)
+    ai_pipeline._daily_counts.clear()
+
+    pipeline = AIIntelligencePipeline()
+    seen = {}
+
+    async def fake_verify(drug, reasoning_result, raw_sources):
+        return {"verified_score": 61, "confidence_level": "high", "extra": 1}
+
+    async def fake_write(drug, verified_insight, article_type):
+        seen.update(verified_insight)
+        return {"headline": "H"}
+
+    monkeypatch.setattr(pipeline.verifier, "verify", fake_verify)
+    monkeypatch.setattr(pipeline.writer, "write_article", fake_write)
+
+    insight, article = await pipeline.verify_and_write({"inn": "A"}, {"impact_score": 70})
+
+    assert insight == {"impact_score": 70, "verified_score": 61, "confidence_level": "high"}
+    assert seen == insight
+    assert article == {"headline": "H"}
+
+
+def test_reserve_daily_call_respects_limit():
+    """한도 내에서만 호출 수 선점"""
+    from regscan.ai import pipeline as ai_pipeline
+
+    ai_pipeline._daily_counts.clear()
+    assert ai_pipeline._reserve_daily_call("test", 2) == 0
+    assert ai_pipeline._reserve_daily_call("test", 2) == 1
+    assert ai_pipeline._reserve_daily_call("test", 2) is None
+    assert ai_pipeline._get_daily_count("test") == 2
+
+
+async def test_cache_hit_leaves_daily_count_unchanged(monkeypatch, sample_drug):
+    """캐시 히트는 일일 한도를 쓰지 않고, 한도 소진 후에도 캐시 결과는 사용"""
+    from regscan.ai import pipeline as ai_pipeline
+
+    monkeypatch.setattr("regscan.ai.pipeline.settings.ENABLE_AI_REASONING", True)
+    monkeypatch.setattr("regscan.ai.pipeline.settings.ENABLE_AI_VERIFIER", False)
+    monkeypatch.setattr("regscan.ai.pipeline.settings.ENABLE_AI_WRITER", True)
+    monkeypatch.setattr("regscan.ai.pipeline.settings.MAX_REASONING_CALLS_PER_DAY", 0)
+    monkeypatch.setattr("regscan.ai.pipeline.settings.MAX_WRITER_CALLS_PER_DAY", 0)
+    ai_pipeline._daily_counts.clear()
+
+    pipeline = AIIntelligencePipeline()
+    monkeypatch.setattr(
+        pipeline.reasoning, "cached_impact",
+        lambda *args: {"impact_score": 55, "cached": True},
+    )
+    monkeypatch.setattr(
+        pipeline.writer, "cached_article",
+        lambda *args: {"headline": "H", "cached": True},
+    )
+
+    insight, article = await pipeline.run(sample_drug)
+
+    assert insight["impact_score"] == 55
+    assert article["headline"] == "H"
+    assert ai_pipeline._get_daily_count("reasoning") == 0
+    assert ai_pipeline._get_daily_count("writer") == 0
+
+
+async def test_failed_writer_call_refunds_reservation(monkeypatch):
+    """예외·fallback으로 끝난 호출은 일일 한도를 소모하지 않음"""
+    from regscan.ai import pipeline as ai_pipeline
+
+    monkeypatch.setattr("regscan.ai.pipeline.settings.ENABLE_AI_VERIFIER", False)
+    monkeypatch.setattr("regscan.ai.pipeline.settings.ENABLE_AI_WRITER", True)
+    ai_pipeline._daily_counts.clear()
+
+    pipeline = AIIntelligencePipeline()
+    results = iter([RuntimeError("boom"), {"writer_model": "fallback"}, {"headline": "H"}])
+
+    async def fake_write(drug, verified_insight, article_type):
+        result = next(results)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    monkeypatch.setattr(pipeline.writer, "write_article", fake_write)
+
+    await pipeline.verify_and_write({"inn": "A"}, {"impact_score": 70})
+    assert ai_pipeline._get_daily_count("writer") == 0
+    await pipeline.verify_and_write({"inn": "A"}, {"impact_score": 70})
+    assert ai_pipeline._get_daily_count("writer") == 0
+    await pipeline.verify_and_write({"inn": "A"}, {"impact_score": 70})
+    assert ai_pipeline._get_daily_count("writer") == 1
+
+
+def test_daily_counts_prune_old_dates():
+    """날짜가 바뀌어도 전날 카운터는 유지, 그 이전은 정리"""
+    from datetime import date, timedelta
+    from regscan.ai import pipeline as ai_pipeline
+
+    today = date.today()
+    ai_pipeline._daily_counts.clear()
+    ai_pipeline._daily_counts[(today - timedelta(days=3)).isoformat()]["reasoning"] = 7
+    ai_pipeline._daily_counts[(today - timedelta(days=1)).isoformat()]["reasoning"] = 5
+
+    assert ai_pipeline._increment_daily_count("reasoning") == 1
+    assert sorted(ai_pipeline._daily_counts) == [
+        (today - timedelta(days=1)).isoformat(),
+        today.isoformat(),
+    ]
+
+
+# ── ReasoningEngine 묶음 호출 ──
+
+class _FakeCompletions:
+    """chat.completions.create 대역 — 호출 기록 후 준비된 응답 반환"""
+
+    def __init__(self, contents):
+        self.contents = list(contents)
+        self.calls = []
+
+    async def create(self, **kwargs):
+        from types import SimpleNamespace
+
+        self.calls.append(kwargs)
+        content = self.contents.pop(0)
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=SimpleNamespace(total_tokens=100),
+        )
+
+
+def _fake_engine(contents):
+    from types import SimpleNamespace
+
+    engine = ReasoningEngine(api_key="test")
+    completions = _FakeCompletions(contents)
+    engine._client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return engine, completions
+
+
+async def test_reasoning_batch_fallback_for_missing_key():
+    """묶음 응답에서 누락된 약물은 단건 호출로 재시도"""
+    engine, completions = _fake_engine([
+        '{"d0": {"impact_score": 70}}',
+        '{"impact_score": 55}',
+    ])
+    drugs = [{"inn": "A", "global_score": 1}, {"inn": "B", "global_score": 2}]
+
+    results = await engine.analyze_impact_batch(drugs, batch_size=10)
+
+    assert [r["impact_score"] for r in results] == [70, 55]
+    assert len(completions.calls) == 2
+    assert "[d1]" in completions.calls[0]["messages"][-1]["content"]
+
+
+def _batch_pipeline(monkeypatch, contents, reasoning_limit=10):
+    """Reasoning만 켠 파이프라인 (가짜 OpenAI 응답)"""
+    from regscan.ai import pipeline as ai_pipeline
+
+    monkeypatch.setattr("regscan.ai.pipeline.settings.ENABLE_AI_REASONING", True)
+    monkeypatch.setattr("regscan.ai.pipeline.settings.ENABLE_AI_VERIFIER", False)
+    monkeypatch.setattr("regscan.ai.pipeline.settings.ENABLE_AI_WRITER", False)
+    monkeypatch.setattr("regscan.ai.pipeline.settings.MAX_REASONING_CALLS_PER_DAY", reasoning_limit)
+    ai_pipeline._daily_counts.clear()
+
+    engine, completions = _fake_engine(contents)
+    return AIIntelligencePipeline(reasoning_engine=engine), completions
+
+
+async def test_run_batch_uses_one_reasoning_call_per_chunk(monkeypatch):
+    """run_batch는 약물들을 한 reasoning 요청으로 묶고, 한도는 약물 수만큼 선점"""
+    from regscan.ai import pipeline as ai_pipeline
+
+    pipeline, completions = _batch_pipeline(monkeypatch, [
+        '{"d0": {"impact_score": 70}, "d1": {"impact_score": 40}}',
+    ])
+    drugs = [{"inn": "A", "global_score": 1}, {"inn": "B", "global_score": 2}]
+
+    results = await pipeline.run_batch(drugs)
+
+    assert [insight["impact_score"] for insight, _ in results] == [70, 40]
+    assert len(completions.calls) == 1
+    assert ai_pipeline._get_daily_count("reasoning") == 2
+
+
+async def test_run_batch_respects_daily_limit_and_cache(monkeypatch):
+    """한도 초과 약물은 빈 결과, 캐시 히트는 한도와 무관하게 사용"""
+    from regscan.ai import pipeline as ai_pipeline
+
+    pipeline, completions = _batch_pipeline(
+        monkeypatch, ['{"impact_score": 70}'], reasoning_limit=1,
+    )
+    drugs = [{"inn": "A", "global_score": 1}, {"inn": "B", "global_score": 2}]
+    monkeypatch.setattr(
+        pipeline.reasoning, "cached_impact",
+        lambda drug, *args: {"impact_score": 5, "cached": True} if drug["inn"] == "C" else None,
+    )
+
+    results = await pipeline.run_batch(drugs + [{"inn": "C"}])
+
+    assert [insight.get("impact_score") for insight, _ in results] == [70, None, 5]
+    assert len(completions.calls) == 1
+    assert ai_pipeline._get_daily_count("reasoning") == 1
+
+
+async def test_run_batch_breaker_open_skips_calls(monkeypatch):
+    """OpenAI 회로 개방 시 묶음 경로도 호출 없이 fallback, 선점 반환"""
+    from regscan.ai import pipeline as ai_pipeline
+    from regscan.ai.breaker import get_breaker
+
+    pipeline, completions = _batch_pipeline(monkeypatch, [])
+    breaker = get_breaker("openai")
+    monkeypatch.setattr(type(breaker), "is_open", property(lambda self: True))
+
+    results = await pipeline.run_batch([{"inn": "A"}, {"inn": "B"}])
+
+    assert [insight["reasoning_model"] for insight, _ in results] == ["fallback", "fallback"]
+    assert completions.calls == []
+    assert ai_pipeline._get_daily_count("reasoning") == 0
+
+
+# ── OpenAI Batch API 수집기 ──
+
+class _FakeBatchClient:
+    """files/batches API 대역 — 제출된 JSONL을 그대로 응답으로 변환"""
+
+    def __init__(self):
+        from types import SimpleNamespace
+
+        self.uploaded = b""
+        ns = SimpleNamespace
+        self.files = ns(create=self._create_file, content=self._content)
+        self.batches = ns(create=self._create_batch, retrieve=self._retrieve)
+
+    async def _create_file(self, file, purpose):
+        from types import SimpleNamespace
+
+        self.uploaded = file[1]
+        return SimpleNamespace(id="file-in")
+
+    async def _create_batch(self, input_file_id, endpoint, completion_window):
+        from types import SimpleNamespace
+
+        return SimpleNamespace(id="batch-1", status="in_progress")
+
+    async def _retrieve(self, batch_id):
+        from types import SimpleNamespace
+
+        return SimpleNamespace(
+            id=batch_id, status="completed", output_file_id="file-out", error_file_id=None,
+        )
+
+    async def _content(self, file_id):
+        import json
+        from types import SimpleNamespace
+
+        lines = []
+        for line in self.uploaded.decode().splitlines():
+            req = json.loads(line)
+            score = len(req["body"]["messages"])
+            assert "extra_body" not in req["body"]
+            body = {
+                "choices": [{"message": {"content": json.dumps({"impact_score": score})}}],
+                "usage": {"total_tokens": 10},
+            }
+            lines.append(json.dumps({
+                "custom_id": req["custom_id"],
+                "response": {"status_code": 200, "body": body},
+                "error": None,
+            }))
+        return SimpleNamespace(text="\n".join(lines))
+
+
+async def test_batch_collector_resolves_all_requests():
+    """동시 요청이 한 batch로 제출되고 각자 결과를 받음"""
+    import asyncio
+    from regscan.ai.batch_runner import BatchCollector
+
+    client = _FakeBatchClient()
+    collector = BatchCollector(client, linger=0.01, poll_interval=0.01)
+    engine = ReasoningEngine(api_key="test")
+    engine.batch = collector
+
+    results = await asyncio.gather(
+        engine.analyze_impact({"inn": "A"}),
+        engine.analyze_impact({"inn": "B"}),
+    )
+
+    assert [r["impact_score"] for r in results] == [3, 3]
+    assert len(client.uploaded.decode().splitlines()) == 2
+
+
+async def test_fetch_batch_results_all_failed():
+    """전 건 실패 batch(output_file_id=None)는 빈 결과, 실패 사유는 error 파일에서 읽음"""
+    import json
+    from types import SimpleNamespace
+    from regscan.ai.batch_runner import fetch_batch_results
+
+    read = []
+
+    async def content(file_id):
+        read.append(file_id)
+        row = {"custom_id": "req-1", "response": {"status_code": 400, "body": {
+            "error": {"message": "bad request"},
+        }}, "error": None}
+        return SimpleNamespace(text=json.dumps(row))
+
+    client = SimpleNamespace(files=SimpleNamespace(content=content))
+    batch = SimpleNamespace(id="batch-1", output_file_id=None, error_file_id="file-err")
+
+    assert await fetch_batch_results(client, batch) == {}
+    assert read == ["file-err"]
+
+
+async def test_reasoning_cache_skips_repeat_call():
+    """동일 입력 재분석 시 API 호출 없이 캐시 결과 반환"""
+    engine, completions = _fake_engine(['{"impact_score": 64}'])
+    drug = {"inn": "A", "global_score": 1}
+
+    first = await engine.analyze_impact(drug)
+    second = await engine.analyze_impact(dict(drug))
+
+    assert first["impact_score"] == second["impact_score"] == 64
+    assert second["cached"] is True
+    assert len(completions.calls) == 1
+
+
+# ── ReasoningEngine 모델 라우팅 ──
+
+def test_select_model_light_for_sparse_drug(sample_preprints):
+    """소스 없는 저점수 약물은 경량 모델, 소스 많은 약물은 기본 모델"""
+    engine = ReasoningEngine(api_key="test")
+
+    assert engine._select_model({"inn": "A", "global_score": 10}) == (
+        settings.REASONING_LIGHT_MODEL, "low",
+    )
+    assert engine._select_model({"inn": "A", "global_score": 80}) == (engine.model, "high")
+    assert engine._select_model(
+        {"inn": "A", "global_score": 10}, preprints=sample_preprints * 3,
+    ) == (engine.model, "high")
+
+
+async def test_light_model_call_omits_reasoning_effort():
+    """경량 모델(gpt-4o 계열) 호출에는 reasoning_effort를 넣지 않음"""
+    engine, completions = _fake_engine(['{"impact_score": 12}'])
+
+    result = await engine.analyze_impact({"inn": "A", "global_score": 1})
+
+    assert completions.calls[0]["model"] == settings.REASONING_LIGHT_MODEL
+    assert "reasoning_effort" not in completions.calls[0]
+    assert result["reasoning_model"] == settings.REASONING_LIGHT_MODEL
+
+
+# ── 컨텍스트 예산 사전 계산 ──
+
+async def test_reasoning_repacks_sources_over_ctx_budget(monkeypatch):
+    """프롬프트가 컨텍스트 예산을 넘으면 소스를 줄여 1회 재포장"""
+    from regscan.ai.tokens import count_message_tokens
+
+    monkeypatch.setattr(settings, "REASONING_CTX_BUDGET", 8000)
+    engine, completions = _fake_engine(['{"impact_score": 50}'])
+    preprints = [
+        {"doi": f"10.1101/{i}", "title": "trial", "abstract": "y" * 800}
+        for i in range(50)
+    ]
+
+    result = await engine.analyze_impact({"inn": "A", "global_score": 90}, preprints=preprints)
+
+    assert result["impact_score"] == 50
+    assert count_message_tokens(completions.calls[0]["messages"]) <= 8000
+
+
+async def test_reasoning_skips_call_when_prompt_cannot_fit(monkeypatch):
+    """재포장 후에도 예산 초과면 API 호출 없이 fallback"""
+    monkeypatch.setattr(settings, "REASONING_CTX_BUDGET", 100)
+    engine, completions = _fake_engine([])
+
+    result = await engine.analyze_impact({"inn": "A", "global_score": 90})
+
+    assert result["reasoning_model"] == "fallback"
+    assert completions.calls == []
+
+
+# ── 재시도 / 회로 차단기 ──
+
+class _StatusError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+async def test_call_with_retry_recovers_from_429():
+    """429는 재시도 후 성공"""
+    from regscan.ai.breaker import call_with_retry
+
+    calls = []
+
+    async def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise _StatusError(429)
+        return "ok"
+
+    assert await call_with_retry("test", flaky) == "ok"
+    assert len(calls) == 3
+
+
+async def test_call_with_retry_does_not_retry_client_error():
+    """400 등 비일시적 오류는 즉시 전파"""
+    from regscan.ai.breaker import call_with_retry, get_breaker
+
+    calls = []
+
+    async def bad():
+        calls.append(1)
+        raise _StatusError(400)
+
+    with pytest.raises(_StatusError):
+        await call_with_retry("test", bad)
+    assert len(calls) == 1
+    assert get_breaker("test").failures == 0
+
+
+async def test_open_breaker_short_circuits_reasoning(monkeypatch):
+    """연속 실패로 회로가 열리면 API 호출 없이 fallback"""
+    from regscan.ai.breaker import get_breaker
+
+    monkeypatch.setattr(settings, "AI_BREAKER_FAIL_MAX", 1)
+    get_breaker("openai").record_failure()
+    engine, completions = _fake_engine([])
+
+    result = await engine.analyze_impact({"inn": "A", "global_score": 90})
+
+    assert result["reasoning_model"] == "fallback"
+    assert completions.calls == []
+
+
+async def test_engines_share_llm_http_pool():
+    """OpenAI SDK 클라이언트가 공용 httpx 풀을 사용"""
+    pytest.importorskip("openai")
+    from regscan.ai.http_client import close_llm_http_client, get_llm_http_client
+
+    reasoning = ReasoningEngine(api_key="test")
+    verifier = InsightVerifier(api_key="test")
+
+    assert reasoning._get_client()._client is get_llm_http_client()
+    assert verifier._get_client()._client is get_llm_http_client()
+    await close_llm_http_client()
+
+
+async def test_engine_clients_disable_sdk_retries():
+    """재시도는 call_with_retry만 — SDK 자체 재시도는 0"""
+    pytest.importorskip("openai")
+    from regscan.ai.http_client import close_llm_http_client
+
+    engines = [ReasoningEngine(api_key="test"), InsightVerifier(api_key="test"),
+               WritingEngine(api_key="test")]
+
+    assert [e._get_client().max_retries for e in engines] == [0, 0, 0]
+    await close_llm_http_client()
+
+
+class _FlakyCompletions(_FakeCompletions):
+    """첫 호출은 502로 실패하는 chat.completions 대역"""
+
+    async def create(self, **kwargs):
+        if not self.calls:
+            self.calls.append(kwargs)
+            raise _StatusError(502)
+        return await super().create(**kwargs)
+
+
+async def test_verifier_requests_without_stream():
+    """verifier 단건 호출은 비스트리밍 응답을 그대로 파싱"""
+    from types import SimpleNamespace
+
+    verifier = InsightVerifier(api_key="test")
+    completions = _FakeCompletions(
+        ['{"verified_score": 64, "corrections": [], "confidence_level": "high"}']
+    )
+    verifier._client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+    result = await verifier.verify({"inn": "A"}, {"impact_score": 70})
+
+    assert result["verified_score"] == 64
+    assert result["verifier_tokens"] == 100
+    assert "stream" not in completions.calls[0]
+
+
+async def test_writer_retries_failed_completion():
+    """writer 단건 호출이 502로 실패하면 call_with_retry가 다시 요청"""
+    from types import SimpleNamespace
+
+    writer = WritingEngine(api_key="test")
+    completions = _FlakyCompletions(
+        ['{"headline": "h", "lead_paragraph": "l", "body_html": "<p>b</p>"}'],
+    )
+    writer._client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+    result = await writer.write_article({"inn": "A"}, {"verified_score": 60})
+
+    assert result["headline"] == "h"
+    assert result["writer_tokens"] == 100
+    assert len(completions.calls) == 2
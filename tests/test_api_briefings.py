@@ -0,0 +1,181 @@
+"""브리핑 / 변경 로그 API 라우트 테스트 (인메모리 SQLite)"""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from regscan.db import database
+from regscan.db.models import Base, DrugChangeLogDB, DrugDB, StreamBriefingDB
+
+
+@pytest.fixture
+async def briefing_session_factory(monkeypatch):
+    """브리핑 3건 + 변경 로그 2건이 들어있는 인메모리 DB 세션 팩토리"""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    now = datetime.utcnow()
+    async with factory() as session:
+        drug = DrugDB(inn="pembrolizumab", global_score=80)
+        session.add(drug)
+        await session.flush()
+        session.add_all([
+            StreamBriefingDB(
+                stream_name="therapeutic_area", sub_category="oncology",
+                briefing_type="stream", headline="항암 브리핑",
+                content_json={"items": [1, 2]}, generated_at=now - timedelta(hours=2),
+            ),
+            StreamBriefingDB(
+                stream_name="innovation", sub_category=None, briefing_type="stream",
+                headline=None, content_json=None, generated_at=now - timedelta(hours=1),
+            ),
+            StreamBriefingDB(
+                stream_name="unified", briefing_type="unified", headline="통합",
+                content_json={"summary": "s"}, generated_at=now, pipeline_run_id="run-1",
+            ),
+            DrugChangeLogDB(
+                drug_id=drug.id, change_type="score_change", field_name="global_score",
+                old_value="60", new_value="80", detected_at=now - timedelta(hours=1),
+            ),
+            DrugChangeLogDB(
+                drug_id=drug.id, change_type="new_event", detected_at=now,
+            ),
+        ])
+        await session.commit()
+
+    monkeypatch.setattr(database, "get_async_session", lambda: factory)
+    yield factory
+    await engine.dispose()
+
+
+async def test_briefing_routes_build_items_from_columns(briefing_session_factory):
+    """컬럼 조회 결과 → BriefingItem (NULL 필드는 기본값)"""
+    from regscan.api.routes import briefings
+
+    latest = await briefings.get_latest_briefings(stream=None, area=None)
+    assert [b.stream_name for b in latest] == ["innovation", "therapeutic_area"]
+    assert latest[0].sub_category == "" and latest[0].headline == ""
+    assert latest[0].content_json == {}
+    assert latest[1].content_json == {"items": [1, 2]}
+
+    unified = await briefings.get_latest_unified_briefing()
+    assert unified.headline == "통합" and unified.pipeline_run_id == "run-1"
+
+
+async def _fetch_history(**kwargs) -> list[dict]:
+    """/briefings/history 스트리밍 본문을 모아 파싱 (세션 정리 BackgroundTask까지 실행)"""
+    from regscan.api.routes import briefings
+
+    params = {"days": 1, "limit": 100, "offset": 0, "cursor": None, "cursor_id": None, **kwargs}
+    response = await briefings.get_briefing_history(**params)
+    assert response.media_type == "application/json"
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    await response.background()
+    return json.loads(body)
+
+
+async def test_briefing_history_streams_json_array(briefing_session_factory):
+    """히스토리는 JSON 배열 스트리밍 + offset/limit 페이지네이션"""
+    history = await _fetch_history()
+    assert [b["briefing_type"] for b in history] == ["unified", "stream", "stream"]
+    assert history[1]["content_json"] == {} and history[1]["headline"] == ""
+
+    page = await _fetch_history(limit=1, offset=1)
+    assert [b["stream_name"] for b in page] == ["innovation"]
+    assert await _fetch_history(offset=3) == []
+
+    # keyset: 이전 페이지 마지막 generated_at을 cursor로
+    first = await _fetch_history(limit=2)
+    cursor = datetime.fromisoformat(first[-1]["generated_at"])
+    rest = await _fetch_history(limit=2, cursor=cursor)
+    assert [b["stream_name"] for b in first + rest] == [b["stream_name"] for b in history]
+
+
+async def test_briefing_history_normalizes_non_json_content(briefing_session_factory):
+    """json.dumps가 저장한 NaN/Infinity나 객체가 아닌 content_json도 유효한 JSON으로"""
+    from sqlalchemy import update
+
+    async with briefing_session_factory() as session:
+        await session.execute(
+            update(StreamBriefingDB).where(StreamBriefingDB.briefing_type == "unified")
+            .values(content_json={"score": float("nan"), "ratio": float("inf"), "ok": 1})
+        )
+        await session.execute(
+            update(StreamBriefingDB).where(StreamBriefingDB.stream_name == "innovation")
+            .values(content_json=[1, 2])
+        )
+        await session.commit()
+
+    history = await _fetch_history()
+    assert history[0]["content_json"] == {"score": None, "ratio": None, "ok": 1}
+    assert history[1]["content_json"] == {}
+    assert history[2]["content_json"] == {"items": [1, 2]}
+
+
+async def test_briefing_history_cursor_breaks_ties_by_id(briefing_session_factory):
+    """같은 generated_at 브리핑이 페이지 경계에 걸려도 (generated_at, id) cursor로 누락 없음"""
+    from sqlalchemy import update
+
+    async with briefing_session_factory() as session:
+        await session.execute(update(StreamBriefingDB).values(generated_at=datetime.utcnow()))
+        await session.commit()
+
+    first = await _fetch_history(limit=2)
+    last = first[-1]
+    rest = await _fetch_history(
+        limit=2, cursor=datetime.fromisoformat(last["generated_at"]), cursor_id=last["id"],
+    )
+    assert [b["id"] for b in first + rest] == [3, 2, 1]
+
+
+async def test_briefing_history_first_chunk_then_stream(briefing_session_factory, monkeypatch):
+    """첫 청크는 응답 전에 fetch, 나머지는 스트리밍 — 경계와 무관하게 같은 배열"""
+    from fastapi import HTTPException
+
+    from regscan.api.routes import briefings
+
+    monkeypatch.setattr(briefings, "_HISTORY_FIRST_CHUNK", 1)
+    history = await _fetch_history()
+    assert [b["briefing_type"] for b in history] == ["unified", "stream", "stream"]
+
+    class _BrokenSession:
+        closed = False
+
+        async def stream(self, stmt):
+            raise RuntimeError("db down")
+
+        async def close(self):
+            self.closed = True
+
+    broken = _BrokenSession()
+    monkeypatch.setattr(database, "get_async_session", lambda: lambda: broken)
+    with pytest.raises(HTTPException) as exc:
+        await briefings.get_briefing_history(
+            days=1, limit=100, offset=0, cursor=None, cursor_id=None,
+        )
+    assert exc.value.status_code == 500 and broken.closed
+
+
+async def test_recent_changes_joins_inn(briefing_session_factory, monkeypatch):
+    """변경 로그 컬럼 + 약물 INN 조인"""
+    from regscan.api.routes import changes
+    from regscan.config import settings
+
+    monkeypatch.setattr(settings, "DATABASE_URL", "postgresql+asyncpg://localhost/regscan")
+
+    async def fetch(**kwargs):
+        response = await changes.get_recent_changes(hours=24, limit=50, **kwargs)
+        assert response.media_type == "application/json"
+        return json.loads(response.body)
+
+    rows = await fetch(change_type=None)
+    assert [r["change_type"] for r in rows] == ["new_event", "score_change"]
+    assert all(r["inn"] == "pembrolizumab" for r in rows)
+    assert rows[1]["old_value"] == "60" and rows[1]["new_value"] == "80"
+
+    filtered = await fetch(change_type="new_event")
+    assert len(filtered) == 1 and filtered[0]["field_name"] is None
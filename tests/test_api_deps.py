@@ -0,0 +1,311 @@
+"""API DataStore PG 모드 조회 테스트 (인메모리 SQLite)"""
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from regscan.api import deps
+from regscan.api.deps import DataStore
+from regscan.db.models import Base, DrugDB
+
+
+@pytest.fixture
+async def drug_session_factory(monkeypatch):
+    """약물 5건이 들어있는 인메모리 DB 세션 팩토리"""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with factory() as session:
+        session.add_all(
+            DrugDB(inn=f"DRUG{i}", global_score=i * 20) for i in range(5)
+        )
+        await session.commit()
+
+    monkeypatch.setattr(deps, "get_async_session", lambda: factory)
+    yield factory
+    await engine.dispose()
+
+
+async def test_aload_counts_aggregates_stats(drug_session_factory):
+    """약물 수 + 핫이슈/임박/급여 카운트를 집계 쿼리로 로드"""
+    from regscan.db.models import HIRAReimbursementDB
+    from sqlalchemy import select
+
+    async with drug_session_factory() as session:
+        drugs = (await session.execute(select(DrugDB).order_by(DrugDB.id))).scalars().all()
+        drugs[4].domestic_status = "imminent"
+        session.add_all([
+            HIRAReimbursementDB(drug_id=drugs[1].id, status="reimbursed"),
+            HIRAReimbursementDB(drug_id=drugs[1].id, status="reimbursed"),
+            HIRAReimbursementDB(drug_id=drugs[2].id, status="delisted"),
+        ])
+        await session.commit()
+
+    store = DataStore()
+    await store.aload_counts()
+
+    assert store.drug_count == 5
+    assert store.hot_issues_count == 2  # global_score 60, 80
+    assert store.imminent_count == 1
+    assert store.reimbursed_count == 1
+
+
+async def test_aget_hot_issues_streams_in_chunks(drug_session_factory):
+    """청크 크기보다 많은 행도 순서대로 모두 변환"""
+    store = DataStore()
+
+    chunked = [d.inn async for d in store._aiter_drugs(
+        store._base_drug_query().order_by(DrugDB.global_score.desc()), chunk=2,
+    )]
+    hot = await store.aget_hot_issues(min_score=40)
+
+    assert chunked == ["DRUG4", "DRUG3", "DRUG2", "DRUG1", "DRUG0"]
+    assert [d.inn for d in hot] == ["DRUG4", "DRUG3", "DRUG2"]
+
+
+async def test_aget_pages_use_limit_offset_and_keyset(drug_session_factory):
+    """핫이슈는 LIMIT/OFFSET, 도입 임박은 (global_score, inn) keyset 페이지"""
+    from sqlalchemy import update
+
+    async with drug_session_factory() as session:
+        await session.execute(update(DrugDB).values(domestic_status="imminent"))
+        await session.execute(update(DrugDB).where(DrugDB.inn == "DRUG0").values(global_score=40))
+        await session.commit()
+
+    store = DataStore()
+
+    page = await store.aget_hot_issues(min_score=20, offset=1, limit=2)
+    assert [d.inn for d in page] == ["DRUG3", "DRUG0"]
+
+    first = await store.aget_imminent(limit=3)
+    assert [d.inn for d in first] == ["DRUG4", "DRUG3", "DRUG0"]
+    last = first[-1]
+    rest = await store.aget_imminent(limit=3, after=(last.global_score, last.inn))
+    assert [d.inn for d in rest] == ["DRUG2", "DRUG1"]
+
+
+async def test_aget_high_value_dedupes_and_limits(drug_session_factory):
+    """급여 행이 여러 개인 약물도 1회, 최고 상한가 순으로 limit건"""
+    from sqlalchemy import select
+
+    from regscan.db.models import HIRAReimbursementDB
+
+    async with drug_session_factory() as session:
+        ids = {d.inn: d.id for d in (await session.execute(select(DrugDB))).scalars()}
+        session.add_all([
+            HIRAReimbursementDB(drug_id=ids["DRUG0"], price_ceiling=3_000_000),
+            HIRAReimbursementDB(drug_id=ids["DRUG0"], price_ceiling=2_000_000),
+            HIRAReimbursementDB(drug_id=ids["DRUG1"], price_ceiling=5_000_000),
+            HIRAReimbursementDB(drug_id=ids["DRUG2"], price_ceiling=1_500_000),
+            HIRAReimbursementDB(drug_id=ids["DRUG3"], price_ceiling=10_000),
+        ])
+        await session.commit()
+
+    store = DataStore()
+
+    assert [d.inn for d in await store.aget_high_value()] == ["DRUG1", "DRUG0", "DRUG2"]
+    assert [d.inn for d in await store.aget_high_value(limit=2)] == ["DRUG1", "DRUG0"]
+
+
+async def test_aget_by_inn_joined_relationships(drug_session_factory):
+    """단건 조회는 관계 행 수와 무관하게 약물 1건"""
+    from sqlalchemy import select
+
+    from regscan.db.models import ClinicalTrialDB, HIRAReimbursementDB
+
+    async with drug_session_factory() as session:
+        drug = (await session.execute(select(DrugDB).where(DrugDB.inn == "DRUG3"))).scalar_one()
+        session.add_all([
+            HIRAReimbursementDB(drug_id=drug.id, status="reimbursed", price_ceiling=1_000),
+            ClinicalTrialDB(drug_id=drug.id, trial_id="KCT0000001", phase="Phase 3"),
+            ClinicalTrialDB(drug_id=drug.id, trial_id="KCT0000002", phase="Phase 2"),
+        ])
+        await session.commit()
+
+    impact = await DataStore().aget_by_inn("drug3")
+
+    assert impact.inn == "DRUG3"
+    assert impact.hira_price == 1_000
+    assert len(impact.cris_trials) == 2
+    assert await DataStore().aget_by_inn("missing") is None
+
+
+async def test_aget_by_inn_cached_until_invalidated(drug_session_factory, monkeypatch):
+    """반복 조회는 캐시, invalidate_inn 후 DB 재조회"""
+    store = DataStore()
+    first = await store.aget_by_inn("DRUG2")
+    assert await store.aget_by_inn("missing") is None
+
+    def no_db():
+        raise AssertionError("DB 조회 발생")
+
+    monkeypatch.setattr(deps, "get_async_session", no_db)
+    assert await store.aget_by_inn("drug2") is first
+    assert await store.aget_by_inn("MISSING") is None
+
+    monkeypatch.setattr(deps, "get_async_session", lambda: drug_session_factory)
+    store.invalidate_inn("Drug2")
+    second = await store.aget_by_inn("DRUG2")
+    assert second is not first
+    assert second.inn == "DRUG2"
+
+
+def test_load_records_streams_large_files(tmp_path, monkeypatch):
+    """임계치 이상 파일은 ijson 스트리밍, 결과는 일괄 파싱과 동일"""
+    import types
+
+    pytest.importorskip("ijson")
+    path = tmp_path / "permits_full_20260101.json"
+    path.write_text('[{"ITEM_NAME": "약", "PRICE": 1.5}, {"ITEM_NAME": "B", "PRICE": 2}]',
+                    encoding="utf-8")
+
+    eager = deps._load_records(path)
+    monkeypatch.setattr(deps, "_STREAM_MIN_BYTES", 0)
+    streamed = deps._load_records(path)
+
+    assert isinstance(eager, list)
+    assert isinstance(streamed, types.GeneratorType)
+    assert list(streamed) == eager
+
+
+def test_search_prefix_first_then_substring():
+    """prefix 일치(INN 정렬) 우선, 이후 부분 일치(로드 순서), limit 적용"""
+    from types import SimpleNamespace
+
+    store = DataStore()
+    store.impacts = [
+        SimpleNamespace(
+            inn=inn, global_score=0, domestic_status=None, hira_price=None, hira_status=None,
+        )
+        for inn in ["Nivolumab", "Pembrolizumab", "Atezolizumab", "Pemetrexed", "Ipilimumab"]
+    ]
+    store._build_indexes()
+
+    assert [i.inn for i in store.search("PEM")] == ["Pembrolizumab", "Pemetrexed"]
+    assert [i.inn for i in store.search("lizumab")] == ["Pembrolizumab", "Atezolizumab"]
+    assert [i.inn for i in store.search("i", limit=3)] == ["Ipilimumab", "Nivolumab", "Pembrolizumab"]
+    assert store.search("zz") == []
+
+
+def test_ttl_cache_per_key_ttl_and_lru():
+    """항목별 ttl 지정 가능, maxsize 초과 시 가장 오래 쓰지 않은 키부터 제거"""
+    cache = deps._TTLCache(maxsize=2, ttl=60.0)
+    cache.set("a", 1)
+    cache.set("miss", None, ttl=-1)
+    assert cache.get("miss") is deps._MISSING
+
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is deps._MISSING
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+
+def test_get_by_inn_follows_rebuilt_indexes():
+    """get_by_inn은 대소문자 무시, 인덱스 재빌드 시 새 데이터 반영"""
+    from types import SimpleNamespace
+
+    def impact(inn):
+        return SimpleNamespace(
+            inn=inn, global_score=0, domestic_status=None, hira_price=None, hira_status=None,
+        )
+
+    store = DataStore()
+    assert store.get_by_inn("Nivolumab") is None
+    store.impacts = [impact("Nivolumab")]
+    store._build_indexes()
+    first = store.get_by_inn("NIVOLUMAB")
+    assert first is store.impacts[0]
+    assert store.get_by_inn("nivolumab") is first
+
+    store.impacts = [impact("Nivolumab")]
+    store._build_indexes()
+    assert store.get_by_inn("NIVOLUMAB") is store.impacts[0] is not first
+
+
+def test_search_trigram_index_matches_linear_scan():
+    """3-gram 후보 축소 결과가 전체 선형 스캔과 동일"""
+    from types import SimpleNamespace
+
+    inns = ["Nivolumab", "Pembrolizumab", "Atezolizumab", "Pemetrexed", "Ipilimumab", "Abab"]
+    store = DataStore()
+    store.impacts = [
+        SimpleNamespace(
+            inn=inn, global_score=0, domestic_status=None, hira_price=None, hira_status=None,
+        )
+        for inn in inns
+    ]
+    store._build_indexes()
+
+    for query in ["mab", "umab", "zumab", "aba", "abab", "xyz", "mabx", "IMUMAB"]:
+        q = query.casefold()
+        prefix = sorted((i for i in inns if i.casefold().startswith(q)), key=str.casefold)
+        inner = [i for i in inns if q in i.casefold() and not i.casefold().startswith(q)]
+        assert [i.inn for i in store.search(query, limit=50)] == prefix + inner, query
+
+
+def test_presorted_views_match_filter_and_sort():
+    """사전 정렬 뷰 결과가 filter+sort와 동일 (동점은 로드 순서)"""
+    from types import SimpleNamespace
+
+    from regscan.map.ingredient_bridge import ReimbursementStatus
+    from regscan.scan.domestic import DomesticStatus
+
+    imminent = DomesticStatus.IMMINENT
+    reimbursed = ReimbursementStatus.REIMBURSED
+    store = DataStore()
+    store.impacts = [
+        SimpleNamespace(inn="A", global_score=50, domestic_status=imminent, hira_price=2_000_000,
+                        hira_status=reimbursed),
+        SimpleNamespace(inn="B", global_score=90, domestic_status=None, hira_price=None,
+                        hira_status=None),
+        SimpleNamespace(inn="C", global_score=70, domestic_status=imminent, hira_price=500_000,
+                        hira_status=ReimbursementStatus.DELISTED),
+        SimpleNamespace(inn="D", global_score=70, domestic_status=None, hira_price=3_000_000,
+                        hira_status=reimbursed),
+        SimpleNamespace(inn="E", global_score=10, domestic_status=None, hira_price=float("nan"),
+                        hira_status=None),
+    ]
+    store._build_indexes()
+
+    assert [i.inn for i in store.get_hot_issues(min_score=60)] == ["B", "C", "D"]
+    assert [i.inn for i in store.get_hot_issues(min_score=70)] == ["B", "C", "D"]
+    assert store.get_hot_issues(min_score=91) == []
+    assert [i.inn for i in store.get_imminent()] == ["C", "A"]
+    assert [i.inn for i in store.get_high_value()] == ["D", "A"]
+    assert [i.inn for i in store.get_high_value(min_price=0)] == ["D", "A", "C"]
+    assert [i.inn for i in store.get_by_score()] == ["B", "C", "D", "A", "E"]
+    assert [i.inn for i in store.get_reimbursed()] == ["A", "D"]
+    assert [i.inn for i in store.get_hot_issues(min_score=60, offset=1, limit=1)] == ["C"]
+    assert [i.inn for i in store.get_imminent(offset=1, limit=5)] == ["A"]
+    assert store.get_high_value(offset=2, limit=1) == []
+    assert store.reimbursed_count == 2
+    assert store.hot_issues_count == 3 and store.imminent_count == 2
+    # 반환 목록을 수정해도 사전 정렬 뷰는 그대로
+    store.get_by_score().clear()
+    assert len(store.get_by_score()) == 5
+
+
+async def test_drug_row_maps_agency_events(drug_session_factory):
+    """agency별 이벤트 → 승인 여부·일자·MFDS 브랜드명 (대소문자 무시)"""
+    from datetime import date
+
+    from sqlalchemy import select
+
+    from regscan.db.models import RegulatoryEventDB
+
+    async with drug_session_factory() as session:
+        drug = (await session.execute(select(DrugDB).where(DrugDB.inn == "DRUG1"))).scalar_one()
+        session.add_all([
+            RegulatoryEventDB(drug_id=drug.id, agency="FDA", approval_date=date(2024, 3, 1)),
+            RegulatoryEventDB(drug_id=drug.id, agency="mfds", approval_date=date(2025, 1, 2),
+                              brand_name="브랜드"),
+        ])
+        await session.commit()
+
+    impact = await DataStore().aget_by_inn("DRUG1")
+
+    assert (impact.fda_approved, impact.fda_date) == (True, date(2024, 3, 1))
+    assert (impact.ema_approved, impact.ema_date) == (False, None)
+    assert (impact.mfds_approved, impact.mfds_brand_name) == (True, "브랜드")
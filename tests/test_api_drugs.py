@@ -0,0 +1,258 @@
+"""약물 API 라우트 테스트 (브리핑 캐시 / ETag, 상세 페이지 일괄 조회)"""
+
+import asyncio
+from datetime import date, datetime
+
+import httpx
+import pytest
+from fastapi import FastAPI, HTTPException
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from regscan.api import deps
+from regscan.api.deps import DataStore, ResponseCache, get_data_store
+from regscan.api.routes import drugs
+from regscan.report.llm_generator import BriefingReport
+from regscan.scan.domestic import DomesticImpact, DomesticStatus
+
+
+class _CountingGenerator:
+    def __init__(self):
+        self.calls = 0
+
+    async def generate(self, impact):
+        self.calls += 1
+        return BriefingReport(
+            inn=impact.inn, headline="H", subtitle="S", key_points=["a"],
+            global_section="g", domestic_section="d", medclaim_section="m",
+            generated_at=datetime(2026, 1, 1, 9, 0),
+        )
+
+
+async def test_briefing_cached_with_etag_and_cleared(monkeypatch):
+    """같은 INN 재요청은 LLM 생략, If-None-Match 일치 시 304, clear 후 재생성"""
+    cache = ResponseCache(maxsize=4)
+    generator = _CountingGenerator()
+    monkeypatch.setattr(drugs, "briefing_cache", cache)
+    monkeypatch.setattr(drugs, "get_llm_generator", lambda: generator)
+
+    store = DataStore()
+    store.impacts = [DomesticImpact(inn="Pembrolizumab", domestic_status=DomesticStatus.IMMINENT)]
+    store._build_indexes()
+
+    app = FastAPI()
+    app.include_router(drugs.router, prefix="/drugs")
+    app.dependency_overrides[get_data_store] = lambda: store
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        first = await client.get("/drugs/pembrolizumab/briefing")
+        second = await client.get("/drugs/PEMBROLIZUMAB/briefing")
+        assert first.status_code == second.status_code == 200
+        assert first.json() == second.json()
+        assert generator.calls == 1
+        assert first.headers["last-modified"] == "Thu, 01 Jan 2026 09:00:00 GMT"
+
+        etag = first.headers["etag"]
+        not_modified = await client.get(
+            "/drugs/pembrolizumab/briefing", headers={"If-None-Match": etag},
+        )
+        assert not_modified.status_code == 304 and not_modified.content == b""
+        assert cache.info["hits"] == 2 and cache.info["currsize"] == 1
+
+        cache.clear()
+        await client.get("/drugs/pembrolizumab/briefing")
+        assert generator.calls == 2
+
+
+async def test_briefing_llm_calls_bounded_by_semaphore(monkeypatch):
+    """서로 다른 INN 동시 요청도 _briefing_slots 수만큼만 LLM 동시 호출"""
+
+    class _SlowGenerator(_CountingGenerator):
+        def __init__(self):
+            super().__init__()
+            self.in_flight = self.peak = 0
+
+        async def generate(self, impact):
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            return await super().generate(impact)
+
+    generator = _SlowGenerator()
+    monkeypatch.setattr(drugs, "briefing_cache", ResponseCache(maxsize=8))
+    monkeypatch.setattr(drugs, "get_llm_generator", lambda: generator)
+    monkeypatch.setattr(drugs, "_briefing_slots", asyncio.Semaphore(2))
+
+    store = DataStore()
+    store.impacts = [
+        DomesticImpact(inn=f"drug{i}", domestic_status=DomesticStatus.IMMINENT) for i in range(5)
+    ]
+    store._build_indexes()
+
+    app = FastAPI()
+    app.include_router(drugs.router, prefix="/drugs")
+    app.dependency_overrides[get_data_store] = lambda: store
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        responses = await asyncio.gather(
+            *(client.get(f"/drugs/drug{i}/briefing") for i in range(5))
+        )
+    assert all(r.status_code == 200 for r in responses)
+    assert generator.calls == 5 and generator.peak == 2
+
+
+async def test_briefing_stream_deadline_sends_fallback(monkeypatch):
+    """스트림이 BRIEFING_LLM_DEADLINE을 넘기면 끊고 fallback 리포트를 done으로, 슬롯 반환"""
+    from regscan.config import settings
+
+    class _StallingGenerator(_CountingGenerator):
+        async def generate_stream(self, impact):
+            yield "부분"
+            await asyncio.sleep(60)
+
+        def _generate_fallback(self, impact):
+            return BriefingReport(
+                inn=impact.inn, headline="fallback", subtitle="", key_points=[],
+                global_section="", domestic_section="", medclaim_section="",
+            )
+
+    slots = asyncio.Semaphore(1)
+    monkeypatch.setattr(drugs, "_briefing_slots", slots)
+    monkeypatch.setattr(settings, "BRIEFING_LLM_DEADLINE", 0.05)
+    impact = DomesticImpact(inn="drug0", domestic_status=DomesticStatus.IMMINENT)
+
+    frames = [frame async for frame in drugs._briefing_events(_StallingGenerator(), impact)]
+
+    assert frames[0].startswith(b"data: ") and "부분".encode() in frames[0]
+    assert frames[-1].startswith(b"event: done") and b'"headline":"fallback"' in frames[-1]
+    assert not slots.locked()
+
+
+async def test_response_cache_lru_and_single_flight():
+    """maxsize 초과 시 오래된 키 제거, 동시 요청은 factory 1회"""
+    import asyncio
+
+    cache = ResponseCache(maxsize=2)
+    calls = []
+
+    async def factory(key):
+        calls.append(key)
+        await asyncio.sleep(0)
+        return key
+
+    results = await asyncio.gather(*[cache.get_or_set("a", lambda: factory("a")) for _ in range(5)])
+    assert results == ["a"] * 5 and calls == ["a"]
+    assert not cache._pending
+
+    await cache.get_or_set("b", lambda: factory("b"))
+    await cache.get_or_set("c", lambda: factory("c"))
+    assert cache.get("a") is deps._MISSING
+    assert cache.info["currsize"] == 2
+
+
+async def test_drug_page_bundles_v2_sections(monkeypatch):
+    """상세 페이지: 최신 인사이트·지정 유형 기사·최신순 프리프린트/시장 리포트 (limit 적용)"""
+    from regscan.config import settings
+    from regscan.db.models import (
+        AIInsightDB, ArticleDB, Base, DrugDB, MarketReportDB, PreprintDB,
+    )
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with factory() as session:
+        drug = DrugDB(inn="pembrolizumab")
+        session.add(drug)
+        await session.flush()
+        session.add_all([
+            AIInsightDB(drug_id=drug.id, impact_score=50, generated_at=datetime(2026, 1, 1)),
+            AIInsightDB(drug_id=drug.id, impact_score=70, generated_at=datetime(2026, 2, 1)),
+            ArticleDB(drug_id=drug.id, article_type="briefing", headline="B",
+                      generated_at=datetime(2026, 1, 1)),
+            ArticleDB(drug_id=drug.id, article_type="newsletter", headline="N",
+                      generated_at=datetime(2026, 3, 1)),
+            PreprintDB(drug_id=drug.id, title="old", published_date=date(2025, 1, 1)),
+            PreprintDB(drug_id=drug.id, title="new", published_date=date(2025, 6, 1)),
+            PreprintDB(drug_id=drug.id, title="undated"),
+            MarketReportDB(drug_id=drug.id, source="ASTI", title="M"),
+        ])
+        await session.commit()
+
+    monkeypatch.setattr(drugs, "get_async_session", lambda: factory)
+    monkeypatch.setattr(settings, "DATABASE_URL", "postgresql+asyncpg://localhost/regscan")
+
+    try:
+        page = await drugs.get_drug_page("pembrolizumab", article_type="briefing", limit=2)
+        assert page.insight.impact_score == 70
+        assert page.article.headline == "B"
+        assert [p.title for p in page.preprints] == ["new", "old"]
+        assert [m.title for m in page.market_reports] == ["M"]
+
+        empty = await drugs.get_drug_page("pembrolizumab", article_type="press_release", limit=20)
+        assert empty.article is None and len(empty.preprints) == 3
+
+        with pytest.raises(HTTPException) as missing:
+            await drugs.get_drug_page("unknown", article_type="briefing", limit=20)
+        assert missing.value.status_code == 404
+    finally:
+        await engine.dispose()
+
+
+async def test_list_and_search_serialize_summaries():
+    """목록/검색은 DrugSummary 배열 JSON (NaN 가격 → null, 등급·상태 파생 필드 포함)"""
+    store = DataStore()
+    store.impacts = [
+        DomesticImpact(inn="Pembrolizumab", domestic_status=DomesticStatus.IMMINENT,
+                       global_score=85, hira_price=float("nan")),
+        DomesticImpact(inn="Nivolumab", domestic_status=DomesticStatus.EXPECTED, global_score=45),
+    ]
+    store._build_indexes()
+
+    app = FastAPI()
+    app.include_router(drugs.router, prefix="/drugs")
+    app.dependency_overrides[get_data_store] = lambda: store
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        listed = await client.get("/drugs", params={"limit": 1, "offset": 1})
+        assert listed.headers["content-type"] == "application/json"
+        assert [d["inn"] for d in listed.json()] == ["Nivolumab"]
+        assert listed.json()[0]["hot_issue_level"] == "MID"
+
+        found = (await client.get("/drugs/search", params={"q": "pem"})).json()
+        assert found[0]["hira_price"] is None
+        assert found[0]["hot_issue_level"] == "HOT" and found[0]["domestic_status"] == "imminent"
+
+
+async def test_v2_routes_501_outside_postgres(monkeypatch):
+    """SQLite 모드에서 v2 라우트는 본문 진입 전 501"""
+    from regscan.config import settings
+
+    monkeypatch.setattr(settings, "DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+    app = FastAPI()
+    app.include_router(drugs.router, prefix="/drugs")
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        for suffix in ("page", "insight", "article", "preprints", "market"):
+            response = await client.get(f"/drugs/pembrolizumab/{suffix}")
+            assert response.status_code == 501, suffix
+
+
+async def test_card_detail_built_directly_from_impact():
+    """카드 상세: 요약 필드 + 상세 필드를 한 번에 (SQLite 모드는 기사·이벤트 없이)"""
+    store = DataStore()
+    store.impacts = [DomesticImpact(
+        inn="Pembrolizumab", domestic_status=DomesticStatus.IMMINENT,
+        global_score=85, hira_price=float("nan"), fda_approved=True,
+    )]
+    store._build_indexes()
+
+    detail = await drugs.get_drug_card_detail("pembrolizumab", store=store)
+    assert detail.inn == "Pembrolizumab" and detail.agencies == ["FDA"]
+    assert detail.hot_issue_level == "HOT" and detail.hira_price is None
+    assert detail.regulatory_events == [] and detail.article_headline == ""
@@ -0,0 +1,40 @@
+"""PDUFA 일정 API 테스트 (인메모리 SQLite)"""
+
+import json
+from datetime import date, timedelta
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from regscan.db import database
+from regscan.db.models import Base, PdufaDateDB
+
+
+async def test_upcoming_pdufa_pending_future_only(monkeypatch):
+    """pending + 오늘 이후만 날짜순, days_until은 요청일 기준"""
+    from regscan.api.routes import pdufa
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    today = date.today()
+    async with factory() as session:
+        session.add_all([
+            PdufaDateDB(inn="later", pdufa_date=today + timedelta(days=30)),
+            PdufaDateDB(inn="today", pdufa_date=today, brand_name=None),
+            PdufaDateDB(inn="past", pdufa_date=today - timedelta(days=1)),
+            PdufaDateDB(inn="approved", pdufa_date=today + timedelta(days=5), status="approved"),
+        ])
+        await session.commit()
+    monkeypatch.setattr(database, "get_async_session", lambda: factory)
+
+    try:
+        response = await pdufa.get_upcoming_pdufa()
+    finally:
+        await engine.dispose()
+
+    assert response.media_type == "application/json"
+    items = json.loads(response.body)
+    assert [(i["inn"], i["days_until"]) for i in items] == [("today", 0), ("later", 30)]
+    assert items[0]["brand_name"] == "" and items[0]["pdufa_date"] == today.isoformat()
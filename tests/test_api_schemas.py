@@ -0,0 +1,64 @@
+"""API 스키마 테스트"""
+
+import json
+from dataclasses import FrozenInstanceError
+from decimal import Decimal
+from typing import get_args
+
+import pytest
+
+from regscan.api.schemas import (
+    DRUG_SUMMARY_LIST, DomesticStatusValue, DrugCardDetail, DrugSummary, HotIssueLevel,
+    ImminentDrugItem, MedclaimInsight, Quadrant,
+)
+
+
+@pytest.mark.parametrize("price, expected", [
+    (float("nan"), None), (Decimal("NaN"), None), (None, None),
+    (1200.0, 1200), (45652.4, 45652), (Decimal("900.0"), 900), (900, 900),
+])
+def test_hira_price_normalized_to_won(price, expected):
+    """HiraPrice 타입: NaN → None, 상한가는 원 단위 정수"""
+    assert MedclaimInsight(inn="a", hira_price=price).hira_price == expected
+    assert ImminentDrugItem(inn="a", global_score=1, cris_trial_count=0, hira_price=price).hira_price == expected
+    assert DrugCardDetail(inn="a", domestic_status="imminent", hira_price=price).hira_price == expected
+
+
+def test_list_row_schemas_are_slotted():
+    """목록 행 스키마는 __dict__ 없는 불변 객체, NaN 가격 정규화는 동일"""
+    row = DrugSummary(
+        inn="a", fda_approved=True, ema_approved=False, mfds_approved=False,
+        hira_reimbursed=False, hira_price=float("nan"), global_score=70,
+        hot_issue_level="HIGH", domestic_status="imminent",
+    )
+    assert not hasattr(row, "__dict__") and row.hira_price is None
+    with pytest.raises(FrozenInstanceError):
+        row.inn = "b"
+    assert json.loads(DRUG_SUMMARY_LIST.dump_json([row]))[0]["quadrant"] == "normal"
+
+
+def test_enum_literals_match_domain_values():
+    """Literal 필드 값 집합 = scan.domestic의 등급 / 상태 값"""
+    from regscan.scan.domestic import _HOT_LEVELS, DomesticStatus
+
+    assert get_args(HotIssueLevel) == _HOT_LEVELS
+    assert set(get_args(DomesticStatusValue)) == {s.value for s in DomesticStatus}
+    assert set(get_args(Quadrant)) == {"top_priority", "watch", "track", "normal"}
+
+
+def test_enum_literal_fields_share_string_objects():
+    """Literal 필드는 입력 문자열 대신 스키마의 값 객체를 돌려줌 — 행마다 문자열을 새로 두지 않음"""
+
+    def row():
+        return DrugSummary(
+            inn="a", fda_approved=True, ema_approved=False, mfds_approved=False,
+            hira_reimbursed=False, global_score=70,
+            hot_issue_level="".join(["HI", "GH"]),
+            domestic_status="".join(["immi", "nent"]),
+            quadrant="".join(["wa", "tch"]),
+        )
+
+    first, second = row(), row()
+    assert first.hot_issue_level is second.hot_issue_level
+    assert first.domestic_status is second.domestic_status
+    assert first.quadrant is second.quadrant
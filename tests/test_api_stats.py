@@ -0,0 +1,79 @@
+"""통계 / 핫이슈 API 테스트 (로드 단위 응답 스냅샷)"""
+
+from datetime import datetime
+
+import httpx
+from fastapi import FastAPI
+
+from regscan.api.deps import DataStore, get_data_store
+from regscan.api.routes import drugs, stats
+from regscan.scan.domestic import DomesticImpact, DomesticStatus
+
+
+def _app(store: DataStore) -> FastAPI:
+    app = FastAPI()
+    app.include_router(stats.router)
+    app.include_router(drugs.router, prefix="/drugs")
+    app.dependency_overrides[get_data_store] = lambda: store
+    return app
+
+
+async def test_snapshot_reused_until_reindex_with_etag():
+    """같은 파라미터는 직렬화 바이트 재사용, If-None-Match 일치 시 304, 인덱스 재빌드 시 갱신"""
+    store = DataStore()
+    store.impacts = [
+        DomesticImpact(inn="A", domestic_status=DomesticStatus.IMMINENT, global_score=90),
+        DomesticImpact(inn="B", domestic_status=DomesticStatus.EXPECTED, global_score=50),
+    ]
+    store._build_indexes()
+    store.loaded_at = datetime(2026, 1, 1, 9, 0)
+
+    transport = httpx.ASGITransport(app=_app(store))
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        hot = await client.get("/hot-issues", params={"limit": 10})
+        assert hot.status_code == 200
+        assert [i["inn"] for i in hot.json()] == ["A"]
+        assert hot.json()[0]["hot_issue_level"] == "HOT"
+
+        counts = (await client.get("/stats")).json()
+        assert counts["hot_issues_count"] == 1 and counts["imminent_count"] == 1
+
+        first = await client.get("/drugs", params={"status": "imminent"})
+        assert [d["inn"] for d in first.json()] == ["A"]
+        assert ("drugs", "imminent", 0, 50) in store._snapshots
+
+        etag = first.headers["etag"]
+        again = await client.get(
+            "/drugs", params={"status": "imminent"}, headers={"If-None-Match": etag},
+        )
+        assert again.status_code == 304 and again.content == b""
+
+        store.impacts.append(
+            DomesticImpact(inn="C", domestic_status=DomesticStatus.IMMINENT, global_score=95)
+        )
+        store._build_indexes()
+        fresh = await client.get(
+            "/drugs", params={"status": "imminent"}, headers={"If-None-Match": etag},
+        )
+        assert fresh.status_code == 200 and fresh.headers["etag"] != etag
+        assert [d["inn"] for d in fresh.json()] == ["C", "A"]
+
+
+async def test_snapshot_honors_if_modified_since():
+    """Last-Modified = 로드 시각, If-Modified-Since가 그 이후면 304 (이전이면 본문)"""
+    store = DataStore()
+    store._build_indexes()
+    store.loaded_at = datetime(2026, 1, 1, 9, 0, 30, 500)
+
+    transport = httpx.ASGITransport(app=_app(store))
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        first = await client.get("/stats")
+        last_modified = first.headers["last-modified"]
+
+        cached = await client.get("/stats", headers={"If-Modified-Since": last_modified})
+        assert cached.status_code == 304 and cached.headers["etag"] == first.headers["etag"]
+
+        stale = await client.get(
+            "/stats", headers={"If-Modified-Since": "Thu, 01 Jan 2015 00:00:00 GMT"},
+        )
+        assert stale.status_code == 200 and stale.json()["imminent_count"] == 0
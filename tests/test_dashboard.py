@@ -0,0 +1,43 @@
+"""대시보드 HTML 라우트 테스트"""
+
+from datetime import datetime
+
+import httpx
+from fastapi import FastAPI
+
+from regscan.api.deps import DataStore, get_data_store
+from regscan.api.routes import dashboard
+
+
+async def test_dashboard_html_cached_until_reload(monkeypatch):
+    """같은 loaded_at이면 렌더링 결과 재사용, 재로드 시 다시 렌더링"""
+    store = DataStore()
+    store.loaded_at = datetime(2026, 1, 1, 9, 0)
+
+    renders = []
+    get_template = dashboard.templates.get_template
+
+    def counting_get_template(name):
+        renders.append(name)
+        return get_template(name)
+
+    monkeypatch.setattr(dashboard.templates, "get_template", counting_get_template)
+    monkeypatch.setattr(dashboard, "_dashboard_cache", None)
+
+    app = FastAPI()
+    app.include_router(dashboard.router)
+    app.dependency_overrides[get_data_store] = lambda: store
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        first = await client.get("/dashboard")
+        second = await client.get("/dashboard")
+        assert first.status_code == second.status_code == 200
+        assert first.headers["content-type"].startswith("text/html")
+        assert second.content == first.content
+        assert len(renders) == 1
+
+        store.loaded_at = datetime(2026, 1, 1, 10, 0)
+        third = await client.get("/dashboard")
+        assert third.status_code == 200
+        assert len(renders) == 2
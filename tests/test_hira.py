@@ -227,3 +227,25 @@ class TestHIRAIntegration:
         assert CATEGORY_MAP["09"] == "심사지침"
         assert CATEGORY_MAP["10"] == "심의사례공개"
         assert CATEGORY_MAP["17"] == "심사사례지침"
+
+
+# =============================================================================
+# IngredientBridge HIRA 로드 테스트
+# =============================================================================
+
+def test_load_hira_accepts_bare_nan_price(tmp_path):
+    """수집기가 기록한 bare NaN 가격도 로드 (NaN은 float으로 유지)"""
+    from regscan.map.ingredient_bridge import IngredientBridge
+
+    path = tmp_path / "drug_prices_20260101.json"
+    path.write_text(
+        '[{"ingredient_code": "A01", "price_ceiling": NaN},'
+        ' {"ingredient_code": "A02", "price_ceiling": 1200.0}]',
+        encoding="utf-8",
+    )
+
+    bridge = IngredientBridge()
+    assert bridge.load_hira(path) == 2
+    price = bridge._hira_by_code["A01"][0]["price_ceiling"]
+    assert price != price
+    assert bridge._hira_by_code["A02"][0]["price_ceiling"] == 1200.0
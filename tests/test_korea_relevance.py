@@ -1,4 +1,4 @@
-"""KoreaRelevanceScorer + DomesticImpact.quadrant 테스트"""
+"""KoreaRelevanceScorer + DomesticImpact.quadrant / hot_issue_level 테스트"""
 
 import pytest
 
@@ -58,6 +58,14 @@ class TestQuadrant:
         assert impact.quadrant == "watch"
 
 
+class TestHotIssueLevel:
+    def test_level_boundaries(self):
+        """경계값: 40/60/80점 이상이면 MID/HIGH/HOT"""
+        expected = {0: "LOW", 39: "LOW", 40: "MID", 59: "MID", 60: "HIGH", 79: "HIGH", 80: "HOT", 100: "HOT"}
+        for score, level in expected.items():
+            assert _make_impact(global_score=score).hot_issue_level == level, score
+
+
 # ── KoreaRelevanceScorer 테스트 ──
 
 class TestKoreaRelevanceScorer:
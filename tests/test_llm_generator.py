@@ -0,0 +1,165 @@
+"""LLM 브리핑 생성기 스트리밍 테스트 (OpenAI 클라이언트 대역)"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from regscan.report.llm_generator import BriefingReport, LLMBriefingGenerator
+from regscan.scan.domestic import DomesticImpact, DomesticStatus
+
+
+def _chunk(content=None, tool_calls=None):
+    """스트림 델타 청크 1개"""
+    delta = SimpleNamespace(content=content, tool_calls=tool_calls)
+    return SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+
+def _tool_call(index, call_id, name, arguments):
+    fn = SimpleNamespace(name=name, arguments=arguments)
+    return SimpleNamespace(index=index, id=call_id, function=fn)
+
+
+class _FakeToolStreamCompletions:
+    """1회차: get_regulatory_status 툴콜 스트림, 2회차: JSON 본문 스트림"""
+
+    def __init__(self, content, size=9, tool_round_text=None):
+        self.content = content
+        self.size = size
+        self.tool_round_text = tool_round_text
+        self.calls = []
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        first_round = len(self.calls) == 1
+
+        async def _chunks():
+            if first_round:
+                yield _chunk(tool_calls=[
+                    _tool_call(0, "call_1", "get_regulatory_status", '{"agency":'),
+                ])
+                yield _chunk(tool_calls=[_tool_call(0, None, None, ' "fda"}')])
+                if self.tool_round_text:
+                    yield _chunk(self.tool_round_text)
+                return
+            for i in range(0, len(self.content), self.size):
+                yield _chunk(self.content[i:i + self.size])
+            yield SimpleNamespace(choices=[], usage=SimpleNamespace(total_tokens=10))
+
+        return _chunks()
+
+
+def _generator(completions):
+    generator = LLMBriefingGenerator(provider="openai", model="gpt-4o-mini", api_key="test")
+    generator._prepare_drug_data_v4 = lambda impact: "{}"
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    generator._get_async_client = lambda: client
+    return generator
+
+
+async def test_generate_stream_yields_deltas_then_report():
+    """툴콜 라운드 후 본문 델타를 순서대로 내보내고 마지막에 리포트"""
+    body = json.dumps({"headline": "H", "subtitle": "S", "key_points": ["a", "b"]})
+    completions = _FakeToolStreamCompletions(body)
+    impact = DomesticImpact(inn="pembrolizumab", domestic_status=DomesticStatus.IMMINENT)
+
+    items = [item async for item in _generator(completions).generate_stream(impact)]
+
+    *deltas, report = items
+    assert "".join(deltas) == body
+    assert isinstance(report, BriefingReport)
+    assert report.headline == "H" and report.key_points == ["a", "b"]
+
+    assert completions.calls[0]["stream"] is True
+    second_messages = completions.calls[1]["messages"]
+    tool_messages = [m for m in second_messages if m["role"] == "tool"]
+    assert tool_messages[0]["tool_call_id"] == "call_1"
+    assert json.loads(tool_messages[0]["content"])["approved"] is False
+
+
+async def test_generate_stream_skips_tool_round_text():
+    """툴콜 라운드에 섞인 본문은 델타로 내보내지 않음 — 최종 라운드만"""
+    body = json.dumps({"headline": "H"})
+    completions = _FakeToolStreamCompletions(body, tool_round_text="확인 중...")
+    impact = DomesticImpact(inn="pembrolizumab", domestic_status=DomesticStatus.IMMINENT)
+
+    items = [item async for item in _generator(completions).generate_stream(impact)]
+
+    *deltas, report = items
+    assert "".join(deltas) == body
+    assert report.headline == "H"
+
+
+async def test_generate_stream_falls_back_on_error():
+    """스트림 도중 오류 → fallback 리포트로 종료"""
+
+    class _Broken:
+        async def create(self, **kwargs):
+            raise RuntimeError("boom")
+
+    impact = DomesticImpact(inn="pembrolizumab", domestic_status=DomesticStatus.IMMINENT)
+    items = [item async for item in _generator(_Broken()).generate_stream(impact)]
+
+    assert len(items) == 1 and isinstance(items[0], BriefingReport)
+
+
+def test_client_options_and_token_cap():
+    """timeout/max_retries는 지정한 값만 SDK에 전달, 토큰 상한은 모델 계열별 키"""
+    default = LLMBriefingGenerator(provider="openai", model="gpt-4o-mini", api_key="test")
+    assert default._sdk_options() == {}
+    assert default._token_param() == {"max_tokens": 3000}
+
+    bounded = LLMBriefingGenerator(
+        provider="openai", model="gpt-5-mini", api_key="test",
+        timeout=12.0, max_retries=1, max_output_tokens=800,
+    )
+    assert bounded._sdk_options() == {"timeout": 12.0, "max_retries": 1}
+    assert bounded._token_param() == {"max_completion_tokens": 800}
+    client = bounded._get_client()
+    assert client.timeout == 12.0 and client.max_retries == 1
+
+
+async def test_generate_uses_async_client_tool_loop():
+    """generate()는 비동기 클라이언트로 툴콜 라운드 후 본문 응답을 파싱"""
+
+    class _Completions:
+        def __init__(self):
+            self.calls = []
+
+        async def create(self, **kwargs):
+            self.calls.append(kwargs)
+            if len(self.calls) == 1:
+                call = _tool_call(0, "call_1", "get_regulatory_status", '{"agency": "fda"}')
+                msg = SimpleNamespace(content=None, tool_calls=[call])
+            else:
+                msg = SimpleNamespace(content=json.dumps({"headline": "H"}), tool_calls=None)
+            return SimpleNamespace(choices=[SimpleNamespace(message=msg)])
+
+    completions = _Completions()
+    impact = DomesticImpact(inn="pembrolizumab", domestic_status=DomesticStatus.IMMINENT)
+
+    report = await _generator(completions).generate(impact)
+
+    assert report.headline == "H"
+    assert len(completions.calls) == 2
+    assert completions.calls[1]["messages"][-1]["tool_call_id"] == "call_1"
+
+
+async def test_generate_timeout_cancels_request():
+    """바깥 wait_for가 만료되면 진행 중인 SDK 요청도 취소"""
+    cancelled = asyncio.Event()
+
+    class _Hanging:
+        async def create(self, **kwargs):
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+    impact = DomesticImpact(inn="pembrolizumab", domestic_status=DomesticStatus.IMMINENT)
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(_generator(_Hanging()).generate(impact), timeout=0.05)
+
+    assert cancelled.is_set()
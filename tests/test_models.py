@@ -71,3 +71,20 @@ def test_feed_card_json():
     json_data = card.model_dump_json()
     assert "card-test-001" in json_data
     assert "HIRA_NOTICE" in json_data
+
+
+def test_domestic_impact_slots_with_enrichment_fields():
+    """DomesticImpact는 __dict__ 없이 slots, 기사 보강 속성은 선언된 필드로 대입"""
+    import pytest
+
+    from regscan.scan.domestic import DomesticImpact, DomesticStatus
+
+    impact = DomesticImpact(inn="rituximab", domestic_status=DomesticStatus.IMMINENT)
+
+    assert not hasattr(impact, "__dict__")
+    assert impact._competitors is None
+    impact._competitors = [{"inn": "obinutuzumab"}]
+    impact._news_cache = {"rituximab": []}
+    assert impact._competitors[0]["inn"] == "obinutuzumab"
+    with pytest.raises(AttributeError):
+        impact.undeclared = 1
@@ -0,0 +1,90 @@
+"""스케줄러 상태 스냅샷 테스트"""
+
+import asyncio
+
+from regscan import scheduler
+
+
+async def test_scheduler_status_snapshot_invalidated_on_lifecycle(monkeypatch):
+    """상태 스냅샷은 재사용되고, 시작/종료/실행 결과 갱신 시 다시 계산"""
+    monkeypatch.setattr(scheduler, "_status", None)
+    monkeypatch.setattr(scheduler, "_last_run", None)
+
+    idle = scheduler.get_scheduler_status()
+    assert idle["running"] is False
+    assert scheduler.get_scheduler_status() is idle
+
+    scheduler.start_scheduler()
+    try:
+        running = scheduler.get_scheduler_status()
+        assert running["running"] is True and running["next_run"]
+        assert scheduler.get_scheduler_status() is running
+    finally:
+        scheduler.stop_scheduler()
+
+    stopped = scheduler.get_scheduler_status()
+    assert stopped["running"] is False and stopped is not running
+
+    scheduler._last_run = {"status": "success"}
+    scheduler._invalidate_status()
+    assert scheduler.get_scheduler_status()["last_run"] == {"status": "success"}
+
+
+async def test_pipeline_task_single_flight_and_error_recorded(monkeypatch):
+    """실행 중 재요청은 거부, 태스크 예외는 last_error로 노출"""
+    release = asyncio.Event()
+
+    async def fake_pipeline():
+        await release.wait()
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(scheduler, "run_daily_pipeline", fake_pipeline)
+    monkeypatch.setattr(scheduler, "_current_pipeline", None)
+    monkeypatch.setattr(scheduler, "_last_error", None)
+    monkeypatch.setattr(scheduler, "_status", None)
+
+    task = scheduler.start_pipeline_task()
+    assert task is not None
+    assert scheduler.start_pipeline_task() is None
+    assert scheduler.get_scheduler_status()["pipeline_running"] is True
+
+    release.set()
+    await asyncio.gather(task, return_exceptions=True)
+    await asyncio.sleep(0)  # done 콜백 실행
+
+    status = scheduler.get_scheduler_status()
+    assert status["pipeline_running"] is False
+    assert status["last_error"] == "RuntimeError: boom"
+    assert scheduler.start_pipeline_task() is not None
+    await asyncio.gather(scheduler._current_pipeline, return_exceptions=True)
+
+
+async def test_scheduled_run_shares_pipeline_guard(monkeypatch):
+    """cron 잡도 같은 태스크 가드 — 실행 중 표시, 중복 시 건너뜀, 오류 기록"""
+    release = asyncio.Event()
+    calls = []
+
+    async def fake_pipeline():
+        calls.append(1)
+        await release.wait()
+        return {"status": "error", "error": "scan failed"}
+
+    monkeypatch.setattr(scheduler, "run_daily_pipeline", fake_pipeline)
+    monkeypatch.setattr(scheduler, "_current_pipeline", None)
+    monkeypatch.setattr(scheduler, "_last_error", None)
+    monkeypatch.setattr(scheduler, "_status", None)
+
+    job = asyncio.create_task(scheduler._run_scheduled_pipeline())
+    await asyncio.sleep(0)
+    assert scheduler.get_scheduler_status()["pipeline_running"] is True
+    assert scheduler.start_pipeline_task() is None
+    await scheduler._run_scheduled_pipeline()  # 실행 중이면 즉시 반환
+
+    release.set()
+    await job
+    await asyncio.sleep(0)  # done 콜백 실행
+
+    status = scheduler.get_scheduler_status()
+    assert calls == [1]
+    assert status["pipeline_running"] is False
+    assert status["last_error"] == "scan failed"
@@ -0,0 +1,218 @@
+"""AI 임상결과 판독기 테스트"""
+
+import asyncio
+
+import pytest
+
+from regscan.ai.trial_reader import TrialResultReader
+
+
+def _study(i):
+    return {"nct_id": f"NCT{i:08d}", "title": f"Trial {i}", "conditions": ["NSCLC"]}
+
+
+async def test_read_trials_batch_bounded_concurrency(monkeypatch):
+    """동시 호출 수는 concurrency 이하, 결과는 입력 순서"""
+    reader = TrialResultReader()
+    active = 0
+    peak = 0
+
+    async def fake_call(prompt):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        nct = prompt.split("NCT ID: ")[1].split("\n")[0]
+        return f'{{"success": true, "confidence": 0.9, "summary": "{nct}"}}'
+
+    monkeypatch.setattr(reader, "_call_llm", fake_call)
+
+    results = await reader.read_trials_batch([_study(i) for i in range(10)], concurrency=3)
+
+    assert [r["summary"] for r in results] == [f"NCT{i:08d}" for i in range(10)]
+    assert peak <= 3
+
+
+async def test_read_trials_batch_failure_dict(monkeypatch):
+    """개별 실패는 실패 dict로 변환"""
+    reader = TrialResultReader()
+
+    async def fail(prompt):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(reader, "_call_llm", fail)
+
+    results = await reader.read_trials_batch([_study(1)])
+
+    assert results[0]["success"] is None
+    assert "boom" in results[0]["summary"]
+
+
+async def test_read_trial_reuses_cached_response(monkeypatch):
+    """동일 임상시험 재판독 시 LLM 재호출 없음"""
+    reader = TrialResultReader()
+    calls = []
+
+    async def fake_call(prompt):
+        calls.append(prompt)
+        return '{"success": false, "confidence": 0.7, "summary": "missed"}'
+
+    monkeypatch.setattr(reader, "_call_llm", fake_call)
+
+    first = await reader.read_trial(_study(1))
+    second = await reader.read_trial(_study(1))
+
+    assert first == second
+    assert first["success"] is False
+    assert len(calls) == 1
+
+
+async def test_read_trial_does_not_cache_unparsable_response(monkeypatch):
+    """JSON이 아닌 응답은 캐시하지 않고 다음 판독에서 재호출"""
+    reader = TrialResultReader()
+    replies = iter(["잠시 후 다시 시도하세요", '{"success": true, "confidence": 0.9, "summary": "met"}'])
+    calls = []
+
+    async def fake_call(prompt):
+        calls.append(prompt)
+        return next(replies)
+
+    monkeypatch.setattr(reader, "_call_llm", fake_call)
+
+    first = await reader.read_trial(_study(3))
+    second = await reader.read_trial(_study(3))
+
+    assert first["success"] is None and first["summary"] == "잠시 후 다시 시도하세요"
+    assert second["success"] is True
+    assert len(calls) == 2
+
+
+async def test_get_or_set_dedupes_concurrent_calls():
+    """동시 동일 키 요청은 factory 1회만 실행"""
+    from regscan.ai.cache import get_or_set
+
+    calls = []
+
+    async def factory():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "v"
+
+    results = await asyncio.gather(*(get_or_set("k", factory) for _ in range(5)))
+
+    assert results == ["v"] * 5
+    assert len(calls) == 1
+
+
+async def test_submit_and_collect_trial_batch(monkeypatch):
+    """batch 제출 → 완료 수거 → read_trial은 캐시에서 즉시 반환"""
+    import json
+    from types import SimpleNamespace
+
+    from regscan.config import settings
+
+    class FakeClient:
+        def __init__(self):
+            self.uploaded = b""
+            self.files = SimpleNamespace(create=self._create_file, content=self._content)
+            self.batches = SimpleNamespace(create=self._create_batch, retrieve=self._retrieve)
+            self.status = "in_progress"
+
+        async def _create_file(self, file, purpose):
+            self.uploaded = file[1]
+            return SimpleNamespace(id="file-in")
+
+        async def _create_batch(self, input_file_id, endpoint, completion_window):
+            return SimpleNamespace(id="batch-1", status="validating")
+
+        async def _retrieve(self, batch_id):
+            return SimpleNamespace(id=batch_id, status=self.status, output_file_id="file-out", error_file_id=None)
+
+        async def _content(self, file_id):
+            lines = []
+            for line in self.uploaded.decode().splitlines():
+                req = json.loads(line)
+                content = json.dumps({"success": True, "confidence": 0.8, "summary": req["custom_id"]})
+                lines.append(json.dumps({
+                    "custom_id": req["custom_id"],
+                    "response": {"status_code": 200, "body": {
+                        "choices": [{"message": {"content": content}}],
+                    }},
+                }))
+            return SimpleNamespace(text="\n".join(lines))
+
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", "test")
+    client = FakeClient()
+    reader = TrialResultReader()
+    monkeypatch.setattr(reader, "_get_openai_client", lambda: client)
+
+    async def no_llm(prompt):
+        raise AssertionError("LLM 호출 없어야 함")
+
+    monkeypatch.setattr(reader, "_call_llm", no_llm)
+
+    batch_id = await reader.submit_batch([_study(1), _study(2)])
+    assert batch_id == "batch-1"
+    assert await reader.poll_batches() == {}
+
+    client.status = "completed"
+    results = await reader.poll_batches()
+    assert set(results) == {"NCT00000001", "NCT00000002"}
+    assert (await reader.read_trial(_study(2)))["summary"] == "NCT00000002"
+    assert await reader.submit_batch([_study(1)]) is None
+
+
+async def test_call_llm_retries_rate_limit(monkeypatch):
+    """OpenAI 429는 재시도 후 응답 사용"""
+    from types import SimpleNamespace
+
+    from regscan.config import settings
+
+    class RateLimited(Exception):
+        status_code = 429
+
+    calls = []
+
+    async def create(**kwargs):
+        calls.append(kwargs)
+        if len(calls) == 1:
+            raise RateLimited("slow down")
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="ok"))])
+
+    monkeypatch.setattr(settings, "ANTHROPIC_API_KEY", "")
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", "test")
+    reader = TrialResultReader()
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    monkeypatch.setattr(reader, "_get_openai_client", lambda: client)
+
+    assert await reader._call_llm("prompt") == "ok"
+    assert len(calls) == 2
+
+
+async def test_openai_client_disables_sdk_retries(monkeypatch):
+    """재시도는 call_with_retry만 — SDK 자체 재시도는 0"""
+    pytest.importorskip("openai")
+    from regscan.ai.http_client import close_llm_http_client
+    from regscan.config import settings
+
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", "test")
+    reader = TrialResultReader()
+
+    assert reader._get_openai_client().max_retries == 0
+    await close_llm_http_client()
+
+
+def test_parse_result_json_block():
+    """코드펜스 유무와 관계없이 JSON 추출, 깨진 응답은 실패 dict"""
+    reader = TrialResultReader()
+    body = '{"success": true, "confidence": 0.8, "summary": "met"}'
+
+    for text in (f"```json\n{body}\n```", f"설명\n```\n{body}\n```\n끝", f"  {body}  "):
+        result = reader._parse_result(text)
+        assert result["success"] is True
+        assert result["summary"] == "met"
+
+    broken = reader._parse_result("```json\nnot json\n```")
+    assert broken["success"] is None
+    assert broken["confidence"] == 0.0
@@ -255,3 +255,26 @@ async def test_drug_v2_relationships(async_session: AsyncSession, drug_id: int):
     assert len(drug.expert_opinions) == 1
     assert len(drug.ai_insights) == 1
     assert len(drug.articles) == 1
+
+
+async def test_ensure_indexes_idempotent():
+    """보조 인덱스 DDL은 기존 DB에 반복 실행해도 안전 (SQLite는 PG 전용 DDL 제외)"""
+    from sqlalchemy import text
+
+    from regscan.db.database import _ensure_indexes
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await _ensure_indexes(engine)
+    await _ensure_indexes(engine)
+
+    async with engine.connect() as conn:
+        rows = await conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'index'"))
+        names = {row[0] for row in rows}
+    await engine.dispose()
+
+    assert "idx_drugs_inn_lower" in names
+    assert "idx_briefing_generated_at" in names
+    assert {"idx_article_drug_type_date", "idx_market_drug_date", "idx_pdufa_status_date"} <= names
+    assert "idx_drugs_inn_trgm" not in names